@@ -1,7 +1,10 @@
 # Copyright © 2021 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+from unittest.mock import Mock, patch
+
 from utils import bigcommerce_api as bigcommerce
+from utils.restful.connection import RestfulRequest
 
 from test_utils.restful.common import patch_request
 from test_utils.bigcommerce_api.common import BASE_HEADERS, CREDENTIALS, STORE_HASH
@@ -87,3 +90,77 @@ def test_get_brand_all_with_pagination_and_end_of_pagination():
         brands.get_next_page()
 
     assert not mock_request.called
+
+
+def build_brand_page(number, total_pages=4):
+    return {
+        'data': [
+            dict(id=number * 2 - 1),
+            dict(id=number * 2),
+        ],
+        'meta': {
+            'pagination': {
+                "total": total_pages * 2,
+                "count": 2,
+                "per_page": 2,
+                "current_page": number,
+                "total_pages": total_pages,
+                "links": {
+                    "next": f"?limit=2&page={number + 1}",
+                    "current": f"?limit=2&page={number}"
+                } if number < total_pages else {
+                    "current": f"?limit=2&page={number}"
+                }
+            }
+        }
+    }
+
+
+def patch_brand_pages(failed_page=None):
+    def request(method, url, params=None, **kwargs):
+        number = (params or {}).get('page', 1)
+        if number == failed_page:
+            raise RestfulRequest.engine_request_error('Connection aborted')
+        return Mock(ok=Mock(return_value=True), json=Mock(return_value=build_brand_page(number)))
+    mock_request = Mock(side_effect=request)
+    return patch.object(RestfulRequest, 'carrier', Mock(request=mock_request)), mock_request
+
+
+def test_iter_brand_pages_concurrently():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    with patch_request(json=build_brand_page(1)):
+        brands = api.brands.all(limit=2)
+
+    patcher, mock_request = patch_brand_pages()
+    with patcher:
+        pages = list(brands.iter_pages(concurrent=True))
+
+    assert len(pages) == 5
+    assert all(pages[:4]) and not pages[4]
+    assert [page.data['meta']['pagination']['current_page'] for page in pages[:4]] == [1, 2, 3, 4]
+    assert mock_request.call_count == 3
+    for page in (2, 3, 4):
+        mock_request.assert_any_call(
+            'GET',
+            f'https://api.bigcommerce.com/stores/{STORE_HASH}/v3/catalog/brands',
+            timeout=(30, 60),
+            headers=BASE_HEADERS,
+            params={
+                'limit': 2,
+                'page': page,
+            }
+        )
+
+
+def test_iter_brand_pages_concurrently_stops_at_failed_page():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    with patch_request(json=build_brand_page(1)):
+        brands = api.brands.all(limit=2)
+
+    patcher, _mock_request = patch_brand_pages(failed_page=3)
+    with patcher:
+        pages = list(brands.iter_pages(concurrent=True))
+
+    assert len(pages) == 3
+    assert all(pages[:2]) and not pages[2]
+    assert not pages[2].last_response.ok()
@@ -1,7 +1,10 @@
 # Copyright © 2021 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+from unittest.mock import Mock, patch
+
 from utils import bigcommerce_api as bigcommerce
+from utils.restful.connection import RestfulRequest
 from utils.bigcommerce_api.resources.order import BigCommerceOrderModel
 
 from test_utils.common.common import not_transform_data
@@ -46,3 +49,39 @@ def test_get_order_all_with_pagination_and_pagination_called():
             'page': 2,
         }
     )
+
+
+@not_transform_data(BigCommerceOrderModel)
+def test_get_order_products_concurrently():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    orders = api.orders.create_collection_with([dict(id=seq) for seq in range(1, 21)])
+    products = [dict(id=1, sku='SKU-1')]
+
+    with patch_request(json=products) as mock_request:
+        orders = orders.get_order_products(concurrent=True)
+
+    assert mock_request.call_count == 20
+    for seq in range(1, 21):
+        mock_request.assert_any_call(
+            'GET',
+            f'https://api.bigcommerce.com/stores/{STORE_HASH}/v2/orders/{seq}/products',
+            timeout=(30, 60),
+            headers=BASE_HEADERS,
+        )
+    assert all(order['products_data'] == products[0] for order in orders.data)
+
+
+@not_transform_data(BigCommerceOrderModel)
+def test_iter_order_pages_with_prefetch():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    pages = [[dict(id=1), dict(id=2)], [dict(id=3), dict(id=4)], [dict(id=5)], []]
+    responses = [Mock(ok=Mock(return_value=True), json=Mock(return_value=page)) for page in pages]
+    mock_request = Mock(side_effect=responses)
+
+    with patch.object(RestfulRequest, 'carrier', Mock(request=mock_request)):
+        orders = api.orders.all(limit=2)
+        records = list(orders.iter_records())
+
+    assert [record['id'] for record in records] == [1, 2, 3, 4, 5]
+    assert mock_request.call_count == 4
+    assert mock_request.call_args[1]['params'] == {'limit': 2, 'page': 4}
@@ -0,0 +1,24 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from utils import bigcommerce_api as bigcommerce
+
+from test_utils.restful.common import patch_request
+from test_utils.bigcommerce_api.common import BASE_HEADERS, CREDENTIALS, STORE_HASH
+
+
+def test_remove_rules_of_variants_called():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    pricelist = api.pricelists.acknowledge(123)
+
+    with patch_request(json={}) as mock_request:
+        res = pricelist.remove_rules([456, 789])
+
+    mock_request.assert_called_once_with(
+        'DELETE',
+        f'https://api.bigcommerce.com/stores/{STORE_HASH}/v3/pricelists/123/records',
+        timeout=(30, 60),
+        headers=BASE_HEADERS,
+        params={'variant_id:in': '456,789'},
+    )
+    assert res.last_response.ok()
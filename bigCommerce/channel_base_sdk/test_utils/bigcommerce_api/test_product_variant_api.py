@@ -19,3 +19,33 @@ def test_get_variant_information_called():
         f'https://api.bigcommerce.com/stores/{STORE_HASH}/v3/catalog/products/123/variants',
         headers=BASE_HEADERS
     )
+
+
+def test_put_variants_in_batch_called():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    data = [
+        dict(id=456, inventory_level=5),
+        dict(id=789, inventory_level=0),
+    ]
+
+    with patch_request(json=dict(data=data)) as mock_request:
+        res = api.variants.put_batch(data)
+
+    mock_request.assert_called_once_with(
+        'PUT',
+        f'https://api.bigcommerce.com/stores/{STORE_HASH}/v3/catalog/variants',
+        timeout=(30, 60),
+        headers=BASE_HEADERS,
+        json=data,
+    )
+    assert res.last_response.ok()
+
+
+def test_get_errors_of_partial_variant_batch():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    errors = [dict(id=789, status=422, title='Variant not found')]
+
+    with patch_request(json=dict(data=[dict(id=456)], errors=errors)):
+        res = api.variants.put_batch([dict(id=456), dict(id=789)])
+
+    assert res.get_batch_errors() == errors
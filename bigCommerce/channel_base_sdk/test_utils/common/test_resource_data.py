@@ -103,3 +103,45 @@ def test_resource_map_path(values, path, expected):
     result = temp.map_path(path)
     assert result != expected
     assert list(result) == expected
+
+
+@pytest.mark.parametrize('values', [
+    [dict(id=2)],
+    [dict(id=2, items=[dict(id=3)]), dict(id=4), dict(id=7)],
+])
+def test_resource_iter_without_copy(values):
+    temp = composite.create_collection_with(values)
+    viewed = list(temp.iter(copy=False))
+    copied = list(temp.iter())
+    assert viewed == copied == values
+    assert all(view is data for view, data in zip(viewed, temp.resource.map(lambda x: x)))
+    assert not any(data is view for data, view in zip(copied, viewed))
+
+
+def test_resource_data_view():
+    temp = composite.create_new_with(dict(id=2, items=[dict(id=3)]))
+    assert temp.data_view == temp.data
+    assert temp.data_view is temp.data_view
+    assert temp.data is not temp.data_view
+
+
+@pytest.mark.parametrize('values', [
+    [],
+    [dict(id=2)],
+    [dict(id=2), dict(title='abc'), dict(id=7)],
+])
+def test_resource_collection_keys(values):
+    temp = composite.create_collection_with(iter(values))
+    assert list(temp.iter()) == values
+    keys = [res.resource.keys for res in temp]
+    assert keys == [{'id': value['id']} if 'id' in value else {} for value in values]
+
+
+def test_resource_concat():
+    first = composite.create_collection_with([dict(id=2), dict(id=3)])
+    second = composite.create_new_with(dict(id=4))
+    empty = composite.create_collection_with([])
+    temp = composite.concat([first, empty, second])
+    assert list(temp.iter()) == [dict(id=2), dict(id=3), dict(id=4)]
+    assert list(temp.iter()) == list((first + empty + second).iter())
+    assert [res.resource.key for res in temp] == [2, 3, 4]
@@ -2,3 +2,5 @@
 # See LICENSE file for full copyright and licensing details.
 
 from . import test_request_builder
+from . import test_rate_limit_governor
+from . import test_transport
@@ -0,0 +1,72 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from unittest.mock import Mock, patch
+
+from utils import bigcommerce_api as bigcommerce
+from utils.restful.connection import RestfulRequestTrimmingLogger
+from utils.restful.logging_options import LoggingOptions
+
+from test_utils.bigcommerce_api.common import CREDENTIALS
+
+URL = 'https://api.bigcommerce.com/stores/x/v2/store'
+
+
+def build_response(content=b'{"id": 1}', body=b'{"name": "x"}'):
+    return Mock(
+        status_code=200,
+        content=content,
+        headers={},
+        request=Mock(body=body),
+        json=Mock(return_value={'id': 1}),
+    )
+
+
+def send_with(api, response):
+    mock_engine = Mock(request=Mock(return_value=response))
+    with patch('utils.restful.connection.RestfulRequest.carrier', mock_engine):
+        api.connection.send('GET', URL)
+
+
+def test_nothing_formatted_when_info_disabled():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    response = build_response()
+    with patch.object(RestfulRequestTrimmingLogger.logger, 'isEnabledFor', return_value=False), \
+            patch.object(RestfulRequestTrimmingLogger, 'format_response') as mock_format:
+        send_with(api, response)
+    mock_format.assert_not_called()
+    response.json.assert_not_called()
+
+
+def test_structured_logging(caplog):
+    api = bigcommerce.connect_with({**CREDENTIALS, 'logging': {'mode': 'structured'}})
+    response = build_response()
+    with caplog.at_level(logging.INFO, logger=RestfulRequestTrimmingLogger.logger.name):
+        send_with(api, response)
+
+    response.json.assert_not_called()
+    summary = caplog.records[-1].restful_request
+    assert summary['method'] == 'GET'
+    assert summary['url'] == URL
+    assert summary['status'] == 200
+    assert summary['bytes_sent'] == 13
+    assert summary['bytes_received'] == 9
+    assert summary['latency_ms'] >= 0
+
+
+def test_sampled_out_requests_not_logged(caplog):
+    api = bigcommerce.connect_with({**CREDENTIALS, 'logging': {'sample_rate': 0.1}})
+    with caplog.at_level(logging.INFO, logger=RestfulRequestTrimmingLogger.logger.name), \
+            patch('utils.restful.logging_options.random.random', return_value=0.5):
+        send_with(api, build_response())
+    assert not caplog.records
+
+
+def test_large_body_not_parsed():
+    options = LoggingOptions(max_body_length=4)
+    response = build_response(content=b'{"id": 1, "name": "x"}')
+    formatted = RestfulRequestTrimmingLogger.format_response(response, options.max_body_length)
+    response.json.assert_not_called()
+    assert '{"id... (22 bytes)' in formatted
@@ -0,0 +1,58 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from unittest.mock import Mock, patch
+
+from utils import bigcommerce_api as bigcommerce
+from utils.bigcommerce_api.rate_limit import BigCommerceRateLimitGovernor
+from utils.bigcommerce_api.resources.product import BigCommerceProductModel
+from utils.restful import rate_limit_governor
+from utils.restful.connection import RestfulRequest
+
+from test_utils.common.common import not_transform_data
+from test_utils.bigcommerce_api.common import CREDENTIALS
+
+
+def make_response(status_code=200, **headers):
+    return Mock(status_code=status_code, headers=headers, json=Mock(return_value=dict(id=1)))
+
+
+def test_governor_shared_per_store():
+    assert BigCommerceRateLimitGovernor.for_key('store01') is BigCommerceRateLimitGovernor.for_key('store01')
+    assert BigCommerceRateLimitGovernor.for_key('store01') is not BigCommerceRateLimitGovernor.for_key('store02')
+    api = bigcommerce.connect_with(CREDENTIALS)
+    assert api.connection.governor is BigCommerceRateLimitGovernor.for_key(CREDENTIALS['store_hash'])
+
+
+def test_governor_paces_when_quota_runs_low():
+    governor = BigCommerceRateLimitGovernor()
+    governor.update(make_response(**{
+        'X-Rate-Limit-Requests-Left': '1',
+        'X-Rate-Limit-Requests-Quota': '10',
+        'X-Rate-Limit-Time-Window-Ms': '1000',
+        'X-Rate-Limit-Time-Reset-Ms': '800',
+    }))
+
+    with patch.object(rate_limit_governor.time, 'sleep') as mock_sleep:
+        governor.acquire()
+        mock_sleep.assert_not_called()
+        governor.acquire()
+    mock_sleep.assert_called_once()
+    assert 0 < mock_sleep.call_args[0][0] <= 0.1
+
+
+@not_transform_data(BigCommerceProductModel)
+def test_throttled_request_retried():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    throttled = make_response(429, **{'Retry-After': '1', 'X-Rate-Limit-Requests-Left': '0'})
+    succeeded = make_response(200)
+    mock_request = Mock(side_effect=[throttled, succeeded])
+
+    with patch.object(api.connection, 'governor', BigCommerceRateLimitGovernor()), \
+            patch.object(RestfulRequest, 'carrier', Mock(request=mock_request)), \
+            patch.object(rate_limit_governor.time, 'sleep') as mock_sleep:
+        res = api.products.acknowledge(1).get_by_id()
+
+    assert mock_request.call_count == 2
+    assert any(call[0][0] > 0.9 for call in mock_sleep.call_args_list)
+    assert res.last_response.status_code == 200
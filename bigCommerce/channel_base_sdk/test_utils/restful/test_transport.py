@@ -0,0 +1,36 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from utils import bigcommerce_api as bigcommerce
+from utils.restful.transport import KeepAliveHTTPAdapter
+
+from test_utils.bigcommerce_api.common import CREDENTIALS
+
+from .common import patch_request
+
+
+def test_pooled_adapter_mounted():
+    api = bigcommerce.connect_with(CREDENTIALS)
+    adapter = api.connection.session.get_adapter('https://api.bigcommerce.com/')
+    assert isinstance(adapter, KeepAliveHTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert 'POST' not in adapter.max_retries.allowed_methods
+    assert 429 not in adapter.max_retries.status_forcelist
+
+
+def test_transport_configured_from_credentials():
+    api = bigcommerce.connect_with({
+        **CREDENTIALS,
+        'transport': {'pool_maxsize': 20, 'timeout': [5, 30]},
+    })
+    adapter = api.connection.session.get_adapter('https://api.bigcommerce.com/')
+    assert adapter._pool_maxsize == 20
+
+    with patch_request(json={'id': 1}) as mock_request:
+        api.connection.send('GET', 'https://api.bigcommerce.com/stores/x/v2/store')
+    mock_request.assert_called_once_with(
+        'GET',
+        'https://api.bigcommerce.com/stores/x/v2/store',
+        headers=api.connection.headers,
+        timeout=(5, 30),
+    )
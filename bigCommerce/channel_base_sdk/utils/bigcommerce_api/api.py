@@ -5,8 +5,11 @@ from ..common.api import cache
 from ..common.exceptions import MissingRequiredKey
 from ..restful.api import RestfulAPI
 from ..restful.connection import RestfulConnection
+from ..restful.transport import TransportOptions
+from ..restful.logging_options import LoggingOptions
 
 from .registry import model_registry
+from .rate_limit import BigCommerceRateLimitGovernor
 
 
 class BigCommerceAPI(RestfulAPI):
@@ -22,6 +25,12 @@ class BigCommerceAPI(RestfulAPI):
         """
         store_hash, access_token = self.extract_credentials(credentials)
         self.connection = self.build_connection(store_hash, access_token)
+        transport = credentials.get('transport')
+        if transport:
+            self.connection.configure_transport(TransportOptions(**transport))
+        logging_options = credentials.get('logging')
+        if logging_options:
+            self.connection.configure_logging(LoggingOptions(**logging_options))
 
     @classmethod
     def extract_credentials(cls, credentials):
@@ -34,6 +43,12 @@ class BigCommerceAPI(RestfulAPI):
                     'access_token': 'f9e21a1945b8fb51bce6fa1595c06405',
                 }
 
+            An optional `transport` dictionary overrides the pooling, timeout and retry settings,
+            e.g. ``{'pool_maxsize': 20, 'timeout': (10, 60)}``
+
+            An optional `logging` dictionary changes how the requests are logged,
+            e.g. ``{'mode': 'structured', 'sample_rate': 0.1}``
+
         :exception MissingRequiredKey:
             raises if the required keys are missing. Required keys: store_hash, access_token
         """
@@ -57,6 +72,7 @@ class BigCommerceAPI(RestfulAPI):
                 'X-Auth-Token': access_token,
             },
         )
+        connection.governor = BigCommerceRateLimitGovernor.for_key(store_hash)
         return connection
 
 
@@ -0,0 +1,14 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+from ..restful.rate_limit_governor import RateLimitGovernor
+
+
+class BigCommerceRateLimitGovernor(RateLimitGovernor):
+    """
+    Pace requests with the quota BigCommerce reports for each store
+    """
+    requests_left_header = 'X-Rate-Limit-Requests-Left'
+    requests_quota_header = 'X-Rate-Limit-Requests-Quota'
+    time_window_header = 'X-Rate-Limit-Time-Window-Ms'
+    time_reset_header = 'X-Rate-Limit-Time-Reset-Ms'
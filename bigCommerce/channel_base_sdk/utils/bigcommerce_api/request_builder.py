@@ -3,9 +3,12 @@
 
 import urllib.parse
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ..common import PropagatedParam
 from ..common.resource import delegated
 
+from ..restful.fan_out import FanOut
 from ..restful.request_builder import make_request_builder, RequestBuilder,\
     RestfulRequestBulkBuilder
 
@@ -21,6 +24,92 @@ class BigCommercePaginated(RestfulRequestBulkBuilder):
             return prop.self.get_next_page_v2(**kwargs)
         return prop.self.get_next_page_v3(**kwargs)
 
+    @delegated
+    def iter_pages(self, prop: PropagatedParam = None, prefetch=True, concurrent=False, prepare=None, **kwargs):
+        """
+        Yield this page and all the next pages
+        The next page is fetched in the background while the caller processes the current one.
+        Like `get_next_page` loops, the last yielded page is the falsy one which ended the iteration:
+        the empty page after the last one, or the page which failed. No page is yielded after it.
+        :param prefetch: Fetch the next page while the current one is being processed
+        :param concurrent: Fetch the remaining pages in parallel if the total number of pages is known (v3 only)
+        :param prepare: Optional function applied on each fetched page before it is yielded, e.g. loading sub-resources
+        :param kwargs: Optional search criteria for the next pages
+        """
+        prepare = prepare or (lambda page: page)
+        first = prop.self
+        if concurrent and self.has_known_pages(prop.last_response):
+            yield from self._iter_pages_concurrently(first, prepare, **kwargs)
+        elif prefetch:
+            yield from self._iter_pages_with_prefetch(first, prepare, **kwargs)
+        else:
+            page = first
+            yield prepare(page)
+            while page:
+                page = page.get_next_page(**kwargs)
+                yield prepare(page)
+
+    @delegated
+    def iter_records(self, prop: PropagatedParam = None, **kwargs):
+        """
+        Yield the data of every resource on this page and all the next pages
+        :param kwargs: Options passed to `iter_pages`
+        """
+        for page in prop.self.iter_pages(**kwargs):
+            if page:
+                data = page.data
+                yield from (data if isinstance(data, list) else [data])
+
+    @classmethod
+    def _iter_pages_with_prefetch(cls, first, prepare, **kwargs):
+        def fetch_next(page):
+            next_page = page.get_next_page(**kwargs)
+            return next_page, prepare(next_page)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page, prepared = first, prepare(first)
+            while page:
+                future = executor.submit(fetch_next, page)
+                yield prepared
+                page, prepared = future.result()
+            yield prepared
+
+    def _iter_pages_concurrently(self, first, prepare, **kwargs):
+        pagination = self.get_pagination(first.last_response)
+
+        def fetch_page(number):
+            page = first.get_page(page=number, **kwargs)
+            return page, prepare(page)
+
+        yield prepare(first)
+        page = first
+        pages = range(pagination['current_page'] + 1, pagination['total_pages'] + 1)
+        for page, prepared in FanOut.with_connection(first.connection).imap(fetch_page, pages):
+            yield prepared
+            if not page:
+                return
+        yield prepare(page.get_next_page(**kwargs))
+
+    @delegated
+    @make_request_builder(
+        method='GET',
+        uri='',
+        no_body=True,
+    )
+    def get_page(self, prop: PropagatedParam = None, request_builder: RequestBuilder = None, page=1, **kwargs):
+        """
+        Get resources on a specific page of the same listing as the last response
+        """
+        last_request = prop.last_response.request if prop.last_response else None
+        if last_request:
+            return self.build_json_send_handle_json(
+                request_builder,
+                prop=prop,
+                url=last_request.url,
+                params={**last_request.params, **kwargs, 'page': page},
+            )
+        return self.pass_result_to_handler(nil=True)
+
     @delegated
     @make_request_builder(
         method='GET',
@@ -76,8 +165,7 @@ class BigCommercePaginated(RestfulRequestBulkBuilder):
     @classmethod
     def _try_get_next_page_params(cls, last_response):
         last_request = last_response.request
-        res_json = last_response.response.response.json()
-        pagination = res_json['meta']['pagination']
+        pagination = cls.get_pagination(last_response)
         if cls.has_next_page_v3(pagination):
             try:
                 return cls.extract_params(pagination['links']['next'])
@@ -85,6 +173,22 @@ class BigCommercePaginated(RestfulRequestBulkBuilder):
                 return cls.build_next_page_params(last_request, pagination)
         return None
 
+    @classmethod
+    def get_pagination(cls, last_response):
+        """
+        Read the v3 pagination metadata, the parsed body is cached by the response
+        """
+        return last_response.response.json()['meta']['pagination']
+
+    def has_known_pages(self, last_response):
+        if 'v2' in self.version or not last_response or not last_response.request:
+            return False
+        try:
+            pagination = self.get_pagination(last_response)
+            return pagination['current_page'] < pagination['total_pages']
+        except (KeyError, TypeError, ValueError):
+            return False
+
     @classmethod
     def has_next_page_v3(cls, pagination):
         return pagination['current_page'] < pagination['total_pages']
@@ -4,7 +4,7 @@
 from .currency import BigCommerceCurrencyModel
 from .customer import BigCommerceCustomerModel
 from .product import BigCommerceProductModel
-from .variant import BigCommerceProductVariantModel
+from .variant import BigCommerceProductVariantModel, BigCommerceVariantModel
 from .variant_option import BigCommerceVariantOptionModel
 from .variant_option_value import BigCommerceVariantOptionValueModel
 from .product_image import BigCommerceProductImageModel
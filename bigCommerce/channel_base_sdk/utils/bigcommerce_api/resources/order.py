@@ -2,6 +2,7 @@
 # See LICENSE file for full copyright and licensing details.
 
 from ...restful import request_builder
+from ...restful.fan_out import FanOut
 
 from .. import resource
 from ..registry import register_model
@@ -121,17 +122,13 @@ class BigCommerceOrderModel(
     transform_in_data = DataInTrans()
             
     @delegated
-    def get_order_products(self, prop: PropagatedParam = None):
+    def get_order_products(self, prop: PropagatedParam = None, concurrent=False):
         """
         Get Order Products
+        :param concurrent: Load products of the orders with a bounded pool of workers
         """
         orders = prop.resource
-        for order in filter(lambda o: o.data, orders):
-            order_products = self.env['order_products'].acknowledge(None, order_id=order.data['id'])
-            try:
-                order.data.update({'products_data': order_products.all().data})
-            except EmptyDataError:
-                continue
+        self._load_sub_resources(orders, 'order_products', 'products_data', prop.connection, concurrent)
         return self.pass_result_to_handler(resource=orders)
     
     @delegated
@@ -150,18 +147,30 @@ class BigCommerceOrderModel(
         return self.pass_result_to_handler(resource=orders)
     
     @delegated
-    def get_order_shipping_address(self, prop: PropagatedParam = None):
+    def get_order_shipping_address(self, prop: PropagatedParam = None, concurrent=False):
         """
         Get Order Shipping Addresses
+        :param concurrent: Load shipping addresses of the orders with a bounded pool of workers
         """
         orders = prop.resource
-        for order in filter(lambda o: o.data, orders):
-            order_shipping_addresses = self.env['order_shipping_addresses'].acknowledge(None, order_id=order.data['id'])
+        self._load_sub_resources(orders, 'order_shipping_addresses', 'shipping_addresses_data', prop.connection,
+                                 concurrent)
+        return self.pass_result_to_handler(resource=orders)
+
+    def _load_sub_resources(self, orders, model_name, field_name, connection, concurrent):
+        """
+        Fetch all sub-resources of each order and put them into the order data under the field name
+        Requests are prepared in the current thread, only sending is fanned out to the workers
+        """
+        orders = list(filter(lambda o: o.data, orders))
+        sub_resources = [self.env[model_name].acknowledge(None, order_id=order.data['id']) for order in orders]
+        fan_out = FanOut.with_connection(connection) if concurrent else FanOut()
+        results = fan_out.map(lambda sub_resource: sub_resource.all(), sub_resources)
+        for order, result in zip(orders, results):
             try:
-                order.data.update({'shipping_addresses_data': order_shipping_addresses.all().data})
+                order.data.update({field_name: result.data})
             except EmptyDataError:
                 continue
-        return self.pass_result_to_handler(resource=orders)
 
     @delegated
     def create_shipment(self, shipment_data, prop: PropagatedParam = None):
@@ -39,6 +39,12 @@ class BigCommercePricelistModel(
         acknowledged = self.env['pricelist_records'].acknowledge(None, pricelist_id=pricelist.key)
         return acknowledged.delete_all()
 
+    @request_builder.delegated
+    def remove_rules(self, variant_ids, prop=None):
+        pricelist = prop.self
+        acknowledged = self.env['pricelist_records'].acknowledge(None, pricelist_id=pricelist.key)
+        return acknowledged.delete_all(**{'variant_id:in': ','.join(map(str, variant_ids))})
+
     @request_builder.delegated
     def upsert_records(self, record_data, prop=None):
         pricelist = prop.self
@@ -1,9 +1,12 @@
 # Copyright © 2021 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+from ...common import PropagatedParam, resource_formatter as common_formatter
+from ...common.resource import delegated
 from ...restful import request_builder
 
 from .. import resource
+from .. import resource_formatter as bigcommerce_formatter
 from ..registry import register_model
 from ..request_builder import BigCommercePaginated
 
@@ -25,3 +28,52 @@ class BigCommerceProductVariantModel(
     path = 'variants'
     primary_key = 'id'
     secondary_keys = ('product_id',)
+
+
+class DataInTrans(bigcommerce_formatter.DataInTransV3):
+    """
+    Specific data transformer for BigCommerce variants of all products from channel to app
+    """
+    transform_singular = common_formatter.NoneTrans()
+
+
+@register_model('variants')
+class BigCommerceVariantModel(
+    resource.BigCommerceResourceModelV3,
+    request_builder.RestfulPut,
+    request_builder.RestfulList,
+    BigCommercePaginated,
+):
+    """
+    An interface of BigCommerce variants across all products
+    """
+    prefix = 'catalog/'
+    path = 'variants'
+    primary_key = 'id'
+
+    transform_in_data = DataInTrans()
+
+    @delegated
+    def put_batch(self, data, prop: PropagatedParam = None):
+        """
+        Update up to 50 variants of any products in one request
+        Each item must contain the id of the variant
+        """
+        variants = prop.self.create_new_with(data)
+        return variants.put_data()
+
+    @delegated
+    def get_batch_errors(self, prop: PropagatedParam = None):
+        """
+        Get the errors of the variants rejected by the last batch request
+        BigCommerce answers a partially successful batch with 207 and lists the failed items
+        :param prop: The data propagated from the handler
+        """
+        last_response = prop['last_response']
+        try:
+            body = last_response.response.json()
+        except (AttributeError, ValueError):
+            return []
+        if isinstance(body, dict):
+            return body.get('errors') or []
+        return []
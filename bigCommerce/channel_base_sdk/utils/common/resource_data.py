@@ -615,6 +615,14 @@ class ResourceCompositeData(BaseResourceComposite):
         """
         return copy.deepcopy(self._data.data)
 
+    @property
+    def data_view(self) -> Union[list, dict]:
+        """
+        Return the data this resource holds without copying it
+        The result must not be modified, use `data` to get a copy which can be
+        """
+        return self._data.data
+
     @data.setter
     def data(self, value):
         """
@@ -645,8 +653,16 @@ class ResourceCompositeData(BaseResourceComposite):
     def create_collection_with(self, values):
         """
         Clone and assign all values into a new collection
+        The collection is built in one pass, keys of each item are acknowledged once
+        """
+        return self.clone_with(ResourceData.from_data(list(values)))
+
+    def concat(self, composites: Iterable['ResourceCompositeData']):
         """
-        return sum((self.create_new_with(value) for value in values), self.clone_nil())
+        Clone a collection holding the resources of all composites
+        Unlike adding them one by one, resources are only collected once
+        """
+        return self.clone_with(ResourceCollection.build_from(*(composite._data for composite in composites)))
 
     def create_new_with(self, value):
         """
@@ -705,6 +721,18 @@ class ResourceCompositeData(BaseResourceComposite):
         """
         Clone an composite with the provided data
         """
+        res = self._clone_acknowledged_with(data, model)
+        if isinstance(res._data, ResourceSingular):
+            self._acknowledge_keys(res._data, res._model)
+        if isinstance(res._data, ResourceCollection):
+            for singular in res._data:
+                self._acknowledge_keys(singular, res._model)
+        return res
+
+    def _clone_acknowledged_with(self, data: ResourceData, model: ResourceModel = None):
+        """
+        Clone an composite with data whose keys are already acknowledged for the model
+        """
         res = self.__class__()
         res.connection = self.connection
         if model is not None:
@@ -712,11 +740,6 @@ class ResourceCompositeData(BaseResourceComposite):
         else:
             res._model = self._model
         res._data = data
-        if isinstance(res._data, ResourceSingular):
-            self._acknowledge_keys(res._data, res._model)
-        if isinstance(res._data, ResourceCollection):
-            for singular in res._data:
-                self._acknowledge_keys(singular, res._model)
         res._registry = self._registry
         return res
 
@@ -730,7 +753,7 @@ class ResourceCompositeData(BaseResourceComposite):
         key_names = (primary_key,) + secondary_keys
         for key_name in key_names:
             data.acknowledge_key(key_name)
-            data.self_acknowledge()
+        data.self_acknowledge()
 
     def _attach_model_environment(self):
         """
@@ -788,15 +811,23 @@ class ResourceCompositeIterable(ResourceCompositeData):
         yield from map(self.clone_iter_with, self._data)
 
     def clone_iter_with(self, data: ResourceData, model: ResourceModel = None):
-        res = self.clone_with(data, model)
+        if model is None:
+            # Items of this composite already acknowledged the keys of its model
+            res = self._clone_acknowledged_with(data)
+        else:
+            res = self.clone_with(data, model)
         res.last_response = self.last_response
         return res
 
-    def iter(self):
+    def iter(self, copy=True):
         """
         Iterate from the resources, return data each iteration
+        With `copy=False`, the data is not copied and must not be modified
         """
-        yield from map(lambda res: res.data, self)
+        if copy:
+            yield from map(lambda res: res.data, self)
+        else:
+            yield from map(lambda res: res.data, self._data)
 
     def filter(self, pre: Callable) -> Iterable['ResourceCompositeIterable']:
         """
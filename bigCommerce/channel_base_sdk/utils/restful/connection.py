@@ -3,6 +3,7 @@
 
 import json
 import re
+import time
 import requests
 import logging
 import contextlib
@@ -14,6 +15,8 @@ from dataclasses import dataclass
 from ..common.connection import Connection, Request, Response
 from ..common.resource_formatter import DataTrans
 from ..common.exceptions import NotParseableException
+from .transport import TransportOptions
+from .logging_options import LazyFormat, LoggingOptions
 
 
 _logger = logging.getLogger(__name__)
@@ -22,7 +25,7 @@ _logger = logging.getLogger(__name__)
 class LoggerWrapper:
     def __init__(self, request, logger_cls):
         self.request = request
-        self.logger = logger_cls()
+        self.logger = logger_cls(request.logging_options)
 
     @classmethod
     @contextlib.contextmanager
@@ -49,30 +52,78 @@ class RestfulRequestLogger:
 
     logger = _logger
 
+    def __init__(self, options: LoggingOptions = None):
+        self.options = options or LoggingOptions()
+        self.enabled = self.options.should_log(self.logger)
+        self.started_at = None
+
     def log_start(self, request: 'RestfulRequest', **kwargs):
-        self.logger.info('Sending method %s to %s with %s', request.method, request.url, kwargs)
+        self.started_at = time.monotonic()
+        if self.enabled and self.options.mode == 'full':
+            self.logger.log(self.options.level, 'Sending method %s to %s with %s', request.method, request.url, kwargs)
 
     def log_end(self, request: 'RestfulRequest', response):
-        formatted = self.format_response(response)
-        self.logger.info('Received from %s: %s', request.url, formatted)
+        if not self.enabled:
+            return
+        if self.options.mode == 'structured':
+            self.log_summary(request, response)
+        else:
+            formatted = LazyFormat(self.format_response, response, self.options.max_body_length)
+            self.logger.log(self.options.level, 'Received from %s: %s', request.url, formatted)
+
+    def log_summary(self, request: 'RestfulRequest', response):
+        """
+        Log the request in one line without reading the body, the values are also attached to the record
+        """
+        summary = dict(
+            method=request.method,
+            url=request.url,
+            status=response.status_code,
+            latency_ms=round((time.monotonic() - self.started_at) * 1000, 1),
+            bytes_sent=self._count_bytes(getattr(response.request, 'body', None)),
+            bytes_received=self._count_bytes(response.content),
+        )
+        self.logger.log(
+            self.options.level,
+            'Sent %(method)s %(url)s: status %(status)s in %(latency_ms)s ms, '
+            '%(bytes_sent)s bytes sent, %(bytes_received)s bytes received',
+            summary,
+            extra={'restful_request': summary},
+        )
 
     def log_error(self, request: 'RestfulRequest', ex):
         self.logger.error('Error while sending to %s: %s', request.url, str(ex))
 
+    @staticmethod
+    def _count_bytes(content) -> int:
+        return len(content) if isinstance(content, (bytes, str)) else 0
+
     @classmethod
-    def format_response(cls, response):
+    def format_response(cls, response, max_body_length=None):
         code = cls.format_response_code(response)
         headers = cls.format_response_headers(response)
-        body = cls.format_response_body(response)
+        body = cls.format_response_body(response, max_body_length)
         return str(dict(code=code, headers=headers, body=body))
 
     @classmethod
-    def format_response_body(cls, response) -> str:
+    def format_response_body(cls, response, max_body_length=None) -> str:
+        if max_body_length and cls._count_bytes(response.content) > max_body_length:
+            return cls.format_response_head(response, max_body_length)
         try:
             return cls.format_response_json(response)
         except ValueError:
             return cls.format_response_content(response)
 
+    @classmethod
+    def format_response_head(cls, response, max_body_length) -> str:
+        """
+        Only keep the beginning of a large body, it is not parsed
+        """
+        head = response.content[:max_body_length]
+        if isinstance(head, bytes):
+            head = head.decode(errors='replace')
+        return f'{head}... ({len(response.content)} bytes)'
+
     @classmethod
     def format_response_content(cls, response) -> str:
         return response.content or cls.EMPTY
@@ -153,10 +204,14 @@ class RestfulRequest(Request):
     """
     logger = RestfulRequestTrimmingLogger
     logger_wrapper = LoggerWrapper
+    logging_options = None
     engine = requests
     engine_request_error = requests.exceptions.RequestException
     engine_response_error = requests.HTTPError
     session = None
+    governor = None
+    timeout = None
+    default_timeout = (30, 60)
 
     url: str
     headers: dict
@@ -170,15 +225,31 @@ class RestfulRequest(Request):
         Send the request and receive the restful response
         """
         options = self.prepare_sending_options()
+        if self.governor:
+            return self._send_with_governor(**options)
         result = self._send(**options)
         return result
 
+    def _send_with_governor(self, **kwargs):
+        """
+        Pace the request with the rate limit governor and retry if the channel throttles it
+        """
+        attempt = 0
+        while True:
+            self.governor.acquire()
+            result = self._send(**kwargs)
+            self.governor.update(result)
+            if not self.governor.should_retry(result, attempt):
+                return result
+            self.governor.wait_before_retry(attempt)
+            attempt += 1
+
     def prepare_sending_options(self):
         def update_kw_if_not_empty(key, value):
             if value:
                 options[key] = value
 
-        options = dict(timeout=(30, 60))
+        options = dict(timeout=self.timeout or self.default_timeout)
         for option_key in ('headers', 'params', 'data', 'json'):
             if hasattr(self, option_key):
                 update_kw_if_not_empty(option_key, getattr(self, option_key))
@@ -233,6 +304,7 @@ class RestfulResponse(Response):
     """
     response: requests.Response
     request: RestfulRequest
+    _parsed_json = None
 
     def __getattr__(self, name):
         """
@@ -267,8 +339,13 @@ class RestfulResponse(Response):
         """
         Extract data from response and parse it to the JSON-like format
         This may raise Exception if the response is not in expected format
+        The parsed body is kept, so reading the pagination later does not parse it again
         """
-        return self.response.json(**kwargs)
+        if kwargs:
+            return self.response.json(**kwargs)
+        if self._parsed_json is None:
+            self._parsed_json = self.response.json()
+        return self._parsed_json
 
     @property
     def error_message(self):
@@ -412,6 +489,10 @@ class RestfulConnection(Connection):
     """
     _request_cls = RestfulRequest
     session = None
+    governor = None
+    max_workers = 8
+    transport = TransportOptions()
+    logging_options = LoggingOptions()
 
     scheme: str
     hostname: str
@@ -420,6 +501,44 @@ class RestfulConnection(Connection):
 
     def __post_init__(self):
         self.session = self.get_new_engine_session()
+        self.transport.mount_on(self.session)
+
+    def configure_transport(self, transport: TransportOptions):
+        """
+        Apply new pooling, timeout and retry settings to the session of this connection
+        """
+        self.transport = transport
+        transport.mount_on(self.session)
+
+    def configure_logging(self, options: LoggingOptions):
+        """
+        Change how the requests of this connection are logged
+        """
+        self.logging_options = options
+
+    def prepare_request(self, request: RestfulRequest):
+        """
+        Make the request go through the pooled session, the governor, the timeouts and the logging of this connection
+        """
+        request.session = self.session
+        request.governor = self.governor
+        request.timeout = self.transport.timeout
+        request.logging_options = self.logging_options
+        return request
+
+    def send(self, method, url, headers=None, params=None, data=None, json=None) -> RestfulResponse:
+        """
+        Send a request to an arbitrary URL of the channel through this connection
+        """
+        request = self._request_cls(
+            url=url,
+            headers=headers or self.headers,
+            method=method,
+            params=params,
+            data=data,
+            json=json,
+        )
+        return self.prepare_request(request).send()
 
     @property
     def prefix_url(self) -> str:
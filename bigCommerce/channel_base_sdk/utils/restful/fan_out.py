@@ -0,0 +1,57 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import collections
+
+from typing import Callable, Iterable, Iterator, List
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FanOut:
+    """
+    Apply the same loader on many items with a bounded pool of workers
+    Requests sent by the workers share the session of the connection
+    """
+    max_workers: int
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max(max_workers or 1, 1)
+
+    @classmethod
+    def with_connection(cls, connection) -> 'FanOut':
+        """
+        Build a fan-out bounded by the number of workers allowed on the connection
+        """
+        return cls(getattr(connection, 'max_workers', 1))
+
+    def map(self, func: Callable, items: Iterable) -> List:
+        """
+        Apply the function on each item and return the results in the same order as the items
+        Run sequentially when there is only one worker or one item
+        """
+        items = list(items)
+        workers = min(self.max_workers, len(items))
+        if workers <= 1:
+            return list(map(func, items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def imap(self, func: Callable, items: Iterable) -> Iterator:
+        """
+        Lazy version of `map`, at most `max_workers` items are being processed ahead of the consumer
+        """
+        if self.max_workers <= 1:
+            yield from map(func, items)
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = collections.deque()
+            try:
+                for item in items:
+                    pending.append(executor.submit(func, item))
+                    if len(pending) >= self.max_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,53 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import logging
+import random
+
+from dataclasses import dataclass
+
+
+LOGGING_MODES = ('full', 'structured', 'off')
+
+
+@dataclass
+class LoggingOptions:
+    """
+    How the requests sent through a connection are logged
+    - full: the sending options and the trimmed response
+    - structured: method, URL, status, latency and byte counts, the body is not read
+    - off: errors only
+    Only `sample_rate` of the requests are logged, errors are always logged
+    """
+    mode: str = 'full'
+    sample_rate: float = 1.0
+    max_body_length: int = 2**14
+    level: int = logging.INFO
+
+    def __post_init__(self):
+        if self.mode not in LOGGING_MODES:
+            raise ValueError(f'Logging mode must be one of {LOGGING_MODES}, got {self.mode!r}')
+        if isinstance(self.level, str):
+            self.level = logging.getLevelName(self.level.upper())
+
+    def should_log(self, logger: logging.Logger) -> bool:
+        """
+        Whether a request should be logged, decided once before sending it
+        """
+        if self.mode == 'off' or not logger.isEnabledFor(self.level):
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+
+class LazyFormat:
+    """
+    Log argument which is only formatted when the log record is emitted
+    """
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
@@ -0,0 +1,142 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import time
+import random
+import logging
+import threading
+
+from typing import Optional
+
+
+_logger = logging.getLogger(__name__)
+
+
+class RateLimitGovernor:
+    """
+    Token bucket which paces all requests sent to the same channel account.
+    The bucket is kept in sync with the quota the channel reports in the response headers,
+    so requests are slowed down before the quota runs out instead of after being rejected.
+    Throttled requests are retried with jittered backoff.
+    """
+    requests_left_header: Optional[str] = None
+    requests_quota_header: Optional[str] = None
+    time_window_header: Optional[str] = None
+    time_reset_header: Optional[str] = None
+    retry_after_header = 'Retry-After'
+
+    throttled_status_code = 429
+    max_retries = 5
+    backoff_base = 0.5
+    backoff_cap = 30.0
+
+    _instances: dict = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = None
+        self._capacity = None
+        self._refill_rate = None
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    @classmethod
+    def for_key(cls, key) -> 'RateLimitGovernor':
+        """
+        Get the governor shared by all connections to the same account in this process
+        """
+        with cls._instances_lock:
+            return cls._instances.setdefault((cls, key), cls())
+
+    def acquire(self):
+        """
+        Take one token from the bucket, wait until the token is available if needed
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._blocked_until - now, 0.0)
+            if self._refill_rate:
+                self._refill(now)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._refill_rate)
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, response):
+        """
+        Synchronize the bucket with the rate limit status reported in the response
+        """
+        headers = self._get_headers(response)
+        if not headers:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._update_bucket(headers, now)
+            if self.is_throttled(response):
+                self._blocked_until = max(self._blocked_until, now + self._get_retry_after(headers))
+
+    def is_throttled(self, response) -> bool:
+        return getattr(response, 'status_code', None) == self.throttled_status_code
+
+    def should_retry(self, response, attempt) -> bool:
+        return self.is_throttled(response) and attempt < self.max_retries
+
+    def wait_before_retry(self, attempt):
+        """
+        Suspend with exponential backoff and full jitter to spread out concurrent retries
+        The bucket itself keeps the process waiting until the reported reset time on the next acquire
+        """
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        _logger.info('Request throttled, retrying in %.2f seconds (attempt %s)', delay, attempt + 1)
+        time.sleep(delay)
+
+    def _refill(self, now):
+        elapsed = now - self._refilled_at
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_rate)
+        self._refilled_at = now
+
+    def _update_bucket(self, headers, now):
+        requests_left = self._get_number(headers, self.requests_left_header)
+        if requests_left is None:
+            return
+        quota = self._get_number(headers, self.requests_quota_header)
+        window_ms = self._get_number(headers, self.time_window_header) \
+            or self._get_number(headers, self.time_reset_header)
+        self._capacity = max(quota or requests_left, requests_left, self._capacity or 0)
+        if window_ms:
+            self._refill_rate = self._capacity / (window_ms / 10**3)
+        if self._refill_rate:
+            if self._tokens is None:
+                self._tokens = requests_left
+            else:
+                self._refill(now)
+                # Other processes consume the same quota, so the channel count wins when it is lower
+                self._tokens = min(self._tokens, requests_left)
+            self._refilled_at = now
+
+    def _get_retry_after(self, headers) -> float:
+        retry_after = self._get_number(headers, self.retry_after_header)
+        if retry_after is not None:
+            return retry_after
+        reset_ms = self._get_number(headers, self.time_reset_header)
+        if reset_ms is not None:
+            return reset_ms / 10**3
+        return 0.0
+
+    @classmethod
+    def _get_headers(cls, response):
+        try:
+            return response.headers
+        except AttributeError:
+            return None
+
+    @classmethod
+    def _get_number(cls, headers, name) -> Optional[float]:
+        if not name:
+            return None
+        try:
+            return float(headers.get(name))
+        except (TypeError, ValueError, AttributeError):
+            return None
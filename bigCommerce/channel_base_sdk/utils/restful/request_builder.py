@@ -1,6 +1,8 @@
 # Copyright © 2021 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+import copy
+
 from typing import Type
 
 from ..common import PropagatedParam
@@ -69,7 +71,7 @@ class RequestBuilder:
             json=self.json,
         )
         try:
-            wrapped_request.session = self.conn.session
+            self.conn.prepare_request(wrapped_request)
         except AttributeError:
             pass
         return wrapped_request
@@ -130,44 +132,36 @@ class RequestPasser:
         '_func',
         '_request_builder',
         '_set_to',
-        '_wrapper',
-        '_owner',
-        '_instance',
     )
 
     def __init__(self, func, request_builder, set_to):
         """
         Initiate passer
         """
-        def wrapper(*args, **kwargs):
-            """
-            `wrapper` wraps `call`, `call` wraps func
-            """
-            return self(*args, **kwargs)
-
         self._func = func
         self._request_builder = request_builder
         self._set_to = set_to
-        self._wrapper = wrapper
 
-    def __call__(self, *args, **kwargs):
+    def __call__(self, instance, owner, *args, **kwargs):
         if self.is_applicable(kwargs):
-            return self.build_and_pass_request_builder(*args, **kwargs)
-        return self.call_method(*args, **kwargs)
+            return self.build_and_pass_request_builder(instance, owner, *args, **kwargs)
+        return self.call_method(instance, *args, **kwargs)
 
     def is_applicable(self, call_kwargs):
         return self._set_to not in call_kwargs
 
-    def build_and_pass_request_builder(self, *args, **kwargs):
-        request_builder = self.make_request_builder()
-        return self.call_method(*args, **{self._set_to: request_builder}, **kwargs)
+    def build_and_pass_request_builder(self, instance, owner, *args, **kwargs):
+        request_builder = self.make_request_builder(owner)
+        return self.call_method(instance, *args, **{self._set_to: request_builder}, **kwargs)
 
-    def call_method(self, *args, **kwargs):
-        return self._func(self._instance, *args, **kwargs)
+    def call_method(self, instance, *args, **kwargs):
+        return self._func(instance, *args, **kwargs)
 
-    def make_request_builder(self):
-        builder = self._request_builder
-        model = self._owner
+    def make_request_builder(self, model):
+        """
+        Each call gets its own copy of the builder, so concurrent calls never share one
+        """
+        builder = copy.copy(self._request_builder)
         builder.model = model
         builder.transform_in_data = getattr(model, 'transform_in_data')
         builder.transform_out_data = getattr(model, 'transform_out_data')
@@ -176,19 +170,26 @@ class RequestPasser:
         return builder
 
     def __get__(self, instance, owner):
-        self._owner = owner
-        self._instance = instance
-        return self._wrapper
+        """
+        Bind a new wrapper to the instance on every access
+        """
+        def wrapper(*args, **kwargs):
+            """
+            `wrapper` wraps `call`, `call` wraps func
+            """
+            return self(instance, owner, *args, **kwargs)
+
+        wrapper.__dict__.update(self._func.__dict__)
+        return wrapper
 
     def __setattr__(self, key, value):
         """
-        Set non-private attributes to the wrapped function and the internal wrapper
+        Set non-private attributes to the wrapped function
         """
         try:
             super().__setattr__(key, value)
         except AttributeError:
             setattr(self._func, key, value)
-            setattr(self._wrapper, key, value)
 
 
 def make_request_builder(set_to='request_builder', **kwargs):
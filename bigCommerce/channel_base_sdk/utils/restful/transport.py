@@ -0,0 +1,96 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import socket
+
+from typing import FrozenSet, Optional, Tuple
+from dataclasses import dataclass, field
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+IDEMPOTENT_METHODS = frozenset({'HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'})
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter which turns on TCP keep-alive on the pooled sockets,
+    so idle connections to the channel are not silently dropped between jobs
+    """
+
+    def __init__(self, socket_options=None, **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+@dataclass
+class TransportOptions:
+    """
+    Pooling, timeout and retry settings of the session used by a connection
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    timeout: Tuple[float, float] = (30, 60)
+    total_retries: int = 3
+    backoff_factor: float = 0.3
+    retry_status_codes: Tuple[int, ...] = (502, 503, 504)
+    retry_methods: FrozenSet[str] = field(default=IDEMPOTENT_METHODS)
+    tcp_keepalive: bool = True
+    tcp_keepalive_idle: Optional[int] = 60
+    tcp_keepalive_interval: Optional[int] = 15
+
+    def __post_init__(self):
+        if isinstance(self.timeout, list):
+            self.timeout = tuple(self.timeout)
+        self.retry_methods = frozenset(self.retry_methods)
+
+    def mount_on(self, session):
+        """
+        Replace the default adapters of the session with the pooled ones
+        """
+        adapter = self.build_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def build_adapter(self) -> HTTPAdapter:
+        return KeepAliveHTTPAdapter(
+            socket_options=self.build_socket_options(),
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self.build_retry(),
+        )
+
+    def build_retry(self) -> Retry:
+        """
+        Retry connection errors and gateway errors of idempotent requests only
+        Throttled responses (429) are left to the rate limit governor
+        """
+        return Retry(
+            total=self.total_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            allowed_methods=self.retry_methods,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+
+    def build_socket_options(self):
+        if not self.tcp_keepalive:
+            return None
+        from urllib3.connection import HTTPConnection
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if self.tcp_keepalive_idle and hasattr(socket, 'TCP_KEEPIDLE'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle))
+        if self.tcp_keepalive_interval and hasattr(socket, 'TCP_KEEPINTVL'):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.tcp_keepalive_interval))
+        return options
@@ -26,7 +26,7 @@ class MainController(http.Controller):
     def _bigcommerce_get_store_info(self, bc_store_hash, headers):
         end_point = 'https://api.bigcommerce.com/stores/%s/v2/store' % bc_store_hash
 
-        response = requests.get(url=end_point, headers=headers)
+        response = request.env['ecommerce.channel'].sudo().bigcommerce_send_request('GET', end_point, bc_store_hash, headers)
         weight_unit = 'oz'
         dimension_unit = 'in'
         if response.status_code == 200:
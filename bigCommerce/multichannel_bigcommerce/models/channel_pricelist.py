@@ -28,6 +28,8 @@ class ChannelPricelist(models.Model):
 
     is_published = fields.Boolean(string='Published on Storefront', default=False)
     is_sync_in_progress = fields.Boolean(default=False)
+    exported_rule_fingerprints = fields.Text(copy=False,
+                                             help='Fingerprints of the rules as last exported to the online store')
 
     def name_get(self):
         res = [
@@ -59,23 +61,27 @@ class ChannelPricelist(models.Model):
         res = helper.do_map()
         return res
 
-    def export_to_channel(self):
+    def export_to_channel(self, full_rebuild=False):
+        """
+        Export the pricelist to channel
+        :param full_rebuild: Replace all rules on channel instead of sending only the changed ones
+        """
         self.ensure_one()
         platform = self.channel_id.platform
         delayed_method = '%s_delayed_export_to_channel' % platform
         if hasattr(self, delayed_method) and not self.env.context.get('no_delay'):
-            return getattr(self, delayed_method)()
+            return getattr(self, delayed_method)(full_rebuild=full_rebuild)
         method = '%s_export_to_channel' % platform
-        return getattr(self, method)()
+        return getattr(self, method)(full_rebuild=full_rebuild)
 
-    def bigcommerce_delayed_export_to_channel(self):
+    def bigcommerce_delayed_export_to_channel(self, full_rebuild=False):
         self.ensure_one()
         self.with_context(for_synching=True).update({'is_sync_in_progress': True})
-        return self.with_delay().bigcommerce_export_to_channel()
+        return self.with_delay().bigcommerce_export_to_channel(full_rebuild=full_rebuild)
 
-    def bigcommerce_export_to_channel(self):
+    def bigcommerce_export_to_channel(self, full_rebuild=False):
         self.ensure_one()
-        pl_helper.PricelistExportWorkflow.do_export(self)
+        pl_helper.PricelistExportWorkflow.do_export(self, full_rebuild=full_rebuild)
 
     def _log_exceptions(self, title, exceptions):
         """
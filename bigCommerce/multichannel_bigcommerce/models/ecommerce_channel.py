@@ -2,13 +2,14 @@
 # See LICENSE file for full copyright and licensing details.
 
 import logging
-import requests
 from itertools import groupby
 from time import sleep
-from operator import attrgetter, itemgetter
+from operator import itemgetter
 
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
+from odoo.tools import split_every
+from odoo.addons.queue_job.job import DelayableBatch
 
 from ..utils.bigcommerce_api_helper import BigCommerceHelper
 from ..utils.bigcommerce_payment_gateway_helper import BigcommercePaymentGatewayHelper, BigCommercePaymentGatewayImporter, BigcommercePaymentGatewayImportBuilder
@@ -23,6 +24,11 @@ TYPE2MODEL = {
 
 _logger = logging.getLogger(__name__)
 
+# BigCommerce accepts up to 10 products and 50 variants in one batch request
+INVENTORY_PRODUCT_BATCH_SIZE = 10
+INVENTORY_VARIANT_BATCH_SIZE = 50
+INVENTORY_JOB_SIZE = 100
+
 BIGCOMMERCE_IMPORTED_FIELDS = [
     'Name',
     'Images',
@@ -80,7 +86,7 @@ class BigCommerceChannel(models.Model):
     def _bigcommerce_check_connection(self):
         bc_store_hash, headers = self.bigcommerce_generate_url_header()
         url = 'https://api.bigcommerce.com/stores/%s/v2/store' % bc_store_hash
-        response = requests.get(url=url, headers=headers)
+        response = self.bigcommerce_send_request('GET', url, bc_store_hash, headers)
         if response.status_code == 200:
             return {
                 'effect': {
@@ -171,13 +177,25 @@ class BigCommerceChannel(models.Model):
 
         return bc_store_hash, headers
 
+    @api.model
+    def bigcommerce_send_request(self, method, url, bc_store_hash, headers, **kwargs):
+        """
+        Send a request to a BigCommerce URL through the pooled connection of the store,
+        so TLS sessions are reused and the store rate limit is respected
+        """
+        api = BigCommerceHelper.connect_with_dict(BigCommerceHelper.with_connection_settings(self.env, {
+            'store_hash': bc_store_hash,
+            'access_token': headers['X-Auth-Token'],
+        }))
+        return api.connection.send(method, url, headers=headers, **kwargs)
+
     def _bigcommerce_prepare_exported_inventory_data(self, products):
         data_sync = []
         for product_tmpl, g in groupby(sorted(products, key=lambda p: p.product_channel_tmpl_id.id), key=lambda r: r.product_channel_tmpl_id):
             variants = self.env['product.channel.variant'].concat(*list(g))
             res = []
             for variant in variants.filtered(lambda r: r.id_on_channel):
-                res.append({'id': int(variant.id_on_channel), 'inventory_level': int(variant.free_qty)})
+                res.append({'id': int(variant.id_on_channel), 'inventory_level': variant._get_exported_inventory_qty(), 'res_id': variant.id})
             #
             # Products have to track inventory on variant level if using inventory management in OB
             #
@@ -187,6 +205,7 @@ class BigCommerceChannel(models.Model):
                         'id': int(product_tmpl.id_on_channel),
                         'inventory_tracking': 'product',
                         'inventory_level': int(res[0]['inventory_level']),
+                        'variants': res[:1],
                         'res_id': product_tmpl.id
                     })
                 else:
@@ -210,62 +229,102 @@ class BigCommerceChannel(models.Model):
         products = self.env['product.channel.variant'].sudo().search(domain)
         data_sync = self._bigcommerce_prepare_exported_inventory_data(products)
 
+        chunks = list(split_every(INVENTORY_JOB_SIZE, data_sync, list))
+        logs = self.env['omni.log'].create([{
+            'datas': {'data': data},
+            'res_ids': ','.join([str(e.pop('res_id')) for e in data]),
+            'res_model': 'product.channel',
+            'channel_id': self.id,
+            'operation_type': 'export_inventory'
+        } for data in chunks])
+
         uuids = []
-        if data_sync:
-            # BigCommerce only allows to sync 10 products per request
-            def divide_chunks():
-                for i in range(0, len(data_sync), 9):
-                    yield data_sync[i:i + 9]
-
-            for data in divide_chunks():
-                res_ids = ','.join([str(e.pop('res_id')) for e in data])
-                log = self.env['omni.log'].create({
-                    'datas': {'data': data},
-                    'res_ids': res_ids,
-                    'res_model': 'product.channel',
-                    'channel_id': self.id,
-                    'operation_type': 'export_inventory'
-                })
-                job_uuid = self.with_context(log_id=log.id).with_delay(max_retries=15)\
-                    ._bigcommerce_sync_inventory(data).uuid
-                uuids.append(job_uuid)
-                log.update({'job_uuid': job_uuid})
+        batch = DelayableBatch()
+        for log, data in zip(logs, chunks):
+            job_uuid = self.with_context(log_id=log.id).with_delay(max_retries=15, batch=batch)\
+                ._bigcommerce_sync_inventory(data).uuid
+            uuids.append(job_uuid)
+            log.update({'job_uuid': job_uuid})
+        batch.enqueue()
         return uuids
 
     def _bigcommerce_sync_inventory(self, data_sync):
         self.ensure_one()
         helper = BigCommerceHelper.connect_with_channel(channel=self)
-        res = helper.products.put_batch(data_sync)
         errors = []
+        variants = []
+        synced_variants = []
+        for rows in split_every(INVENTORY_PRODUCT_BATCH_SIZE, data_sync, list):
+            for row in self._bigcommerce_sync_inventory_products(helper, rows, errors):
+                if row['inventory_tracking'] == 'variant':
+                    variants.extend(dict(variant, product_id=row['id']) for variant in row['variants'])
+                else:
+                    synced_variants.extend(row.get('variants', []))
+
+        for chunk in split_every(INVENTORY_VARIANT_BATCH_SIZE, variants, list):
+            synced_variants.extend(self._bigcommerce_sync_inventory_variants(helper, chunk, errors))
 
-        def _update_inventory_variant():
-            for variant in row['variants']:
-                variant_obj = helper.product_variants.acknowledge(variant['id'], product_id=row['id'])
-                variant_obj.data = {'inventory_level': variant['inventory_level']}
-                variant_obj.put_one()
+        self.env['product.channel.variant']._update_inventory_synced_qty({
+            variant['res_id']: variant['inventory_level'] for variant in synced_variants if variant.get('res_id')
+        })
+        if errors:
+            raise ValidationError("\n".join(errors))
 
+    @api.model
+    def _bigcommerce_sync_inventory_products(self, helper, rows, errors):
+        """
+        Set inventory tracking (and level of products without variants) in one request
+        Return the rows which are updated on BigCommerce
+        """
+        payload = [{k: v for k, v in row.items() if k != 'variants'} for row in rows]
+        res = helper.products.put_batch(payload)
         if res.last_response.ok():
-            for row in list(filter(lambda r: r['inventory_tracking'] == 'variant', data_sync)):
-                _update_inventory_variant()
-
-        elif res.last_response.status_code in [404, 422]:
-            for row in data_sync:
-                data = {'inventory_tracking': 'variant'}
-                if row['inventory_tracking'] == 'product':
-                    data = {'inventory_tracking': 'product', 'inventory_level': row['inventory_level']}
-                product_obj = helper.products.acknowledge(row['id'])
-                product_obj.data = data
-                res = product_obj.put_one()
-                if res.last_response.ok():
-                    if row['inventory_tracking'] == 'variant':
-                        _update_inventory_variant()
-                else:
-                    errors.append(res.last_response.content)
-        else:
-            errors.append(res.last_response.content)
+            return rows
+        if res.last_response.status_code not in [404, 422]:
+            errors.append(str(res.last_response.content))
+            return []
+
+        # The whole batch is rejected because of some products, update them one by one
+        synced_rows = []
+        for row, data in zip(rows, payload):
+            product_obj = helper.products.acknowledge(row['id'])
+            product_obj.data = {k: v for k, v in data.items() if k != 'id'}
+            res = product_obj.put_one()
+            if res.last_response.ok():
+                synced_rows.append(row)
+            else:
+                errors.append('Product %s: %s' % (row['id'], res.last_response.content))
+        return synced_rows
 
-        if errors:
-            raise ValidationError(" - ".join(str(e) for e in errors))
+    @api.model
+    def _bigcommerce_sync_inventory_variants(self, helper, variants, errors):
+        """
+        Set inventory level of variants of any products in one request
+        Return the variants which are updated on BigCommerce
+        """
+        payload = [{'id': variant['id'], 'inventory_level': variant['inventory_level']} for variant in variants]
+        res = helper.variants.put_batch(payload)
+        if res.last_response.ok():
+            batch_errors = res.get_batch_errors()
+            errors.extend('Variant %s' % error for error in batch_errors)
+            # Rejected items cannot be told apart reliably, so none of them is remembered as synced
+            return [] if batch_errors else variants
+        if res.last_response.status_code not in [404, 422]:
+            errors.append(str(res.last_response.content))
+            return []
+
+        # The whole batch is rejected because of some variants, update them one by one
+        synced_variants = []
+        for variant in variants:
+            variant_obj = helper.product_variants.acknowledge(variant['id'], product_id=variant['product_id'])
+            variant_obj.data = {'inventory_level': variant['inventory_level']}
+            res = variant_obj.put_one()
+            if res.last_response.ok():
+                synced_variants.append(variant)
+            else:
+                errors.append('Variant %s of product %s: %s' % (
+                    variant['id'], variant['product_id'], res.last_response.content))
+        return synced_variants
 
     def open_product_brands(self):
         self.ensure_one()
@@ -306,7 +365,7 @@ class BigCommerceChannel(models.Model):
     def bigcommerce_get_store_settings(self, bc_store_hash, headers):
         try:
             url = 'https://api.bigcommerce.com/stores/%s/v2/store' % bc_store_hash
-            response = requests.get(url=url, headers=headers)
+            response = self.bigcommerce_send_request('GET', url, bc_store_hash, headers)
             if response.status_code != 200:
                 raise ValidationError(_('Invalid credentials, please verify that you type the correct info and try again.'))
             json_response = response.json()
@@ -389,17 +448,17 @@ class BigCommerceChannel(models.Model):
         def prepare_helper():
             if vals is None:
                 return BigCommerceHelper.connect_with_channel(self)
-            return BigCommerceHelper.connect_with_dict({
+            return BigCommerceHelper.connect_with_dict(BigCommerceHelper.with_connection_settings(self.env, {
                 'store_hash': vals.get('bc_store_hash'),
                 'access_token': vals.get('bc_access_token'),
-            })
+            }))
 
         def fetch_store_currencies():
             helper = prepare_helper()
             return helper.currencies.all()
 
         def extract_all_and_default_currency_code(currency_res):
-            currency_data = list(map(attrgetter('data'), currency_res))
+            currency_data = list(currency_res.iter(copy=False))
             get_code = itemgetter('currency_code')
             all_codes = list(map(get_code, currency_data))
             default_code = get_code(next(filter(lambda cd: cd['is_default'] is True, currency_data)))
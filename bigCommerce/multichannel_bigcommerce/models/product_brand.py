@@ -3,7 +3,6 @@
 
 import logging
 from odoo import api, fields, models, _
-import requests
 from odoo.exceptions import ValidationError
 import json
 
@@ -28,7 +27,7 @@ class BrandChannel(models.Model):
             url += '/%s' % id_on_channel
 
         try:
-            response = requests.get(url=url, headers=headers)
+            response = channel.bigcommerce_send_request('GET', url, bc_store_hash, headers)
             if response.status_code == 200:
                 vals = response.json()['data']
                 if isinstance(vals, dict):
@@ -74,7 +73,8 @@ class BrandChannel(models.Model):
             data = {
                 'name': record.name
             }
-            response = requests.post(url=end_point, headers=headers, data=json.dumps(data))
+            response = record.channel_id.bigcommerce_send_request('POST', end_point, bc_store_hash, headers,
+                                                                  data=json.dumps(data))
             if response.status_code == 200:
                 id_on_channel = str(response.json()['data']['id'])
                 record.sudo().write({'id_on_channel': str(id_on_channel)})
@@ -95,7 +95,8 @@ class BrandChannel(models.Model):
             data = {
                 'name': record.name
             }
-            response = requests.put(url=end_point, headers=headers, data=json.dumps(data))
+            response = record.channel_id.bigcommerce_send_request('PUT', end_point, bc_store_hash, headers,
+                                                                  data=json.dumps(data))
 
     def bigcommerce_delete_record(self):
         """
@@ -106,5 +107,5 @@ class BrandChannel(models.Model):
             bc_store_hash, headers = record.channel_id.bigcommerce_generate_url_header()
             end_point = 'https://api.bigcommerce.com/stores/%s/v3/catalog/brands/%s' % (
                 bc_store_hash, record.id_on_channel)
-            requests.delete(url=end_point, headers=headers)
+            record.channel_id.bigcommerce_send_request('DELETE', end_point, bc_store_hash, headers)
 
@@ -1,6 +1,9 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+import base64
+import hashlib
+import json
 import operator
 import logging
 import dateutil.parser
@@ -8,6 +11,7 @@ import dateutil.parser
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
+from odoo.addons.channel_base_sdk.utils.restful.fan_out import FanOut
 from odoo.addons.omni_manage_channel.utils.common import ImageUtils
 from odoo.addons.multichannel_product.models.product_channel import after_commit, validate_exported_fields
 
@@ -156,9 +160,10 @@ class ProductChannel(models.Model):
             categories = ProductChannelCategory.search([('channel_id.id', '=', channel_id),
                                                         ('id_on_channel', 'in', product_category_ids)])
             if len(categories) != len(product_category_ids):
-                ProductChannelCategory.bigcommerce_get_data(channel_id)
-                categories = ProductChannelCategory.search([('channel_id.id', '=', channel_id),
-                                                            ('id_on_channel', 'in', product_category_ids)])
+                index = {category.id_on_channel: category.id for category in categories}
+                index = ProductChannelCategory.bigcommerce_import_missing_categories(channel_id, product_category_ids,
+                                                                                     index=index)
+                return [index[x] for x in product_category_ids if x in index]
 
             ids = categories.mapped('id')
             return ids
@@ -251,6 +256,11 @@ class ProductChannel(models.Model):
                 'bulk_pricing_rule_ids': bulk_pricing_rule_vals,
             })
 
+            if 'product_channel_image_ids' in product_channel_vals:
+                product_channel_vals['exported_image_ids'] = ','.join(sorted(
+                    cmd[2]['id_on_channel'] for cmd in product_channel_vals['product_channel_image_ids'] if cmd[0] == 0
+                ))
+
             if product_data.get('attribute_line_ids', False):
                 for field in BIGCOMMERCE_IGNORED_FIELDS:
                     product_channel_vals[field] = self[field]
@@ -487,45 +497,70 @@ class ProductChannel(models.Model):
 
     @after_commit
     def bigcommerce_update_images(self, update=False):
+        """
+        Only send the images which are new, edited, reordered or deleted since the last export
+        """
         self.ensure_one()
-        result = []
-        ids = []
         api = BigCommerceHelper.connect_with_channel(channel=self.channel_id)
-        product_images = api.product_images.acknowledge(None, product_id=self.id_on_channel)
+        exported_ids = set()
         if update:
-            # Check current images on store
-            res = product_images.all()
-            if res.ok():
-                images = res.data['data']
-                ids = [str(i['id']) for i in images]
-
-        for index, image in enumerate(self.product_channel_image_ids.sorted(lambda i: i.sequence)):
-            data = {
+            exported_ids = set(filter(None, (self.exported_image_ids or '').split(',')))
+            if not self.exported_image_ids:
+                # Images exported before keeping track of them, check current images on store
+                res = api.product_images.acknowledge(None, product_id=self.id_on_channel).all()
+                if res.ok():
+                    exported_ids = {str(i['id']) for i in res.data['data']}
+
+        result = []
+        calls = []
+        images = self.product_channel_image_ids.sorted(lambda i: i.sequence)
+        for index, image in enumerate(images):
+            metadata = {
                 'is_thumbnail': image.is_thumbnail,
                 'description': image.image_description if image.image_description else '',
-                'image_url': image.image_url,
                 'sort_order': index + 1
             }
+            data = dict(metadata, image_url=image.image_url)
             result.append(data)
-            if image.id_on_channel and image.id_on_channel in ids:
-                product_image = api.product_images.acknowledge(image.id_on_channel, product_id=self.id_on_channel)
-                product_image.data = data
-                product_image.put_one()
+            if image.id_on_channel and image.id_on_channel in exported_ids:
+                changes = image._get_export_changes(metadata)
+                if changes:
+                    product_image = api.product_images.acknowledge(image.id_on_channel, product_id=self.id_on_channel)
+                    # The store only fetches the image again when its content is changed
+                    product_image.data = data if changes == 'content' else metadata
+                    calls.append((image, metadata, product_image.put_one))
             else:
                 product_image = api.product_images.acknowledge(None, product_id=self.id_on_channel)
                 product_image.data = data
-                res = product_image.publish()
-                if res.ok():
-                    json_response = res.data['data']
-                    image.sudo().with_context(for_synching=True).write({'id_on_channel': str(json_response['id']),
-                                                                        'sequence': int(json_response['sort_order'])})
-
-        if ids:
-            current_ids = self.product_channel_image_ids.mapped('id_on_channel')
-            deleted_ids = list(filter(lambda i: i not in current_ids, ids))
-            for deleted_id in deleted_ids:
-                product_image = api.product_images.acknowledge(deleted_id, product_id=self.id_on_channel)
-                product_image.delete_one()
+                calls.append((image, metadata, product_image.publish))
+
+        current_ids = set(images.mapped('id_on_channel'))
+        for deleted_id in exported_ids - current_ids:
+            product_image = api.product_images.acknowledge(deleted_id, product_id=self.id_on_channel)
+            calls.append((None, deleted_id, product_image.delete_one))
+
+        if not calls:
+            return result
+
+        # Calls are independent, the rate limit governor of the connection paces them
+        responses = FanOut.with_connection(api.connection).map(lambda call: call[2](), calls)
+
+        remaining_ids = exported_ids & current_ids
+        for (image, metadata, _send), res in zip(calls, responses):
+            if not res.ok():
+                _logger.warning('Cannot export image of product %s on BigCommerce: %s',
+                                self.id_on_channel, res.get_error_message())
+                if not image:
+                    remaining_ids.add(metadata)
+            elif image and image.id_on_channel in exported_ids:
+                image._set_exported(metadata)
+            elif image:
+                json_response = res.data['data']
+                image._set_exported(metadata, {'id_on_channel': str(json_response['id']),
+                                               'sequence': int(json_response['sort_order'])})
+                remaining_ids.add(image.id_on_channel)
+
+        self.with_context(update_status=True).sudo().write({'exported_image_ids': ','.join(sorted(remaining_ids))})
         return result
 
     @api.model
@@ -538,13 +573,24 @@ class ProductChannel(models.Model):
         else:
             thumbnail = {}
 
-        thumbnail_decode = ImageUtils.get_safe_image_b64(thumbnail['url_standard']) if thumbnail else False
+        # The thumbnail is one of the images, so it is only fetched once
+        images_b64 = ImageUtils.get_safe_images_b64([image.get('url_standard') for image in image_data])
+        thumbnail_decode = images_b64.get(thumbnail['url_standard']) if thumbnail else False
 
+        # Images come from the store, so they are imported as exported: the next export skips them
+        positions = {id(image): index + 1 for index, image in enumerate(
+            sorted(image_data, key=lambda i: int(i.get('sort_order', 0))))}
         product_channel_image_ids = []
         for image in image_data:
             image_name = image.get('image_file')
             try:
-                img_base64 = ImageUtils.get_safe_image_b64(image.get('url_standard'))
+                img_base64 = images_b64.get(image.get('url_standard'))
+                # Same metadata as sent by `bigcommerce_update_images`
+                metadata = {
+                    'is_thumbnail': bool(image.get('is_thumbnail')),
+                    'description': image.get('description') or '',
+                    'sort_order': positions[id(image)],
+                }
                 product_channel_image_ids.append((0, 0, {
                     'name': image_name,
                     'is_thumbnail': image.get('is_thumbnail'),
@@ -553,7 +599,9 @@ class ProductChannel(models.Model):
                     'image_description': image.get('description', ''),
                     'channel_id': channel.id,
                     'product_tmpl_id': False,
-                    'sequence': int(image.get('sort_order', 0))
+                    'sequence': int(image.get('sort_order', 0)),
+                    'exported_checksum': hashlib.sha1(base64.b64decode(img_base64)).hexdigest() if img_base64 else False,
+                    'exported_metadata': json.dumps(metadata, sort_keys=True),
                 }))
             except Exception as e:
                 _logger.exception("Error when getting product Images: %s", str(e))
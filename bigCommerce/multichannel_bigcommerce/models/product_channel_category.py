@@ -2,7 +2,6 @@
 # See LICENSE file for full copyright and licensing details.
 
 import logging
-from functools import *
 
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
@@ -10,7 +9,7 @@ from odoo.addons.channel_base_sdk.utils.common.exceptions import EmptyDataError
 from odoo.addons.queue_job.exception import RetryableJobError
 from odoo.addons.multichannel_bigcommerce.utils.bigcommerce_api_helper import RateLimit, ExportError, NotFoundError
 from ..utils.bigcommerce_category_helper import BigcommerceCategoryHelper, BigCommerceCategoryImporter, \
-    BigcommerceCategoryImportBuilder
+    BigcommerceCategoryImportBuilder, SingularCategoryDetailDataInTrans
 
 
 _logger = logging.getLogger(__name__)
@@ -77,23 +76,27 @@ class ProductChannelCategory(models.Model):
         datas = importer.do_tree_import().data
         datas_all = []
 
-        def flatten_tree(category):
-            return ([y for x in category['children'] for y in flatten_tree(x)] + [category]) if category['children'] else [category]
+        def flatten_tree(categories):
+            for category in categories:
+                yield from flatten_tree(category['children'] or [])
+                yield category
 
         try:
             # get all category ids
-            all_categories = list(reduce(lambda x, y: x + flatten_tree(y), datas, []))
-            category_ids = [str(x['id']) for x in all_categories]
+            category_ids = [str(x['id']) for x in flatten_tree(datas)]
             existed_records = self.sudo().search([('id_on_channel', 'in', category_ids),
                                                   ('channel_id.id', '=', channel_id)])
             builder = prepare_tree_builder(datas, existed_records, category_ids)
             new_results, existing_results = builder.prepare_tree()
             if new_results:
                 existed_records += self.with_context(for_synching=True).sudo().create(new_results)
+            records_by_id = {record.id_on_channel: record for record in existed_records}
             for vals in existing_results:
-                record = existed_records.filtered(lambda r: r['id_on_channel'] == vals['id_on_channel'])
+                record = records_by_id[vals['id_on_channel']]
                 record.with_context(for_synching=True).sudo().write(vals)
 
+            # Children created through the tree are not in the list above
+            index = self._bigcommerce_get_category_index(channel_id)
             for pulled in importer.do_detail_import():
                 try:
                     if pulled.data:
@@ -101,8 +104,7 @@ class ProductChannelCategory(models.Model):
                         builder = prepare_detail_builder(pulled.data)
                         vals_list = list(fetch_category(builder.prepare_detail()))
                         for category_vals in vals_list:
-                            record = self.sudo().search([('channel_id.id', '=', channel_id),
-                                                         ('id_on_channel', '=', str(category_vals['id_on_channel']))], limit=1)
+                            record = self.sudo().browse(index.get(str(category_vals['id_on_channel'])))
                             record.with_context(for_synching=True).update(category_vals)
                 except EmptyDataError:
                     pass
@@ -115,6 +117,57 @@ class ProductChannelCategory(models.Model):
             self._bigcommerce_log(message=str(e), data=dict(data=datas_all), status='failed', channel_id=channel_id,
                                   operation_type='import_others')
 
+    @api.model
+    def _bigcommerce_get_category_index(self, channel_id):
+        """
+        Map IDs on store to IDs of all categories of the channel in one query
+        """
+        records = self.sudo().search_read([('channel_id.id', '=', channel_id), ('id_on_channel', '!=', False)],
+                                          ['id_on_channel'])
+        return {record['id_on_channel']: record['id'] for record in records}
+
+    @api.model
+    def bigcommerce_import_missing_categories(self, channel_id, ids_on_channel, index=None):
+        """
+        Import only the categories which are not in the index yet, together with their missing parents
+        :param index: Index from `_bigcommerce_get_category_index`, it is updated in place
+        :return: The updated index
+        """
+        if index is None:
+            index = self._bigcommerce_get_category_index(channel_id)
+        missing = {str(x) for x in ids_on_channel} - set(index)
+        if not missing:
+            return index
+
+        importer = BigCommerceCategoryImporter()
+        importer.channel = self.env['ecommerce.channel'].sudo().browse(channel_id)
+        fetched, requested = {}, set()
+        while missing:
+            requested |= missing
+            for category in importer.get_data_by_ids(sorted(missing)):
+                fetched[str(category['id'])] = category
+            parent_ids = {str(c['parent_id']) for c in fetched.values() if c.get('parent_id')}
+            missing = parent_ids - set(index) - requested
+
+        transform_detail_data = SingularCategoryDetailDataInTrans()
+
+        def create_category(id_on_channel):
+            category = fetched.get(id_on_channel)
+            if id_on_channel in index or not category:
+                return
+            parent_id = str(category.get('parent_id') or '')
+            create_category(parent_id)
+            vals = transform_detail_data(category)
+            vals.update({
+                'channel_id': channel_id,
+                'parent_id': index.get(parent_id, False),
+            })
+            index[id_on_channel] = self.with_context(for_synching=True).sudo().create(vals).id
+
+        for id_on_channel in fetched:
+            create_category(id_on_channel)
+        return index
+
     @api.model
     def _bigcommerce_log(self, message, data, status, channel_id, operation_type, res_id=False):
         return self.env['omni.log'].create({
@@ -100,11 +100,15 @@ class ProductTemplate(models.Model):
         number_of_products, uuids = 0, []
         channel = self.env['ecommerce.channel'].browse(channel_id)
         importer = prepare_importer(channel)
+        category_index = None
         for pulled in importer.do_import():
             if pulled:
                 number_of_products += len(pulled)
                 builder = prepare_builder(pulled.data)
                 vals_list = list(fetch_product(builder.prepare()))
+                # New categories are imported once here, so the product jobs find all of them locally
+                category_index = self.env['product.channel.category'].bigcommerce_import_missing_categories(
+                    channel_id, {x for vals in vals_list for x in vals.get('categories') or []}, index=category_index)
                 uuids.extend(self.create_jobs_for_synching(
                     vals_list,
                     channel_id,
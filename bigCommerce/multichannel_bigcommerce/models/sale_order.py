@@ -2,7 +2,6 @@
 # See LICENSE file for full copyright and licensing details.
 
 import logging
-import operator
 
 from odoo import api, models, _, fields
 from odoo.exceptions import ValidationError
@@ -95,23 +94,14 @@ class SaleOrder(models.Model):
 
         for pulled in importer.do_import():
             if pulled.ok():
-                order_data = list(map(operator.attrgetter('data'), pulled))
+                order_data = list(pulled.iter(copy=False))
                 datas.extend(order_data)
                 builder = prepare_builder(order_data)
-                for order_vals in builder.prepare():
-                    record = self.sudo().search([
-                        ('channel_id', '=', channel_id),
-                        ('id_on_channel', '=', str(order_vals['id'])),
-                    ], limit=1)
-
-                    existed_record = bool(record)  # If sale order has already existed
-
-                    uuids.extend(self.create_jobs_for_synching(
-                        vals_list=[order_vals],
-                        channel_id=channel_id,
-                        update=existed_record,
-                    ))
-                    self._cr.commit()
+                uuids.extend(self.create_jobs_for_synching_in_batch(
+                    vals_list=list(builder.prepare()),
+                    channel_id=channel_id,
+                ))
+                self._cr.commit()
             elif pulled.last_response and not pulled.last_response.ok():
                 _logger.error('Error while importing orders: %s', pulled.get_error_message())
                 channel.sudo().disconnect()
@@ -182,10 +172,10 @@ class SaleOrder(models.Model):
         get_bigcommerce_tax_by_amount = self.env['account.tax'].get_bigcommerce_tax_by_amount
         for line in lines:
             if not search_on_mapping:
-                product = products.filtered(lambda p: p.default_code == line['sku'])
+                product = products.by_sku(line['sku'])
                 if not product:
                     raise ValidationError(_('Missing SKU %s', line['sku']))
-                line['product_id'] = product[0].id
+                line['product_id'] = product.id
             else:
                 tax_id = get_bigcommerce_tax_by_amount(line.get('tax_amount', 0), company_id).id
                 if 'tax_amount' in line:
@@ -3,7 +3,6 @@
 
 import logging
 import pytz
-import requests
 import dateutil.parser
 
 from odoo import models, api
@@ -26,7 +25,7 @@ class Picking(models.Model):
         end_point = 'https://api.bigcommerce.com/stores/%s/v2/orders/%s/shipping_addresses' % (bc_store_hash,
                                                                                       self.sale_id.id_on_channel)
 
-        response = requests.get(url=end_point, headers=headers)
+        response = self.sale_id.channel_id.bigcommerce_send_request('GET', end_point, bc_store_hash, headers)
         if response.status_code == 200:
             shipping_addresses = response.json()
 
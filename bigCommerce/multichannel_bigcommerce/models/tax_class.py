@@ -3,7 +3,6 @@
 
 from odoo import api, fields, models, SUPERUSER_ID, _
 import logging
-import requests
 
 _logger = logging.getLogger(__name__)
 
@@ -35,7 +34,7 @@ class TaxClass(models.Model):
             url += '/%s' % id_on_channel
 
         try:
-            response = requests.get(url=url, headers=headers)
+            response = channel.bigcommerce_send_request('GET', url, bc_store_hash, headers)
             if response.status_code == 200:
                 vals = response.json()
                 if type(vals) == dict:
@@ -58,6 +58,28 @@ class TestBigCommerceImportCategory(BigCommerceTestCommon):
             # bigcommerce_channel_1 has 1 default category -> 1 + 6 = 7
             self.assertEqual(len(categories), 7)
 
+    def test_import_missing_categories(self):
+        product_channel_category = self.env['product.channel.category']
+        channel = self.bigcommerce_channel_1
+        categories_by_id = {str(c['id']): c for c in self.transformed_detail_categories}
+        requested_ids = []
+
+        def get_data_by_ids(importer, ids):
+            requested_ids.append(list(ids))
+            return [categories_by_id[x] for x in ids if x in categories_by_id]
+
+        with patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_category_helper.BigCommerceCategoryImporter.get_data_by_ids', new=get_data_by_ids), \
+                patch('odoo.addons.omni_manage_channel.utils.common.ImageUtils.get_safe_image_b64', return_value=False):
+            index = product_channel_category.bigcommerce_import_missing_categories(channel.id, [39])
+            # Only the missing category and then its missing parent are requested
+            self.assertEqual(requested_ids, [['39'], ['19']])
+            bath = product_channel_category.browse(index['39'])
+            self.assertEqual(bath.name, 'Bath')
+            self.assertEqual(bath.parent_id.id, index['19'])
+
+            product_channel_category.bigcommerce_import_missing_categories(channel.id, [39, 19], index=index)
+            self.assertEqual(len(requested_ids), 2)
+
     def test_export_category_to_bigcommerce(self):
         helper = BigcommerceCategoryHelper(self.bigcommerce_channel_1)
         exporting_data = helper.prepare_data(self.bigcommerce_channel_1.default_categ_id)
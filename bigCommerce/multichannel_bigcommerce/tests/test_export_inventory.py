@@ -2,7 +2,9 @@
 # See LICENSE file for full copyright and licensing details.
 
 from odoo.addons.multichannel_bigcommerce.tests.common import BigCommerceTestCommon, tagged
-from unittest.mock import patch
+from unittest.mock import patch, Mock
+from odoo.addons.multichannel_bigcommerce.models.ecommerce_channel import INVENTORY_JOB_SIZE
+from odoo.addons.multichannel_bigcommerce.utils.bigcommerce_api_helper import BigCommerceHelper
 from .common import ignore_delay, no_commit
 import logging
 import copy
@@ -16,7 +18,7 @@ class TestExportInventory(BigCommerceTestCommon):
     @patch('odoo.addons.multichannel_bigcommerce.models.ecommerce_channel.BigCommerceChannel._bigcommerce_prepare_exported_inventory_data')
     def test_export_log_export_inventory(self, mock_prepare_data, mock_sync):
         data_sync = []
-        for i in range(0, 20):
+        for i in range(0, INVENTORY_JOB_SIZE + 20):
             data_sync.append({
                             'id': '1232324',
                             'inventory_tracking': 'variant',
@@ -28,8 +30,28 @@ class TestExportInventory(BigCommerceTestCommon):
         logs = self.env['omni.log'].search([('job_uuid', 'in', uuids)])
         compared_vals = []
         def divide_chunks():
-            for i in range(0, len(data_sync), 9): 
-                yield data_sync[i:i + 9]
+            for i in range(0, len(data_sync), INVENTORY_JOB_SIZE):
+                yield data_sync[i:i + INVENTORY_JOB_SIZE]
         datas = divide_chunks()
         self.assertEqual(len(logs), len(list(datas)))
-        
\ No newline at end of file
+
+    def test_sync_inventory_in_batches(self):
+        data_sync = [{
+            'id': product_id,
+            'inventory_tracking': 'variant',
+            'variants': [{'id': product_id * 100 + i, 'inventory_level': i} for i in range(0, 10)],
+        } for product_id in range(1, 21)]
+        ok_response = Mock(last_response=Mock(ok=Mock(return_value=True)))
+        ok_response.get_batch_errors.return_value = []
+        helper = Mock()
+        helper.products.put_batch.return_value = ok_response
+        helper.variants.put_batch.return_value = ok_response
+
+        with patch.object(BigCommerceHelper, 'connect_with_channel', Mock(return_value=helper)):
+            self.bigcommerce_channel_1._bigcommerce_sync_inventory(data_sync)
+
+        # 20 products in 2 product batches, 200 variants in 4 variant batches
+        self.assertEqual(helper.products.put_batch.call_count, 2)
+        self.assertEqual(helper.variants.put_batch.call_count, 4)
+        helper.product_variants.acknowledge.assert_not_called()
+        self.assertNotIn('variants', helper.products.put_batch.call_args[0][0][0])
@@ -1,11 +1,14 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+import base64
+
 from unittest.mock import patch
 
 from odoo.tools import mute_logger
 
 from odoo.addons.omni_manage_channel.tests.common import patch_request
+from odoo.addons.omni_manage_channel.utils.common import ImageUtils
 from odoo.addons.multichannel_bigcommerce.tests.common import BigCommerceTestCommon, tagged
 
 
@@ -203,3 +206,25 @@ class TestBigCommerceExportProduct(BigCommerceTestCommon):
         }
         data = product_mapping._bigcommerce_prepare_data(exported_fields=exported_fields, update=True)
         self.assertEqual(set(self.REQUIRED_TEMPLATE_KEYS), set(data.keys()))
+
+    def test_imported_images_not_exported_again(self):
+        image_data = [
+            {'id': 11, 'url_standard': 'https://store/1.jpg', 'image_file': '1.jpg',
+             'is_thumbnail': False, 'description': '', 'sort_order': 2},
+            {'id': 12, 'url_standard': 'https://store/2.jpg', 'image_file': '2.jpg',
+             'is_thumbnail': True, 'description': 'Front', 'sort_order': 1},
+        ]
+        contents = {image['url_standard']: base64.b64encode(image['image_file'].encode()) for image in image_data}
+        with patch.object(ImageUtils, 'get_safe_images_b64', return_value=contents):
+            _thumbnail, commands = self.env['product.channel'].bigcommerce_prepare_image_data(
+                image_data, self.bigcommerce_channel_1)
+
+        images = self.env['product.channel.image'].create([vals for _, _, vals in commands])
+        for index, image in enumerate(images.sorted('sequence')):
+            # Same metadata as sent by `bigcommerce_update_images`
+            metadata = {
+                'is_thumbnail': image.is_thumbnail,
+                'description': image.image_description or '',
+                'sort_order': index + 1,
+            }
+            self.assertFalse(image._get_export_changes(metadata))
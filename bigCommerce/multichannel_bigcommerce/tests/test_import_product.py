@@ -42,6 +42,7 @@ class TestBigCommerceImportProduct(BigCommerceTestCommon):
     @patch('odoo.addons.multichannel_bigcommerce.models.product_brand.BrandChannel.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.tax_class.TaxClass.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.product_channel_category.ProductChannelCategory.bigcommerce_get_data', autospec=True)
+    @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_category_helper.BigCommerceCategoryImporter.get_data_by_ids', new=lambda self, ids: iter([]))
     @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_product_helper.ProductImporter.do_import', autospec=True)
     def test_import_auto_create_master(self, mock_do_import_product, mock_category, mock_tax, mock_brand, mock_image):
         """
@@ -75,6 +76,7 @@ class TestBigCommerceImportProduct(BigCommerceTestCommon):
     @patch('odoo.addons.multichannel_bigcommerce.models.product_brand.BrandChannel.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.tax_class.TaxClass.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.product_channel_category.ProductChannelCategory.bigcommerce_get_data', autospec=True)
+    @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_category_helper.BigCommerceCategoryImporter.get_data_by_ids', new=lambda self, ids: iter([]))
     @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_product_helper.ProductImporter.do_import', autospec=True)
     def test_import_no_auto_create_master(self, mock_do_import_product, mock_category, mock_tax, mock_brand):
         """
@@ -129,6 +131,7 @@ class TestBigCommerceImportProduct(BigCommerceTestCommon):
     @patch('odoo.addons.multichannel_bigcommerce.models.product_brand.BrandChannel.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.tax_class.TaxClass.bigcommerce_get_data', autospec=True)
     @patch('odoo.addons.multichannel_bigcommerce.models.product_channel_category.ProductChannelCategory.bigcommerce_get_data', autospec=True)
+    @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_category_helper.BigCommerceCategoryImporter.get_data_by_ids', new=lambda self, ids: iter([]))
     @patch('odoo.addons.multichannel_bigcommerce.utils.bigcommerce_product_helper.ProductImporter.do_import', autospec=True)
     def test_update_and_create_mapping_with_auto_merge(self, mock_do_import_product, mock_category, mock_tax, mock_brand, mock_image):
         """
@@ -254,6 +254,22 @@ class TestExportMasterPricelist(TestMasterPricelistCommon):
             'override_lst_price': 169.0,
         }])
 
+    def test_map_item_onto_many_variants(self):
+        item = self.pricelist_1.item_ids
+        mapper = ph.PricelistItemMaster2MappingMapper(item, [
+            {'id': 1, 'lst_price': 100.0},
+            {'id': 2, 'lst_price': 200.0},
+        ])
+        self.assertEqual(mapper.do_map(), [{
+            'product_channel_variant_id': 1,
+            'is_override_lst_price': True,
+            'override_lst_price': 95.0,
+        }, {
+            'product_channel_variant_id': 2,
+            'is_override_lst_price': True,
+            'override_lst_price': 185.0,
+        }])
+
 
 class TestMappingPricelistCommon(BigCommerceTestCommon):
     @classmethod
@@ -494,6 +510,45 @@ class TestExportMappingPricelist(TestMappingPricelistCommon):
             'is_sync_in_progress': False,
         }])
 
+    def test_export_only_changed_rules(self):
+        mapping_pricelist = self.mapping_pricelist_1
+        mapping_pricelist.update({'id_on_channel': '826491'})
+        exporter = ph.PricelistRuleExporter(mapping_pricelist)
+        exporter.fingerprints = exporter._make_fingerprints(exporter._prepare_data())
+        mapping_pricelist.update({'exported_rule_fingerprints': exporter.dump_fingerprints()})
+
+        mapping_pricelist.rule_ids[0].update({'override_lst_price': 110.0})
+        mapping_pricelist.rule_ids[1].unlink()
+
+        api = Mock()
+        pricelist_obj = api.pricelists.acknowledge.return_value
+        with patch.object(BigCommerceHelper, 'connect_with_channel', Mock(return_value=api)):
+            ph.PricelistRuleExporter(mapping_pricelist).do_export()
+
+        pricelist_obj.remove_all_rules.assert_not_called()
+        pricelist_obj.upsert_records.assert_called_once_with([{
+            'variant_id': 100745,
+            'currency': 'USD',
+            'price': 110.0,
+        }])
+        pricelist_obj.remove_rules.assert_called_once_with(['100746'])
+
+    def test_export_rules_with_full_rebuild(self):
+        mapping_pricelist = self.mapping_pricelist_1
+        mapping_pricelist.update({'id_on_channel': '826491'})
+        exporter = ph.PricelistRuleExporter(mapping_pricelist)
+        exporter.fingerprints = exporter._make_fingerprints(exporter._prepare_data())
+        mapping_pricelist.update({'exported_rule_fingerprints': exporter.dump_fingerprints()})
+
+        api = Mock()
+        pricelist_obj = api.pricelists.acknowledge.return_value
+        with patch.object(BigCommerceHelper, 'connect_with_channel', Mock(return_value=api)):
+            ph.PricelistRuleExporter(mapping_pricelist, full_rebuild=True).do_export()
+
+        pricelist_obj.remove_all_rules.assert_called_once()
+        pricelist_obj.upsert_records.assert_called_once()
+        self.assertEqual(len(pricelist_obj.upsert_records.call_args[0][0]), 2)
+
     def test_export_error(self):
         mapping_pricelist = self.mapping_pricelist_1
         mapping_pricelist.update({'id_on_channel': '826491'})
@@ -63,6 +63,26 @@ class TestBigCommerceSaleOrderGetData(BigCommerceTestCommon):
 
         mock_commit.assert_called()
         
+    @patch('odoo.sql_db.Cursor.commit', autospec=True)
+    def test_import_order_page_in_batch(self, mock_commit):
+        sale_order_model = self.env['sale.order']
+        bigcommerce_channel = self.bigcommerce_channel_1
+        api = BigCommerceHelper.connect_with_channel(bigcommerce_channel)
+        orders = [dict(self.transformed_orders[0], id=str(seq), customer_reference=str(seq)) for seq in range(1, 4)]
+        imported_orders = api.orders.create_collection_with(orders)
+        imported_orders.last_response = Mock(ok=Mock(return_value=True))
+
+        with patch.object(BigCommerceOrderImporter, 'do_import', autospec=True) as mock_do_import, \
+                patch.object(type(sale_order_model), 'create_jobs_for_synching', autospec=True) as mock_create_jobs:
+            mock_do_import.return_value = [imported_orders]
+            mock_create_jobs.return_value = []
+            sale_order_model.bigcommerce_import_orders(bigcommerce_channel.id)
+
+        mock_create_jobs.assert_called_once()
+        self.assertEqual(len(mock_create_jobs.call_args.kwargs['vals_list']), 3)
+        self.assertFalse(mock_create_jobs.call_args.kwargs['update'])
+        mock_commit.assert_called_once()
+
     def test_parse_order_data(self):      
         """
         Make sure that all the below keys will need to have after transform
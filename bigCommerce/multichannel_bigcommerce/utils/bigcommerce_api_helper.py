@@ -56,7 +56,70 @@ class BigCommerceHelper:
             'store_hash': channel.bc_store_hash,
             'access_token': channel.bc_access_token,
         }
-        return cls.connect_with_dict(credentials)
+        return cls.connect_with_dict(cls.with_connection_settings(channel.env, credentials))
+
+    @classmethod
+    def with_connection_settings(cls, env, credentials):
+        """
+        Add the transport and logging settings from the system parameters to the credentials
+        """
+        return cls.with_logging(env, cls.with_transport(env, credentials))
+
+    @classmethod
+    def with_transport(cls, env, credentials):
+        """
+        Add the transport settings from the system parameters to the credentials
+        """
+        transport = cls.get_transport_options(env)
+        if transport:
+            return {**credentials, 'transport': transport}
+        return credentials
+
+    @classmethod
+    def get_transport_options(cls, env):
+        """
+        Pool size and timeouts of the connections to BigCommerce, the SDK defaults are kept if not set
+        """
+        params = env['ir.config_parameter'].sudo()
+        options = {}
+        for key in ('pool_connections', 'pool_maxsize', 'total_retries'):
+            value = params.get_param(f'bigcommerce.transport_{key}')
+            if value:
+                options[key] = int(value)
+        connect_timeout = params.get_param('bigcommerce.transport_connect_timeout')
+        read_timeout = params.get_param('bigcommerce.transport_read_timeout')
+        if connect_timeout or read_timeout:
+            options['timeout'] = (float(connect_timeout or 30), float(read_timeout or 60))
+        return options
+
+    @classmethod
+    def with_logging(cls, env, credentials):
+        """
+        Add the logging settings from the system parameters to the credentials
+        """
+        logging_options = cls.get_logging_options(env, credentials['store_hash'])
+        if logging_options:
+            return {**credentials, 'logging': logging_options}
+        return credentials
+
+    @classmethod
+    def get_logging_options(cls, env, store_hash):
+        """
+        How the requests to BigCommerce are logged, the SDK defaults are kept if not set
+        A parameter suffixed with the store hash only applies to that store,
+        e.g. `bigcommerce.logging_sample_rate.2khj4821`
+        """
+        params = env['ir.config_parameter'].sudo()
+
+        def get_param(key):
+            return params.get_param(f'bigcommerce.logging_{key}.{store_hash}') or params.get_param(f'bigcommerce.logging_{key}')
+
+        options = {}
+        for key, convert in (('mode', str), ('sample_rate', float), ('max_body_length', int), ('level', str)):
+            value = get_param(key)
+            if value:
+                options[key] = convert(value)
+        return options
 
     @classmethod
     def connect_with_dict(cls, credentials):
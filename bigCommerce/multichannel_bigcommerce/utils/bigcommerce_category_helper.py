@@ -132,6 +132,17 @@ class BigCommerceCategoryImporter:
         except EmptyDataError:
             pass
 
+    def get_data_by_ids(self, ids):
+        """
+        Fetch the categories with the given IDs with a targeted request instead of the whole tree
+        """
+        api = BigCommerceHelper.connect_with_channel(self.channel)
+        res = api.categories.all(**{'id:in': ','.join(map(str, ids)), 'limit': 250})
+        try:
+            yield from res.iter_records()
+        except EmptyDataError:
+            pass
+
 
 class SingularCategoryDetailDataInTrans(common_formatter.DataTrans):
     def __call__(self, category):
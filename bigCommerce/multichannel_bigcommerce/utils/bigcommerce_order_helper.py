@@ -55,15 +55,6 @@ class BigCommerceOrderImporter:
     def format_datetime(cls, value):
         return value.strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
-    def get_data(self, kw):
-        try:
-            res = self.get_first_data(kw)
-            yield res
-            yield from self.get_next_data(res)
-        except Exception as ex:
-            _logger.exception("Error while getting order: %s", str(ex))
-            raise
-
     def get_first_data(self, kw):
         api = BigCommerceHelper.connect_with_channel(self.channel)
         if self.ids:
@@ -73,20 +64,25 @@ class BigCommerceOrderImporter:
             kw.update(max_date_created=self.format_datetime(self.created_to_date))
         elif self.modified_to_date:
             kw.update(max_date_modified=self.format_datetime(self.modified_to_date))
-        res = api.orders.all(**kw)
-        res = res.get_order_products()
-        res = res.get_order_coupons()
-        res = res.get_order_shipping_address()
-        return res
+        return api.orders.all(**kw)
+
+    def get_data(self, kw):
+        try:
+            res = self.get_first_data(kw)
+            yield from res.iter_pages(prepare=self.load_sub_resources)
+        except Exception as ex:
+            _logger.exception("Error while getting order: %s", str(ex))
+            raise
 
     @classmethod
-    def get_next_data(cls, res):
-        while res:
-            res = res.get_next_page()
-            res = res.get_order_products()
-            res = res.get_order_coupons()
-            res = res.get_order_shipping_address()
-            yield res
+    def load_sub_resources(cls, res):
+        """
+        Runs on the prefetched page too, so the next page is completely loaded while the current one is imported
+        """
+        res = res.get_order_products(concurrent=True)
+        res = res.get_order_coupons()
+        res = res.get_order_shipping_address(concurrent=True)
+        return res
 
 
 class SingularOrderDataInTrans(common_formatter.DataTrans):
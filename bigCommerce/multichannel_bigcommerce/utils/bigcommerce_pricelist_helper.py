@@ -1,6 +1,8 @@
 # Copyright © 2021 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+import json
+import hashlib
 import operator
 import functools
 import contextlib
@@ -22,6 +24,7 @@ class PricelistMaster2MappingMapper:
         self.env = pricelist.env
         self.pricelist = pricelist
         self.channel = channel
+        self._applied_variants_cache = {}
 
     def do_map(self):
         res = {
@@ -40,38 +43,51 @@ class PricelistMaster2MappingMapper:
         }
 
     def _map_rules(self):
+        """
+        Map all items of the master pricelist
+        The one2many commands are created in one batch when the mapping pricelist is saved
+        """
         map_item = self._map_rule_items
-        adding_rule_vals = sum((map_item(item) for item in self.pricelist.item_ids), [])
+        adding_rule_vals = [vals for item in self.pricelist.item_ids for vals in map_item(item)]
         clear_all_vals = [(5, 0, {})]
         return {
             'rule_ids': clear_all_vals + adding_rule_vals,
         }
 
     def _map_rule_items(self, item) -> list:
-        variants = self._get_applied_variants_from(item)
-        item_mapper = PricelistItemMaster2MappingMapper
+        variants_data = self._get_applied_variants_from(item)
+        item_mapper = PricelistItemMaster2MappingMapper(item, variants_data)
         adding_item_vals = [
-            (0, 0, item_mapper(item, variant).do_map())
-            for variant in variants
+            (0, 0, vals)
+            for vals in item_mapper.do_map()
         ]
         return adding_item_vals
 
     def _get_applied_variants_from(self, item):
+        """
+        Read ids and base prices of the mapping variants applied by the item in one query
+        Items applied on the same products share the result
+        """
+        domain = [('channel_id', '=', self.channel.id)] + self._get_applied_variant_domain(item)
+        key = str(domain)
+        if key not in self._applied_variants_cache:
+            self._applied_variants_cache[key] = self.env['product.channel.variant'].search_read(
+                domain, ['lst_price'], order='id')
+        return self._applied_variants_cache[key]
+
+    @classmethod
+    def _get_applied_variant_domain(cls, item):
         applying_rule = item.applied_on
         if applying_rule == '3_global':
-            res = self.env['product.channel.variant'].search([('channel_id', '=', self.channel.id)])
+            res = []
         elif applying_rule == '2_product_category':
-            master = self.env['product.product'].search([('categ_id', 'child_of', item.categ_id.id)])
-            res = self._get_store_mapping_from_master(master)
+            res = [('product_product_id.categ_id', 'child_of', item.categ_id.id)]
         elif applying_rule == '1_product':
-            res = self._get_store_mapping_from_master(item.product_tmpl_id.mapped('product_variant_ids'))
+            res = [('product_product_id.product_tmpl_id', '=', item.product_tmpl_id.id)]
         else:  # applying_rule is 0_product_variant
-            res = self._get_store_mapping_from_master(item.product_id)
+            res = [('product_product_id', '=', item.product_id.id)]
         return res
 
-    def _get_store_mapping_from_master(self, product):
-        return product.mapped('product_channel_variant_ids').filtered(lambda r: r.channel_id == self.channel)
-
     @classmethod
     def _map_misc(cls):
         return {
@@ -80,19 +96,27 @@ class PricelistMaster2MappingMapper:
 
 
 class PricelistItemMaster2MappingMapper:
+    """
+    Map a master pricelist item onto all applied mapping variants at once
+    """
     DISCOUNT_TYPE_MASTER_TO_MAPPING = {
         'fixed': 'fixed',
         'percentage': 'percent',
         'formula': 'fixed',
     }
 
-    def __init__(self, item, variant):
+    def __init__(self, item, variants_data):
+        """
+        :param item: The master pricelist item
+        :param variants_data: List of {'id': int, 'lst_price': float} of the applied mapping variants
+        """
         self.item = item
-        self.variant = variant
+        self.variant_ids = [data['id'] for data in variants_data]
+        self.prices = [data['lst_price'] for data in variants_data]
 
-    def do_map(self) -> dict:
+    def do_map(self) -> list:
         """
-        Return the vals of `channel.pricelist.rule`
+        Return the list of vals of `channel.pricelist.rule`, one for each variant
         {
             'product_channel_variant_id': int,
             'is_override_lst_price': True,
@@ -121,79 +145,91 @@ class PricelistItemMaster2MappingMapper:
             ]
         }
         """
-
-        res = {
-            'product_channel_variant_id': self.variant.id,
-        }
+        if not self.variant_ids:
+            return []
         if self.item.min_quantity <= 1.0:
-            res.update(self._generate_rule_vals_for_variant_qty_singular())
+            rule_vals = self._generate_rule_vals_for_variant_qty_singular()
         else:
-            res.update(self._generate_rule_vals_for_variant_qty_plural())
-        return res
+            rule_vals = self._generate_rule_vals_for_variant_qty_plural()
+        return [
+            {'product_channel_variant_id': variant_id, **vals}
+            for variant_id, vals in zip(self.variant_ids, rule_vals)
+        ]
 
     def _generate_rule_vals_for_variant_qty_singular(self):
-        return {
-            'is_override_lst_price': True,
-            'override_lst_price': self._compute_price(),
-        }
+        return [
+            {
+                'is_override_lst_price': True,
+                'override_lst_price': price,
+            }
+            for price in self._compute_prices()
+        ]
 
-    def _compute_price(self):
+    def _compute_prices(self):
         """
-        Compute price similarly to `_compute_price` of `product.pricelist.item`
+        Compute prices of all variants similarly to `_compute_price` of `product.pricelist.item`
         """
 
         item = self.item
         compute_type = item.compute_price
         if compute_type == 'fixed':
-            res = item.fixed_price
+            res = [item.fixed_price] * len(self.prices)
         elif compute_type == 'percentage':
-            res = self.variant.lst_price * (1 - item.percent_price / 100.0)
+            factor = 1 - item.percent_price / 100.0
+            res = [price * factor for price in self.prices]
         else:  # compute_type is formula
-            res = self._compute_price_formula()
+            res = self._compute_prices_formula()
         return res
 
-    def _compute_price_formula(self):
+    def _compute_prices_formula(self):
         item = self.item
-        price_limit = price = self.variant.lst_price
-        price = price * (1 - (item.price_discount / 100)) or 0.0
+        price_limits = self.prices
+        factor = 1 - (item.price_discount / 100)
+        prices = [price * factor or 0.0 for price in price_limits]
         if item.price_round:
-            price = tools.float_round(price, precision_rounding=item.price_round)
+            price_round = item.price_round
+            prices = [tools.float_round(price, precision_rounding=price_round) for price in prices]
 
         if item.price_surcharge:
             price_surcharge = item.price_surcharge
-            price += price_surcharge
+            prices = [price + price_surcharge for price in prices]
 
         if item.price_min_margin:
             price_min_margin = item.price_min_margin
-            price = max(price, price_limit + price_min_margin)
+            prices = [max(price, limit + price_min_margin) for price, limit in zip(prices, price_limits)]
 
         if item.price_max_margin:
             price_max_margin = item.price_max_margin
-            price = min(price, price_limit + price_max_margin)
-        return price
+            prices = [min(price, limit + price_max_margin) for price, limit in zip(prices, price_limits)]
+        return prices
 
     def _generate_rule_vals_for_variant_qty_plural(self):
-        return {
-            'bulk_pricing_discount_type': self.DISCOUNT_TYPE_MASTER_TO_MAPPING[self.item.compute_price],
-            'bulk_pricing_rule_ids': [
-                (0, 0, self._generate_pricing_rule_vals_for_variant_qty_plural())
-            ]
-        }
+        discount_type = self.DISCOUNT_TYPE_MASTER_TO_MAPPING[self.item.compute_price]
+        return [
+            {
+                'bulk_pricing_discount_type': discount_type,
+                'bulk_pricing_rule_ids': [(0, 0, pricing_rule_vals)],
+            }
+            for pricing_rule_vals in self._generate_pricing_rule_vals_for_variant_qty_plural()
+        ]
 
     def _generate_pricing_rule_vals_for_variant_qty_plural(self):
         item = self.item
-        res = {
-            'quantity_min': item.min_quantity,
-        }
         if item.compute_price == 'percentage':
-            res.update({
-                'discount_amount_percent': item.percent_price,
-            })
-        else:
-            res.update({
-                'discount_amount_fixed': self._compute_price(),
-            })
-        return res
+            return [
+                {
+                    'quantity_min': item.min_quantity,
+                    'discount_amount_percent': item.percent_price,
+                }
+                for _ in self.variant_ids
+            ]
+        return [
+            {
+                'quantity_min': item.min_quantity,
+                'discount_amount_fixed': price,
+            }
+            for price in self._compute_prices()
+        ]
 
 
 class PricelistExporter:
@@ -247,15 +283,23 @@ class PricelistExporter:
 
 
 class PricelistRuleExporter:
+    """
+    Export rules of a pricelist
+    Only the rules changed since the last export are sent unless a full rebuild is requested
+    """
     MAX_NUMBER_OF_RULES = 1000
+    MAX_NUMBER_OF_REMOVED_VARIANTS = 200
 
-    def __init__(self, pricelist):
+    def __init__(self, pricelist, full_rebuild=False):
         self.pricelist = pricelist
         self.channel = pricelist.channel_id
+        self.full_rebuild = full_rebuild
+        self.fingerprints = {}
         self.bigcommerce_api = BigCommerceHelper.connect_with_channel(self.channel)
 
     def do_export(self):
         data = self._prepare_data()
+        self.fingerprints = self._make_fingerprints(data)
         pricelist_rule_obj = self._export_with(data)
         return pricelist_rule_obj
 
@@ -291,15 +335,82 @@ class PricelistRuleExporter:
             ]
         return res
 
+    @classmethod
+    def _make_fingerprint(cls, record):
+        dumped = json.dumps(record, sort_keys=True, default=str)
+        return hashlib.sha1(dumped.encode()).hexdigest()
+
+    @classmethod
+    def _make_fingerprints(cls, data):
+        return {
+            str(record['variant_id']): cls._make_fingerprint(record)
+            for record in data
+        }
+
+    def dump_fingerprints(self):
+        """
+        Serialize the fingerprints of the exported rules to be stored on the pricelist
+        """
+        return json.dumps({
+            'currency': self.pricelist.currency_id.name,
+            'records': self.fingerprints,
+        })
+
+    def _load_exported_fingerprints(self):
+        """
+        Fingerprints of the rules as last exported
+        None is returned if they are unknown or no longer match the rules on channel
+        """
+        try:
+            exported = json.loads(self.pricelist.exported_rule_fingerprints or 'null')
+        except ValueError:
+            return None
+        if not exported or exported.get('currency') != self.pricelist.currency_id.name:
+            return None
+        return exported.get('records', {})
+
     def _export_with(self, data):
         ioc = self.pricelist.id_on_channel
         pricelist_obj = self.bigcommerce_api.pricelists.acknowledge(ioc)
+        exported = None if self.full_rebuild else self._load_exported_fingerprints()
+        if exported is None:
+            return self._rebuild_with(pricelist_obj, data)
+        return self._update_with(pricelist_obj, data, exported)
+
+    def _rebuild_with(self, pricelist_obj, data):
+        # Rules on channel are unknown from now on until the rebuild is done
+        self.pricelist.with_context(for_synching=True).update({'exported_rule_fingerprints': False})
         res = pricelist_obj.remove_all_rules()
         if res.last_response.ok():
-            for chunk in self.chunks(data, self.MAX_NUMBER_OF_RULES):
-                res = pricelist_obj.upsert_records(chunk)
-                if not res.last_response.ok():
-                    return res
+            res = self._upsert_with(pricelist_obj, data) or res
+        return res
+
+    def _update_with(self, pricelist_obj, data, exported):
+        """
+        Upsert the new and changed rules, then remove the rules which are not on the pricelist anymore
+        Return None if there is nothing to export
+        """
+        fingerprints = self.fingerprints
+        changed_data = [
+            record for record in data
+            if exported.get(str(record['variant_id'])) != fingerprints[str(record['variant_id'])]
+        ]
+        removed_variant_ids = [variant_id for variant_id in exported if variant_id not in fingerprints]
+        res = self._upsert_with(pricelist_obj, changed_data)
+        if res and not res.last_response.ok():
+            return res
+        for chunk in self.chunks(removed_variant_ids, self.MAX_NUMBER_OF_REMOVED_VARIANTS):
+            res = pricelist_obj.remove_rules(chunk)
+            if not res.last_response.ok():
+                return res
+        return res
+
+    def _upsert_with(self, pricelist_obj, data):
+        res = None
+        for chunk in self.chunks(data, self.MAX_NUMBER_OF_RULES):
+            res = pricelist_obj.upsert_records(chunk)
+            if not res.last_response.ok():
+                return res
         return res
 
     @classmethod
@@ -347,13 +458,14 @@ class PricelistExportWorkflow:
 
     last_response: Any
 
-    def __init__(self, pricelist):
+    def __init__(self, pricelist, full_rebuild=False):
         self.pricelist = pricelist
+        self.full_rebuild = full_rebuild
         self.error_msgs = []
 
     @classmethod
-    def do_export(cls, pricelist):
-        self = cls(pricelist)
+    def do_export(cls, pricelist, full_rebuild=False):
+        self = cls(pricelist, full_rebuild=full_rebuild)
         with self._monitor_for_logging():
             self._export_pricelist()
             self._export_pricelist_rules()
@@ -393,7 +505,11 @@ class PricelistExportWorkflow:
                 self._log_retry_successfully()
             else:
                 raise
-        self._save_pricelist({'id_on_channel': res.data['id']})
+        ioc = str(res.data['id'])
+        if ioc != self.pricelist.id_on_channel:
+            # A new pricelist is created on channel, it has no rules yet
+            self.full_rebuild = True
+        self._save_pricelist({'id_on_channel': ioc})
 
     def _log_retry_successfully(self):
         self.pricelist.message_post(body=_('A new record is created successfully on online store.'))
@@ -402,8 +518,11 @@ class PricelistExportWorkflow:
         self.pricelist.with_context(for_synching=True).update(vals)
 
     def _export_pricelist_rules(self):
-        res = PricelistRuleExporter(self.pricelist).do_export()
-        self._ensure_response_ok(res.last_response)
+        helper = PricelistRuleExporter(self.pricelist, full_rebuild=self.full_rebuild)
+        res = helper.do_export()
+        if res is not None:
+            self._ensure_response_ok(res.last_response)
+        self._save_pricelist({'exported_rule_fingerprints': helper.dump_fingerprints()})
 
     def _export_pricelist_assignments(self):
         res = PricelistAssignmentExporter(self.pricelist).do_export()
@@ -512,7 +631,7 @@ class PricelistChannel2MappingDelegateMapper:
 
     def do_map(self):
         assert len(self.pricelist) == 1
-        return self._parse_pricelist_data(self.pricelist.data)
+        return self._parse_pricelist_data(self.pricelist.data_view)
 
     def _parse_pricelist_data(self, data):
         ioc = data['id']
@@ -534,7 +653,7 @@ class PricelistChannel2MappingDelegateMapper:
     @classmethod
     def _parse_assignment_data(cls, assignment_res, price_list_id):
         for res in assignment_res:
-            data = res.data
+            data = res.data_view
             if data['price_list_id'] == price_list_id:
                 yield {
                     'channel_customer_group_id_on_channel': data['customer_group_id'],
@@ -548,7 +667,7 @@ class PricelistItemChannel2MappingDelegateMapper:
 
     def do_map(self):
         assert len(self.rules) > 0
-        get_data = operator.attrgetter('data')
+        get_data = operator.attrgetter('data_view')
         parse_rule = self._parse_rule_data
         res = list(map(parse_rule, map(get_data, self.rules)))
         return res
@@ -866,6 +985,7 @@ class PricelistDelegateWorkflow(PricelistImportLogger):
     OVERRIDDEN_VALUES = {
         'need_to_export': False,
         'is_sync_in_progress': False,
+        'exported_rule_fingerprints': False,
     }
 
     def __init__(self, model, delegate_vals, **kwargs):
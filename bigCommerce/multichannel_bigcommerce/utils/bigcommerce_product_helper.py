@@ -4,6 +4,7 @@
 import logging
 import pytz
 import operator
+import itertools
 import collections
 
 from datetime import datetime, time
@@ -624,9 +625,7 @@ class ProductImporter:
 
     @classmethod
     def get_next_data(cls, res):
-        while res:
-            res = res.get_next_page()
-            yield res
+        yield from itertools.islice(res.iter_pages(concurrent=True), 1, None)
 
 
 class ProductImportBuilder:
@@ -4,7 +4,6 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
 from odoo.osv import expression
-from odoo.addons.queue_job.exception import RetryableJobError
 
 
 from .ftps_helper import FTPSHelper
@@ -31,6 +30,8 @@ class EcommerceChannel(models.Model):
     is_enable_inventory_sync = fields.Boolean(string='Enable Inventory Sync')
     is_allow_manual_bulk_inventory_sync = fields.Boolean(string='Allow Bulk Sync Manually')
     last_all_inventory_sync = fields.Datetime(string='Last all inventory updated')
+    last_inventory_sync = fields.Datetime(string='Last inventory sync', copy=False,
+                                          help='Stock changes before this time have been pushed to the store')
     default_warehouse_id = fields.Many2one('stock.warehouse', string='Default Warehouse',
                                            help='This warehouse is used in doing fulfillment')
     active_warehouse_ids = fields.Many2many('stock.warehouse', string='Active Warehouses',
@@ -184,9 +185,7 @@ class EcommerceChannel(models.Model):
         :return:
         """
         self.ensure_one()
-        records = self.env['queue.job'].sudo().search([('uuid', 'in', uuids), ('state', 'in', ['done', 'failed'])])
-        if len(records) != len(uuids):
-            raise RetryableJobError('Must be retried later')
+        self._get_finished_jobs(uuids)
 
         self.sudo().write({'is_running_bulk_inventory_sync': False})
 
@@ -208,6 +207,26 @@ class EcommerceChannel(models.Model):
                 ]])
         return domain
 
+    def _get_last_inventory_sync(self):
+        self.ensure_one()
+        if self.last_inventory_sync:
+            return fields.Datetime.to_string(self.last_inventory_sync)
+        IrConfigParameter = self.env['ir.config_parameter'].sudo()
+        return IrConfigParameter.get_param('ob.last_sync_inventory') or IrConfigParameter.get_param('database.create_date')
+
+    def _filter_unchanged_inventory(self, products):
+        """
+        Remove products whose quantity on channel is already the quantity computed now
+        """
+        self.ensure_one()
+        variants = self.env['product.channel.variant'].sudo().search([('channel_id.id', '=', self.id),
+                                                                      ('id_on_channel', '!=', False),
+                                                                      ('product_product_id', 'in', products.ids)])
+        synced_variants = variants.filtered(lambda r: r._is_inventory_synced())
+        unchanged_products = synced_variants.mapped('product_product_id') - \
+            (variants - synced_variants).mapped('product_product_id')
+        return products - unchanged_products
+
     def update_inventory(self, exported_products, bulk_sync=False):
         """
         Update available qty to channel
@@ -229,12 +248,14 @@ class EcommerceChannel(models.Model):
             exclude_domain = self._generate_exclude_domain()
             if exclude_domain:
                 exported_products = exported_products.filtered_domain(exclude_domain)
+            if not bulk_sync:
+                exported_products = self._filter_unchanged_inventory(exported_products)
             context = self.env.context
             uuids = getattr(self.with_context(**context), custom_method_name)(exported_products=exported_products)
 
             if bulk_sync and not self.env.context.get('no_delay'):
                 if uuids:
-                    self.with_delay(priority=12, max_retries=100).done_inventory_sync(uuids=uuids)
+                    self.with_delay(priority=12, max_retries=100, depends_on=uuids).done_inventory_sync(uuids=uuids)
                 else:
                     self.write({'is_running_bulk_inventory_sync': False})
             else:
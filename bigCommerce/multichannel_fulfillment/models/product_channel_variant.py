@@ -2,12 +2,15 @@
 # See LICENSE file for full copyright and licensing details.
 
 from itertools import groupby
+from operator import itemgetter
 from odoo import models, api, fields
 
 class ProductChannelVariant(models.Model):
     _inherit = 'product.channel.variant'
 
     free_qty = fields.Float(string='Available', compute='_compute_free_qty')
+    inventory_synced_qty = fields.Float(string='Last Synced Quantity', readonly=True, copy=False)
+    inventory_synced_date = fields.Datetime(string='Last Inventory Sync', readonly=True, copy=False)
 
     @api.model
     def _get_available_qty(self, products, active_warehouse_ids):
@@ -31,3 +34,31 @@ class ProductChannelVariant(models.Model):
         for record in self:
             caq = record.channel_id._compute_available_qty
             record.free_qty = data.get(record.product_product_id.id, caq(0.0))
+
+    def _is_inventory_synced(self):
+        """
+        Whether the quantity on channel is the same as the quantity computed now
+        """
+        self.ensure_one()
+        return bool(self.inventory_synced_date) and self.inventory_synced_qty == self._get_exported_inventory_qty()
+
+    def _get_exported_inventory_qty(self):
+        """
+        The quantity pushed to channel, channels only accept whole quantities
+        """
+        self.ensure_one()
+        return int(self.free_qty)
+
+    @api.model
+    def _update_inventory_synced_qty(self, quantities):
+        """
+        Keep the quantities which are pushed to channel successfully
+        :param quantities: Mapping from id of variant mappings to the pushed quantity
+        """
+        now = fields.Datetime.now()
+        for qty, items in groupby(sorted(quantities.items(), key=itemgetter(1)), key=itemgetter(1)):
+            records = self.sudo().browse([record_id for record_id, _ in items]).exists()
+            records.with_context(update_status=True).write({
+                'inventory_synced_qty': qty,
+                'inventory_synced_date': now,
+            })
@@ -98,12 +98,6 @@ class StockMove(models.Model):
 
         now = datetime.now().strftime(DEFAULT_SERVER_DATETIME_FORMAT)
         IrConfigParameter = self.env['ir.config_parameter'].sudo()
-        last_sync_inventory = IrConfigParameter.get_param('ob.last_sync_inventory') or IrConfigParameter.get_param('database.create_date')
-
-        if all_records or product_product_ids:
-            last_sync_inventory = IrConfigParameter.get_param('database.create_date')
-
-        IrConfigParameter.set_param('ob.last_sync_inventory', now)
 
         #
         # Only get quants on active warehouses of channel
@@ -116,6 +110,15 @@ class StockMove(models.Model):
         else:
             active_channels = self.env['ecommerce.channel'].sudo().browse(channel_id)
 
+        #
+        # Each channel keeps its own watermark, unchanged quantities are filtered out per channel later
+        #
+        if all_records or product_product_ids:
+            last_sync_inventory = IrConfigParameter.get_param('database.create_date')
+        else:
+            last_sync_inventory = min(active_channels.mapped(lambda c: c._get_last_inventory_sync()),
+                                      default=IrConfigParameter.get_param('database.create_date'))
+
         run_manual = True if all_records else False
         products = self.with_context(run_manual=run_manual)._get_products_to_sync_inventory(product_product_ids, last_sync_inventory)
         if products or all_records:
@@ -127,6 +130,9 @@ class StockMove(models.Model):
         else:
             active_channels.sudo().write({'warning_message': False})
 
+        if not product_product_ids:
+            active_channels.sudo().write({'last_inventory_sync': now})
+
     def _get_new_picking_values(self):
         vals = super(StockMove, self)._get_new_picking_values()
         group = self.mapped('group_id')
@@ -175,3 +175,35 @@ class TestProductChannelAvailability(ListingTestCommon):
                 self.assertEqual(mapping_variant.free_qty, out)
                 for wh_qty, wh in zip(wh_qty_list, warehouses):
                     self._update_master_quantity_of(mapping_variant, wh_qty * -1, wh)
+
+    def test_filter_unchanged_inventory(self):
+        mapping_variant = self.mapping_1_variant_1
+        channel = mapping_variant.channel_id
+        channel.write(self.basic_settings)
+        master_variant = mapping_variant.product_product_id
+        self._update_master_quantity_of(mapping_variant, 5.0)
+        mapping_variant.invalidate_cache(['free_qty'])
+
+        self.assertEqual(channel._filter_unchanged_inventory(master_variant), master_variant)
+
+        self.env['product.channel.variant']._update_inventory_synced_qty({mapping_variant.id: 5.0})
+        self.assertFalse(channel._filter_unchanged_inventory(master_variant))
+
+        self._update_master_quantity_of(mapping_variant, 2.0)
+        mapping_variant.invalidate_cache(['free_qty'])
+        self.assertEqual(channel._filter_unchanged_inventory(master_variant), master_variant)
+        self._update_master_quantity_of(mapping_variant, -7.0)
+
+    def test_filter_unchanged_fractional_inventory(self):
+        mapping_variant = self.mapping_1_variant_1
+        channel = mapping_variant.channel_id
+        channel.write(self.basic_settings)
+        master_variant = mapping_variant.product_product_id
+        self._update_master_quantity_of(mapping_variant, 2.5)
+        mapping_variant.invalidate_cache(['free_qty'])
+
+        self.env['product.channel.variant']._update_inventory_synced_qty({
+            mapping_variant.id: mapping_variant._get_exported_inventory_qty(),
+        })
+        self.assertFalse(channel._filter_unchanged_inventory(master_variant))
+        self._update_master_quantity_of(mapping_variant, -2.5)
@@ -94,25 +94,14 @@ class CustomerChannel(models.Model):
             if address:
                 if address['name'] != '':
                     company = empty_contact
-                    compared = {**address, **{
-                        'street_1': address.get('street') or False,
-                        'street_2': address.get('street2') or False,
-                    }}
+                    country_code = country_codes.get(address['country_id']) or 'US'
                     if 'company' in address and address['company']:
-                        company = self.determine_company(address, country_codes.get(compared['country_id']) or 'US')
+                        company = self.determine_company(address, country_code)
 
                     parent_id = company.id or parent.id
                     # Find matching sub-contact
-                    if company:
-                        matching = company.child_ids.filtered(lambda r: (
-                            r.type == contact_type
-                            and compare_address(r, compared, country_codes.get(compared['country_id']) or 'US')
-                        ))
-                    else:
-                        matching = parent.child_ids.filtered(lambda r: (
-                                r.type == contact_type
-                                and compare_address(r, compared, country_codes.get(compared['country_id']) or 'US')
-                        ))
+                    matching = (company or parent).search_by_address(
+                        address, contact_type, country_code)
                 else:
                     matching = channel.default_guest_customer
                 if matching:
@@ -12,11 +12,13 @@ from odoo.tools import float_round
 
 from odoo.addons.sale.models.sale_order import SaleOrder
 from odoo.addons.queue_job.exception import RetryableJobError
+from odoo.addons.queue_job.job import DelayableBatch
 
 from odoo.addons.omni_manage_channel.utils.common import AddressUtils
 from odoo.addons.omni_manage_channel.utils.common import ImageUtils
 
 from ..utils.order_processing_helper import OrderProcessingBuilder
+from ..utils.order_product_index import OrderProductIndex
 from odoo.addons.multichannel_product.utils.unit_converter import UnitConverter
 
 _logger = logging.getLogger(__name__)
@@ -343,9 +345,9 @@ class SaleOrder(models.Model):
     @api.model
     def create_waiting_job(self, channel, not_exists_products, order_data):
         uuids = self._import_missing_products(channel, not_exists_products)
-        self.with_delay(priority=20, max_retries=15).waiting_product(uuids=uuids,
-                                                                     channel=channel,
-                                                                     order_data=order_data)
+        self.with_delay(priority=20, max_retries=15, depends_on=uuids).waiting_product(uuids=uuids,
+                                                                                       channel=channel,
+                                                                                       order_data=order_data)
 
     @api.model
     def _prepare_order_line(self, channel, line_data):
@@ -441,18 +443,21 @@ class SaleOrder(models.Model):
         }
 
     @api.model
-    def _search_master_product(self, order_data, channel):
+    def _search_master_product(self, order_data, channel, product_index=None):
         """
         Search all master products for all order lines
+        :param product_index: The index of master products shared by the orders of the same page
         """
         lines = order_data.get('lines')
         skus = [line['sku'] for line in lines if line['sku'] not in ['', 'None', None]]
-        master_products = self.env['product.product'].sudo().search([('default_code', 'in', skus)])
-        if channel.auto_create_master_product and len(set(skus)) != len(master_products):
-            existed_skus = master_products.mapped('default_code')
-            missing_lines = list(filter(lambda l: l['sku'] not in existed_skus, lines))
-            master_products |= self._create_missing_product(missing_lines).mapped('product_variant_ids')
-        return master_products
+        if product_index is None:
+            master_products = self.env['product.product'].sudo().search([('default_code', 'in', skus)])
+            product_index = OrderProductIndex(master_products)
+        if channel.auto_create_master_product:
+            missing_lines = [line for line in lines if not product_index.by_sku(line['sku'])]
+            if any(line['sku'] in skus for line in missing_lines):
+                product_index.add(self._create_missing_product(missing_lines).mapped('product_variant_ids'))
+        return product_index
 
     @api.model
     def _ensure_all_product_are_matching(self, not_exists_products):
@@ -469,17 +474,19 @@ class SaleOrder(models.Model):
             raise MissingOrderProduct(message)
 
     @api.model
-    def _search_mapping_product(self, order_data, channel, no_waiting_product, auto_create_master):
+    def _get_no_custom_lines(self, lines):
+        return list(filter(lambda ln: ln['product_id'] not in [
+            '', 'None', None, 0, '0'] and 'master_product_id' not in ln, lines))
+
+    @api.model
+    def _search_mapping_product_variants(self, lines, channel):
         """
-        Search all listings product for all order lines
+        Search the mapping variants of the order lines in one query
         """
-        lines = order_data.get('lines')
-        no_custom_lines = list(filter(lambda ln: ln['product_id'] not in [
-                               '', 'None', None, 0, '0'] and 'master_product_id' not in ln, lines))
         skus = []
         variant_ids = []
         product_channel_ids = []
-        for line in no_custom_lines:
+        for line in lines:
             if 'variant_id' in line and line['variant_id'] not in ['', 'None', None, 0, '0']:
                 variant_ids.append(str(line['variant_id']))
             elif 'sku' in line:
@@ -492,6 +499,8 @@ class SaleOrder(models.Model):
                 product_channel_ids.append(str(line['product_id']))
 
         ProductChannelVariant = self.env['product.channel.variant']
+        if not lines:
+            return ProductChannelVariant.sudo()
         domain = [('channel_id.id', '=', channel.id),
                   ('product_product_id', '!=', False)]
         sub_domain = []
@@ -504,29 +513,50 @@ class SaleOrder(models.Model):
         if product_channel_ids:
             domain += [('product_channel_tmpl_id.id_on_channel',
                         'in', product_channel_ids)]
-        list_product_channel_variant = ProductChannelVariant.sudo().search(domain)
+        return ProductChannelVariant.sudo().search(domain)
+
+    @api.model
+    def _prefetch_order_products(self, vals_list, channel, search_on_mapping):
+        """
+        Search products of all order lines of a page at once
+        The returned index is shared by all orders of the page
+        """
+        if search_on_mapping:
+            lines = [line for vals in vals_list for line in vals.get('lines') or [] if 'product_id' in line]
+            products = self._search_mapping_product_variants(self._get_no_custom_lines(lines), channel)
+        else:
+            skus = list({line.get('sku') for vals in vals_list for line in vals.get('lines') or []
+                         if line.get('sku') not in ['', 'None', None]})
+            products = self.env['product.product'].sudo().search([('default_code', 'in', skus)])
+        return OrderProductIndex(products)
+
+    @api.model
+    def _search_mapping_product(self, order_data, channel, no_waiting_product, auto_create_master,
+                                product_index=None):
+        """
+        Search all listings product for all order lines
+        :param product_index: The index of mapping variants shared by the orders of the same page
+        """
+        lines = order_data.get('lines')
+        no_custom_lines = self._get_no_custom_lines(lines)
+        if product_index is None:
+            product_index = OrderProductIndex(self._search_mapping_product_variants(no_custom_lines, channel))
 
         #
         # Some products haven't been synched yet. Synching products before synching orders
         #
-        channel_variants_len = len(list_product_channel_variant)
         no_enough_lines = False
-        if channel_variants_len != 0:
+        if product_index:
             for line in no_custom_lines:
                 product_channel_variant = False
                 if 'variant_id' in line and line['variant_id'] not in ['', 'None']:
                     if line['variant_id'] in ['0', 0] and 'product_id' in line \
                             and line['product_id'] not in ['', 'None', 0, '0']:
-                        product_channel_variant = list_product_channel_variant.filtered(
-                            lambda p: p.product_channel_tmpl_id.id_on_channel == str(line['product_id']))
-                        if product_channel_variant:
-                            product_channel_variant = product_channel_variant[0]
+                        product_channel_variant = product_index.by_product(line['product_id'])
                     else:
-                        product_channel_variant = list_product_channel_variant.filtered(
-                            lambda p: p.id_on_channel == line['variant_id'])
+                        product_channel_variant = product_index.by_variant(line['variant_id'])
                 elif 'sku' in line and line['sku'] not in ['', 'None']:
-                    product_channel_variant = list_product_channel_variant.filtered(
-                        lambda p: p.default_code == line['sku'])
+                    product_channel_variant = product_index.by_sku(line['sku'])
                 if not product_channel_variant:
                     no_enough_lines = True
                     break
@@ -534,23 +564,19 @@ class SaleOrder(models.Model):
             no_enough_lines = True
         if no_enough_lines:
             not_exists_products = no_custom_lines
-            if list_product_channel_variant:
-                existed_skus = []
-                for v in list_product_channel_variant:
-                    existed_skus.append(
-                        '%s-%s' % (v.product_channel_tmpl_id.id_on_channel, v.default_code))
-
-                not_exists_products = list(
-                    filter(lambda l: str(str(l['product_id']) + '-' + l['sku']) not in existed_skus,
-                           no_custom_lines))
+            if product_index:
+                not_exists_products = [
+                    line for line in no_custom_lines
+                    if not product_index.has_product_sku(line['product_id'], line['sku'])
+                ]
             if not no_waiting_product:
                 if not auto_create_master:
                     self._ensure_all_product_are_matching(not_exists_products)
                 self.create_waiting_job(
                     channel, not_exists_products, order_data)
-                return True, self.env['product.channel.variant']
+                return True, OrderProductIndex(self.env['product.channel.variant'])
 
-        return False, list_product_channel_variant
+        return False, product_index
 
     @api.model
     def get_customer_info(self, channel_id, order_data):
@@ -743,7 +769,18 @@ class SaleOrder(models.Model):
         search_on_mapping = channel.get_setting('manage_mapping')
 
         if not update or (update and channel.allow_update_order):
+            # Logs are created and jobs are enqueued in one batch, jobs are only added for the orders which could be prepared
+            log_vals_list, order_data_list = [], []
+            product_index = self._prefetch_order_products(vals_list, channel, search_on_mapping)
             for vals in vals_list:
+                log_vals = {
+                    'datas': vals,
+                    'channel_id': channel_id,
+                    'entity_name': vals['channel_order_ref'],
+                    'operation_type': 'import_order',
+                    'res_model': 'sale.order',
+                    'channel_record_id': str(vals['id'])
+                }
                 try:
                     if not self._check_imported_order_data(channel, vals):
                         continue
@@ -752,47 +789,75 @@ class SaleOrder(models.Model):
                         channel_id=channel_id,
                         no_waiting_product=no_waiting_product,
                         auto_create_master=auto_create_master,
-                        search_on_mapping=search_on_mapping
+                        search_on_mapping=search_on_mapping,
+                        product_index=product_index,
                     )
                     if order_data:
-                        log = self.env['omni.log'].create({
-                            'datas': vals,
-                            'channel_id': channel_id,
-                            'operation_type': 'import_order',
-                            'entity_name': vals['channel_order_ref'],
-                            'res_model': 'sale.order',
-                            'channel_record_id': str(vals['id'])
-                        })
-
-                        job_uuid = self.with_context(log_id=log.id).with_delay(eta=5, max_retries=15)\
-                            ._sync_in_queue_job(order_data, channel_id, update).uuid
-                        log.update({'job_uuid': job_uuid})
-                        uuids.append(job_uuid)
+                        log_vals_list.append(log_vals)
+                        order_data_list.append(order_data)
                 except MissingOrderProduct as e:
-                    self.env['omni.log'].create({
-                        'datas': vals,
-                        'channel_id': channel_id,
-                        'entity_name': vals['channel_order_ref'],
-                        'operation_type': 'import_order',
-                        'res_model': 'sale.order',
-                        'status': 'failed',
-                        'message': str(e),
-                        'channel_record_id': str(vals['id'])
-                    })
+                    log_vals_list.append({**log_vals, 'status': 'failed', 'message': str(e)})
+                    order_data_list.append(None)
+                except Exception as e:
+                    _logger.exception(e)
+                    log_vals_list.append({**log_vals, 'status': 'failed', 'message': str(e)})
+                    order_data_list.append(None)
+
+            logs = self.env['omni.log'].create(log_vals_list)
+            batch = DelayableBatch()
+            for log, order_data in zip(logs, order_data_list):
+                if order_data is None:
                     continue
+                try:
+                    job_uuid = self.with_context(log_id=log.id).with_delay(eta=5, max_retries=15, batch=batch)\
+                        ._sync_in_queue_job(order_data, channel_id, update).uuid
                 except Exception as e:
                     _logger.exception(e)
-                    self.env['omni.log'].create({
-                        'datas': vals,
-                        'channel_id': channel_id,
-                        'entity_name': vals['channel_order_ref'],
-                        'operation_type': 'import_order',
-                        'res_model': 'sale.order',
-                        'status': 'failed',
-                        'message': str(e),
-                        'channel_record_id': str(vals['id'])
-                    })
+                    log.update({'status': 'failed', 'message': str(e)})
+                    continue
+                log.update({'job_uuid': job_uuid})
+                uuids.append(job_uuid)
+            batch.enqueue()
+
+        return uuids
 
+    @api.model
+    def create_jobs_for_synching_in_batch(self, vals_list, channel_id, no_waiting_product=None):
+        """
+        Create jobs for a whole page of orders pulled from channel
+        Existing orders are resolved with one query, then new and existing orders are synced separately
+        :param vals_list: See `create_jobs_for_synching`
+        :param channel_id: Odoo ID of the ecommerce.channel of the orders
+        :param no_waiting_product: See `create_jobs_for_synching`
+        """
+        existing_keys = {
+            rec['id_on_channel'] for rec in self.sudo().search_read([
+                ('channel_id', '=', channel_id),
+                ('id_on_channel', 'in', [str(vals['id']) for vals in vals_list]),
+            ], ['id_on_channel'])
+        }
+        new_vals_list, existing_vals_list = [], []
+        for vals in vals_list:
+            if str(vals['id']) in existing_keys:
+                existing_vals_list.append(vals)
+            else:
+                new_vals_list.append(vals)
+
+        uuids = []
+        if new_vals_list:
+            uuids.extend(self.create_jobs_for_synching(
+                vals_list=new_vals_list,
+                channel_id=channel_id,
+                update=False,
+                no_waiting_product=no_waiting_product,
+            ))
+        if existing_vals_list:
+            uuids.extend(self.create_jobs_for_synching(
+                vals_list=existing_vals_list,
+                channel_id=channel_id,
+                update=True,
+                no_waiting_product=no_waiting_product,
+            ))
         return uuids
 
     @api.model
@@ -839,16 +904,19 @@ class SaleOrder(models.Model):
         return status
 
     @api.model
-    def _find_order_items(self, order_data, channel, no_waiting_product, auto_create_master, search_on_mapping):
+    def _find_order_items(self, order_data, channel, no_waiting_product, auto_create_master, search_on_mapping,
+                          product_index=None):
         """
         Search on Master or Product Mappings for order items
+        Return the index of found products, see `OrderProductIndex`
         """
         waiting_job, products = None, []
         if not search_on_mapping:
-            products = self._search_master_product(order_data, channel)
+            products = self._search_master_product(order_data, channel, product_index=product_index)
         else:
             waiting_job, products = self._search_mapping_product(order_data, channel,
-                                                                 no_waiting_product, auto_create_master)
+                                                                 no_waiting_product, auto_create_master,
+                                                                 product_index=product_index)
         return waiting_job, products
 
     @api.model
@@ -856,10 +924,10 @@ class SaleOrder(models.Model):
         ln_vals = []
         for line in lines:
             if not search_on_mapping:
-                product = products.filtered(lambda p: p.default_code == line['sku'])
+                product = products.by_sku(line['sku'])
                 if not product:
                     raise ValidationError(_('Missing SKU %s', line['sku']))
-                line['product_id'] = product[0].id
+                line['product_id'] = product.id
             else:
                 if line['product_id'] in ['0', 'None']:
                     line_dup = dict(line)
@@ -922,13 +990,11 @@ class SaleOrder(models.Model):
 
         if line.get('variant_id', False):
             if line['variant_id'] == '0' and 'product_id' in line:
-                listing = listings.filtered(
-                    lambda r: r.product_channel_tmpl_id.id_on_channel == str(line['product_id']))[0]
+                listing = listings.by_product(line['product_id'])
             else:
-                listing = listings.filtered(lambda r: r.id_on_channel == str(line['variant_id']))
+                listing = listings.by_variant(line['variant_id'])
         elif line.get('sku', False):
-            listing = listings.filtered(
-                lambda r: r.default_code == line['sku'] and r.channel_id == channel)
+            listing = listings.by_sku(line['sku']).filtered(lambda r: r.channel_id == channel)
         else:
             listing = None
         _check_listing_mapping(listing)
@@ -956,7 +1022,7 @@ class SaleOrder(models.Model):
     @api.model
     def _prepare_imported_order(
             self, order_data, channel_id,
-            no_waiting_product=None, auto_create_master=True, search_on_mapping=True):
+            no_waiting_product=None, auto_create_master=True, search_on_mapping=True, product_index=None):
 
         channel = self.env['ecommerce.channel'].sudo().browse(channel_id)
 
@@ -991,7 +1057,8 @@ class SaleOrder(models.Model):
         })
 
         waiting_job, products = self._find_order_items(
-            order_data, channel, no_waiting_product, auto_create_master, search_on_mapping)
+            order_data, channel, no_waiting_product, auto_create_master, search_on_mapping,
+            product_index=product_index)
 
         if waiting_job:
             # Waiting for importing product firstly
@@ -85,3 +85,22 @@ class TestImportOrder(ChannelOrderTestCommon):
                                         'channel_record_id': shipments[0]['id_on_channel'],
                                         'status': 'done',
                                         'message': error_message}])
+
+    def test_share_product_index_across_orders(self):
+        sale_order_model = self.env['sale.order']
+        store = self.test_data['store_1']
+        order_data_1 = self.test_data['order_data_1']
+        order_data_2 = self.test_data['order_data_2']
+        listing_variant_1 = self.test_data['listing_1'].product_variant_ids
+
+        product_index = sale_order_model._prefetch_order_products([order_data_1, order_data_2], store, True)
+        self.assertEqual(product_index.products, listing_variant_1)
+        self.assertEqual(product_index.by_variant('LISTING01-VARIANT-1'), listing_variant_1)
+        self.assertEqual(product_index.by_product('LISTING01'), listing_variant_1)
+        self.assertEqual(product_index.by_sku(listing_variant_1.default_code), listing_variant_1)
+        self.assertFalse(product_index.by_variant('LISTING03-VARIANT-1'))
+
+        waiting_job, products = sale_order_model._search_mapping_product(
+            order_data_1, store, True, True, product_index=product_index)
+        self.assertFalse(waiting_job)
+        self.assertIs(products, product_index)
@@ -1 +1,2 @@
 from . import order_processing_helper
+from . import order_product_index
@@ -0,0 +1,53 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+
+class OrderProductIndex:
+    """
+    Look up products of order lines by variant ID on channel, product ID on channel and SKU
+    It is built once from the products found for a page of orders and shared by all of them
+    Products can be mapping variants (`product.channel.variant`) or master products (`product.product`)
+    """
+
+    def __init__(self, products):
+        self.products = products.browse()
+        self._by_variant = {}
+        self._by_product = {}
+        self._by_sku = {}
+        self._product_skus = set()
+        self.add(products)
+
+    def __bool__(self):
+        return bool(self.products)
+
+    def __len__(self):
+        return len(self.products)
+
+    def add(self, products):
+        """
+        Index more products, the first product found for a key is kept like `filtered(...)[0]`
+        """
+        products = products - self.products
+        self.products |= products
+        is_mapping = products._name == 'product.channel.variant'
+        for product in products:
+            sku = product.default_code
+            self._by_sku.setdefault(sku, product)
+            if is_mapping:
+                product_ioc = product.product_channel_tmpl_id.id_on_channel
+                self._by_variant.setdefault(product.id_on_channel, product)
+                self._by_product.setdefault(product_ioc, product)
+                self._product_skus.add((product_ioc, sku))
+        return self
+
+    def by_variant(self, variant_id):
+        return self._by_variant.get(str(variant_id), self.products.browse())
+
+    def by_product(self, product_id):
+        return self._by_product.get(str(product_id), self.products.browse())
+
+    def by_sku(self, sku):
+        return self._by_sku.get(sku, self.products.browse())
+
+    def has_product_sku(self, product_id, sku):
+        return (str(product_id), sku) in self._product_skus
@@ -20,6 +20,9 @@ from odoo.addons.omni_base.base_method import _standardize_vals
 _logger = logging.getLogger(__name__)
 
 
+# Exports of the same listing requested within this window (seconds) are sent once with the latest state
+EXPORT_JOB_COALESCE = 30
+
 # (fields from model "product.channel", fields from model "product.channel.variant")
 # Only simple fields are allowed in this list. Other types may not be supported
 VARIANT_EQUIVALENT_FIELDS = [
@@ -123,6 +126,8 @@ class ProductChannel(models.Model):
     product_variant_count = fields.Integer('# Product Variants', compute='_get_number_of_variants')
     product_variant_ids = fields.One2many('product.channel.variant', 'product_channel_tmpl_id', string='Variants')
     product_channel_image_ids = fields.One2many('product.channel.image', 'product_channel_id', string='Images')
+    exported_image_ids = fields.Char(string='Exported Image IDs', readonly=True, copy=False,
+                                     help='IDs on channel of the images at the last export')
     name = fields.Char(string='Name', readonly=False, copy=False)
     id_on_channel = fields.Char(string='Product Channel ID', copy=False, help='ID of product on Channel',
                                 readonly=True)
@@ -852,9 +857,11 @@ class ProductChannel(models.Model):
                     _("Please make sure that the selected products are in 'Draft', 'Updated' and 'Error' status"))
             for record in self:
                 if record.state == 'draft' or (not record.id_on_channel and record.state == 'error'):
-                    record.with_delay(channel='root.synching', max_retries=15)._push_to_channel()
+                    record.with_delay(channel='root.synching', max_retries=15,
+                                      coalesce=EXPORT_JOB_COALESCE)._push_to_channel()
                 elif record.state == 'updated' or (record.id_on_channel and record.state == 'error'):
-                    record.with_delay(channel='root.synching', max_retries=15).put_to_channel()
+                    record.with_delay(channel='root.synching', max_retries=15,
+                                      coalesce=EXPORT_JOB_COALESCE).put_to_channel()
                 else:
                     continue
             self.with_context(update_status=True).sudo().write({'state': 'in_progress'})
@@ -880,7 +887,8 @@ class ProductChannel(models.Model):
             context = self.env.context.copy()
             for record in rec_to_be_processed:
                 record.with_context(dict(context, delay_exec=True))\
-                    .with_delay(channel='root.synching', max_retries=15).export_from_mapping()
+                    .with_delay(channel='root.synching', max_retries=15, coalesce=EXPORT_JOB_COALESCE)\
+                    .export_from_mapping()
         return dict(success=True)
 
     def export_from_mapping(self):
@@ -1071,7 +1079,7 @@ class ProductChannel(models.Model):
             product_channels.with_context(dict(context, export_from_master=True)).write(vals)
             for product_channel in product_channels:
                 if 'delay_exec' in self.env.context:
-                    product_channel = product_channel.with_delay()
+                    product_channel = product_channel.with_delay(coalesce=EXPORT_JOB_COALESCE)
                 product_channel.update_from_master_data(exported_fields)
         else:
             record = self.with_context(dict(context, export_from_master=True)).create(vals)
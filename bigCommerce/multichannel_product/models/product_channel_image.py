@@ -1,6 +1,9 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+import base64
+import hashlib
+import json
 import logging
 from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError
@@ -31,6 +34,13 @@ class ProductChannelImage(models.Model):
 
     sequence = fields.Integer(string='Sequence')
 
+    checksum = fields.Char(string='Checksum', compute='_compute_checksum', store=True,
+                           help='Hash of the image content')
+    exported_checksum = fields.Char(string='Exported Checksum', readonly=True, copy=False,
+                                    help='Hash of the image content at the last export')
+    exported_metadata = fields.Char(string='Exported Metadata', readonly=True, copy=False,
+                                    help='Image data other than the content at the last export')
+
     @api.constrains('is_thumbnail')
     def _check_invalid_multiple_thumbnail(self):
         if 'for_synching' not in self.env.context:
@@ -39,6 +49,32 @@ class ProductChannelImage(models.Model):
                     raise ValidationError(_('Please make sure that you choose only one image as the product thumbnail.'))
         return True
 
+    @api.depends('image')
+    def _compute_checksum(self):
+        for record in self.with_context(bin_size=False):
+            record.checksum = hashlib.sha1(base64.b64decode(record.image)).hexdigest() if record.image else False
+
+    def _get_export_changes(self, metadata):
+        """
+        Compare with the last export of the image
+        :param metadata: Image data other than the content
+        :return: 'content' if the content is changed, 'metadata' if only metadata is changed, otherwise False
+        """
+        self.ensure_one()
+        if self.checksum != self.exported_checksum:
+            return 'content'
+        if json.dumps(metadata, sort_keys=True) != self.exported_metadata:
+            return 'metadata'
+        return False
+
+    def _set_exported(self, metadata, vals=None):
+        self.ensure_one()
+        self.sudo().with_context(for_synching=True).write({
+            **(vals or {}),
+            'exported_checksum': self.checksum,
+            'exported_metadata': json.dumps(metadata, sort_keys=True),
+        })
+
     def _compute_image_url(self):
         base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
         for record in self:
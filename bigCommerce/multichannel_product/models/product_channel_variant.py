@@ -9,7 +9,7 @@ from odoo.exceptions import ValidationError, UserError
 
 from odoo.addons.omni_manage_channel.utils.common import ImageUtils
 
-from .product_channel import VARIANT_EQUIVALENT_FIELDS, has_differ
+from .product_channel import EXPORT_JOB_COALESCE, VARIANT_EQUIVALENT_FIELDS, has_differ
 
 
 _logger = logging.getLogger(__name__)
@@ -265,9 +265,11 @@ class ProductChannelVariant(models.Model):
                       "products are in 'Draft', 'Updated' and 'Error' status"))
             for record in self:
                 if record.state == 'draft' or (not record.id_on_channel and record.state == 'error'):
-                    record.with_delay(channel='root.synching', max_retries=15)._post_product_variant_to_channel()
+                    record.with_delay(channel='root.synching', max_retries=15,
+                                      coalesce=EXPORT_JOB_COALESCE)._post_product_variant_to_channel()
                 elif record.state == 'updated' or (record.id_on_channel and record.state == 'error'):
-                    record.with_delay(channel='root.synching', max_retries=15).put_to_channel()
+                    record.with_delay(channel='root.synching', max_retries=15,
+                                      coalesce=EXPORT_JOB_COALESCE).put_to_channel()
                 else:
                     continue
             self.with_context(update_status=True).sudo().write({'state': 'in_progress'})
@@ -292,7 +294,8 @@ class ProductChannelVariant(models.Model):
                 return dict(success=False, msg=rec_to_be_processed.error_message)
         else:
             for record in rec_to_be_processed:
-                record.with_delay(channel='root.synching', max_retries=15).put_to_channel()
+                record.with_delay(channel='root.synching', max_retries=15,
+                                  coalesce=EXPORT_JOB_COALESCE).put_to_channel()
         return dict(success=True)
 
     def put_to_channel(self):
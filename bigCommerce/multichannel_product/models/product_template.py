@@ -9,6 +9,7 @@ from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError, UserError
 
 from odoo.addons.omni_base.base_method import _standardize_vals
+from odoo.addons.queue_job.job import DelayableBatch
 
 from ..utils.unit_converter import UnitConverter
 
@@ -651,18 +652,20 @@ class ProductTemplate(models.Model):
         auto_create_master_product = channel.get_setting('auto_create_master_product')
         auto_create_master = auto_create_master if auto_create_master is not None else auto_create_master_product
         # For the future when we want to process multiple products at once
+        logs = self.env['omni.log'].create([{
+            'datas': vals,
+            'channel_id': channel_id,
+            'operation_type': 'import_product',
+            'res_model': 'product.channel',
+            'entity_name': vals['name'],
+            'product_sku': vals.get('default_code') or vals.get('sku'),
+            'channel_record_id': str(vals['id'])
+        } for vals in vals_list])
+
         uuids = []
-        for vals in vals_list:
-            log = self.env['omni.log'].create({
-                'datas': vals,
-                'channel_id': channel_id,
-                'operation_type': 'import_product',
-                'res_model': 'product.channel',
-                'entity_name': vals['name'],
-                'product_sku': vals.get('default_code') or vals.get('sku'),
-                'channel_record_id': str(vals['id'])
-            })
-            job_uuid = self.with_context(log_id=log.id, for_synching=True).with_delay(max_retries=15)._sync_in_queue_job(
+        batch = DelayableBatch()
+        for log, vals in zip(logs, vals_list):
+            job_uuid = self.with_context(log_id=log.id, for_synching=True).with_delay(max_retries=15, batch=batch)._sync_in_queue_job(
                 vals,
                 channel_id,
                 auto_create_master=auto_create_master,
@@ -670,7 +673,8 @@ class ProductTemplate(models.Model):
             ).uuid
             log.update({'job_uuid': job_uuid})
             uuids.append(job_uuid)
-            self.env.cr.commit()
+        batch.enqueue()
+        self.env.cr.commit()
         return uuids
 
     @api.model
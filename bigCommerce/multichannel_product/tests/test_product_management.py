@@ -1,4 +1,5 @@
 import json
+import base64
 
 from odoo.tests.common import tagged, TransactionCase
 
@@ -198,3 +199,18 @@ class TestProcessProductData(ProductManagementTestCommon):
         attribute_values = product_attributes.product_template_value_ids
         self.assertRecordValues(attribute, [{'name': 'Color'}])
         self.assertRecordValues(attribute_values, [{'name': 'Red'}, {'name': 'Green'}])
+
+    def test_detect_image_export_changes(self):
+        image = self.env['product.channel.image'].create({
+            'name': 'Image 1',
+            'image': base64.b64encode(b'image-content'),
+        })
+        metadata = {'is_thumbnail': True, 'description': '', 'sort_order': 1}
+        self.assertEqual(image._get_export_changes(metadata), 'content')
+
+        image._set_exported(metadata)
+        self.assertFalse(image._get_export_changes(metadata))
+        self.assertEqual(image._get_export_changes(dict(metadata, sort_order=2)), 'metadata')
+
+        image.write({'image': base64.b64encode(b'other-content')})
+        self.assertEqual(image._get_export_changes(metadata), 'content')
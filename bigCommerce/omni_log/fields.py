@@ -0,0 +1,50 @@
+# Copyright © 2021 Novobi, LLC
+# See LICENSE file for full copyright and licensing details.
+
+import zlib
+
+import psycopg2
+
+from odoo.addons.queue_job.fields import JobSerialized
+
+ZLIB_HEADER = 0x78
+
+
+class CompressedJobSerialized(JobSerialized):
+    """
+    Same as `JobSerialized` but the json is stored zlib-compressed in a bytea column
+    Json smaller than `compress_threshold` bytes is stored as is
+    Rows written when the column was a text column are read as they are
+    """
+
+    type = 'compressed_job_serialized'
+    column_type = ('bytea', 'bytea')
+    compress_threshold = 512
+
+    def update_db_column(self, model, column):
+        if column and column['udt_name'] == 'text':
+            # The json contains backslashes which cannot be casted directly to bytea
+            model._cr.execute(
+                f'ALTER TABLE "{model._table}" ALTER COLUMN "{self.name}" TYPE bytea '
+                f'USING convert_to("{self.name}", \'UTF8\')'
+            )
+            column = dict(column, udt_name='bytea')
+        return super().update_db_column(model, column)
+
+    def convert_to_column(self, value, record, values=None, validate=True):
+        value = self.convert_to_cache(value, record, validate=validate)
+        if value is None:
+            return None
+        data = value.encode()
+        if len(data) >= self.compress_threshold:
+            data = zlib.compress(data)
+        return psycopg2.Binary(data)
+
+    def convert_to_cache(self, value, record, validate=True):
+        # cache format: json.dumps(value) or None
+        if isinstance(value, (bytes, memoryview)):
+            data = bytes(value)
+            if data and data[0] == ZLIB_HEADER:
+                data = zlib.decompress(data)
+            return data.decode() or None
+        return super().convert_to_cache(value, record, validate=validate)
@@ -1,11 +1,15 @@
-from odoo import api, fields, models, _
-from odoo.addons.queue_job.fields import JobSerialized
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import ValidationError
 import json
 import ast
+import threading
 from datetime import datetime, timedelta
 import logging
 
+from odoo.addons.multichannel_product.models.product_channel import EXPORT_JOB_COALESCE
+
+from ..fields import CompressedJobSerialized
+
 _logger = logging.getLogger(__name__)
 
 FIELD_RECORD_IN_ODOO_BY_TYPE = {
@@ -13,6 +17,7 @@ FIELD_RECORD_IN_ODOO_BY_TYPE = {
     'import_order': 'order_id',
     'import_shipment': 'shipment_id',
 }
+LINKED_RECORD_FIELDS = ['product_mapping_id', 'order_id', 'shipment_id', 'shipment_service_id']
 
 TYPE2METHOD = {
     'import_product': '_import_product',
@@ -46,7 +51,8 @@ class OmniLog(models.Model):
     display_name = fields.Char(string='Display Name', invisible=True, 
                                compute='_compute_display_name')
     channel_id = fields.Many2one('ecommerce.channel', string='Channel', readonly=True)
-    datas = JobSerialized(readonly=True, base_type=dict)
+    # Payloads are only loaded when they are read, not with the other fields of the logs
+    datas = CompressedJobSerialized(readonly=True, base_type=dict, prefetch=False)
     parent_res_model = fields.Char(string='Parent Resource Model', invisible=True, readonly=True)
     parent_res_id = fields.Many2oneReference('Parent Resource ID', model_field='parent_res_model',
                                              readonly=True, help="The record id this is attached to.")
@@ -73,7 +79,7 @@ class OmniLog(models.Model):
                                ('done', 'Success'),
                                ('failed', 'Failed')], string='Status', default='draft')
 
-    datas_string = fields.Text(string='Datas', compute='_compute_datas_string')
+    datas_string = fields.Text(string='Datas', compute='_compute_datas_string', prefetch=False)
     product_sku = fields.Char(string='Product SKU', readonly=True)
     product_mapping_id = fields.Many2one('product.channel', string='Product Mapping', readonly=True)
     order_id = fields.Many2one('sale.order', string='Order', readonly=True)
@@ -120,28 +126,88 @@ class OmniLog(models.Model):
 
     def update_status(self, status, message):
         self.ensure_one()
-        vals = {}
-        if self.channel_record_id:
-            record = self.env[self.res_model].search([('id_on_channel', '=', self.channel_record_id),
-                                                      ('channel_id.id', '=', self.channel_id.id)], limit=1)
-            field_name = FIELD_RECORD_IN_ODOO_BY_TYPE[self.operation_type]
-            if self.operation_type == 'import_shipment' and self.res_model == 'stock.service.picking':
-                field_name = 'shipment_service_id'
-                
-            if status == 'done' and not record:
-                _logger.error(f"Cannot find record for {self.operation_type} on record {self.channel_record_id}. Maybe there is another log created.")
-                self.unlink()
-                return
-                
-            vals.update({
-                field_name: record.id,
-                'res_id': record.id
-            })
-        vals.update({
-            'status': status,
-            'message': message
-        })
-        self.update(vals)
+        self.update_statuses({self.id: (status, message)})
+
+    @api.model
+    def update_statuses(self, statuses):
+        """
+        Update the status of many logs at once
+        Linked records are searched with one query per resource model and channel,
+        then all logs are written with a single UPDATE
+        :param dict statuses: (status, message) by log ID
+        """
+        logs = self.browse(list(statuses)).exists()
+        records_by_key = self._search_linked_records(logs.filtered('channel_record_id'))
+        rows, to_unlink = [], self.browse()
+        for log in logs:
+            status, message = statuses[log.id]
+            linked_field, record_id = None, None
+            if log.channel_record_id:
+                record_id = records_by_key.get((log.res_model, log.channel_id.id, log.channel_record_id))
+                if status == 'done' and not record_id:
+                    _logger.error(f"Cannot find record for {log.operation_type} on record {log.channel_record_id}. Maybe there is another log created.")
+                    to_unlink |= log
+                    continue
+                linked_field = log._get_linked_record_field()
+            rows.append((log.id, status, message or None, linked_field, record_id))
+
+        if rows:
+            self._write_statuses(rows)
+        to_unlink.unlink()
+
+    @api.model
+    def _write_statuses(self, rows):
+        """
+        Write the statuses and the linked records of many logs with one statement
+        :param list rows: (log ID, status, message, linked record field or None, linked record ID or None)
+        Logs without linked record field keep their linked records
+        """
+        self.flush(['status', 'message', 'is_resolved', 'res_id'] + LINKED_RECORD_FIELDS)
+        linked_columns = ', '.join(
+            f'"{name}" = CASE WHEN v.linked_field = \'{name}\' THEN v.record_id ELSE l."{name}" END'
+            for name in LINKED_RECORD_FIELDS
+        )
+        values = ', '.join(
+            self._cr.mogrify('(%s, %s, %s::text, %s::varchar, %s::int)', row).decode()
+            for row in rows
+        )
+        self._cr.execute(f"""
+            UPDATE "{self._table}" l
+            SET status = v.status,
+                message = v.message,
+                is_resolved = CASE WHEN v.status = 'done' THEN TRUE ELSE l.is_resolved END,
+                res_id = CASE WHEN v.linked_field IS NULL THEN l.res_id ELSE v.record_id END,
+                {linked_columns},
+                write_uid = %s,
+                write_date = (now() at time zone 'UTC')
+            FROM (VALUES {values}) AS v(id, status, message, linked_field, record_id)
+            WHERE l.id = v.id
+        """, (self.env.uid,))
+        self.invalidate_cache(['status', 'message', 'is_resolved', 'res_id', 'write_uid', 'write_date']
+                              + LINKED_RECORD_FIELDS, [row[0] for row in rows])
+
+    @api.model
+    def _search_linked_records(self, logs):
+        """
+        Map (res_model, channel ID, ID on channel) to the ID of the record in Odoo
+        """
+        res = {}
+        logs_by_target = {}
+        for log in logs:
+            logs_by_target.setdefault((log.res_model, log.channel_id.id), set()).add(log.channel_record_id)
+        for (res_model, channel_id), channel_record_ids in logs_by_target.items():
+            records = self.env[res_model].search_read([
+                ('id_on_channel', 'in', list(channel_record_ids)),
+                ('channel_id.id', '=', channel_id),
+            ], ['id_on_channel'])
+            for record in records:
+                res.setdefault((res_model, channel_id, record['id_on_channel']), record['id'])
+        return res
+
+    def _get_linked_record_field(self):
+        if self.operation_type == 'import_shipment' and self.res_model == 'stock.service.picking':
+            return 'shipment_service_id'
+        return FIELD_RECORD_IN_ODOO_BY_TYPE[self.operation_type]
 
     def _import_product(self):
         auto_create_master = self.channel_id.get_setting('auto_create_master_product')
@@ -174,7 +240,8 @@ class OmniLog(models.Model):
         }).with_context(active_ids=[int(self.res_id)]).export()
 
     def _export_mapping(self):
-        self.product_mapping_id.with_delay(channel='root.synching', max_retries=15).export_from_mapping()
+        self.product_mapping_id.with_delay(channel='root.synching', max_retries=15,
+                                           coalesce=EXPORT_JOB_COALESCE).export_from_mapping()
 
     def _export_order(self):
         id = self.res_id
@@ -251,12 +318,13 @@ class OmniLog(models.Model):
             raise ValidationError(_('This action only applies for failed logs which have been resolved'))
         self.update({'is_resolved': False})
 
-    @api.model
-    def create(self, vals):
-        if 'status' in vals and vals['status'] == 'done':
-            vals['is_resolved'] = True
-        record = super().create(vals)
-        return record
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if 'status' in vals and vals['status'] == 'done':
+                vals['is_resolved'] = True
+        records = super().create(vals_list)
+        return records
 
     def write(self, vals):
         if 'status' in vals and vals['status'] == 'done':
@@ -264,12 +332,45 @@ class OmniLog(models.Model):
         res = super().write(vals)
         return res
 
+    def init(self):
+        tools.create_index(self._cr, 'omni_log_status_write_date_index', self._table, ['status', 'write_date'])
+
     @api.model
     def clear_successful_log(self):
         ir_params_sudo = self.env['ir.config_parameter'].sudo()
-        days = int(ir_params_sudo.get_param('keep_log_in_days')) or 30
+        days = int(ir_params_sudo.get_param('keep_log_in_days') or 0) or 30
         deadline = datetime.today() - timedelta(days=days)
-        successful_logs = self.search([("write_date", "<=", deadline), ("status", "=", 'done')], limit=500)
-        if successful_logs:
-            successful_logs.sudo().unlink()
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        self.purge_logs(deadline, statuses=('done',), auto_commit=auto_commit)
         return True
+
+    @api.model
+    def purge_logs(self, deadline, statuses=('done',), batch_size=10000, max_batches=None, auto_commit=False):
+        """
+        Delete logs last written before the deadline in bounded batches of SQL deletes
+        :param datetime deadline: Logs written before this time are deleted
+        :param tuple statuses: Only logs in these statuses are deleted
+        :param int batch_size: Maximum number of logs deleted by a statement
+        :param int max_batches: Stop after this number of batches, no limit by default
+        :param bool auto_commit: Commit after each batch, so a long purge never holds locks for long
+        :return: Number of deleted logs
+        """
+        total, batches = 0, 0
+        while max_batches is None or batches < max_batches:
+            self._cr.execute(f"""
+                DELETE FROM "{self._table}" WHERE id IN (
+                    SELECT id FROM "{self._table}"
+                    WHERE status IN %s AND write_date <= %s
+                    LIMIT %s
+                )
+            """, (tuple(statuses), deadline, batch_size))
+            deleted = self._cr.rowcount
+            total += deleted
+            batches += 1
+            if auto_commit:
+                self._cr.commit()
+            if deleted < batch_size:
+                break
+        self.invalidate_cache()
+        _logger.info('Purged %s logs written before %s', total, deadline)
+        return total
@@ -6,6 +6,8 @@ from odoo import _, api, fields, models, registry, SUPERUSER_ID
 
 _logger = logging.getLogger(__name__)
 
+LOGGED_JOB_STATES = ('done', 'failed')
+
 
 class QueueJob(models.Model):
     _inherit = 'queue.job'
@@ -13,33 +15,66 @@ class QueueJob(models.Model):
     log_id = fields.Many2one('omni.log', string='Omni log')
 
     def write(self, vals):
-        for record in self:
-            def write_log():
+        if vals.get('state') in LOGGED_JOB_STATES:
+            self._collect_log_state_transitions(vals['state'])
+        return super(QueueJob, self).write(vals)
+
+    def _collect_log_state_transitions(self, state):
+        """
+        Collect the final states of the jobs in this transaction
+        Logs of all of them are updated at once after commit
+        """
+        postcommit = self.env.cr.postcommit
+        transitions = postcommit.data.get('omni_log.job_states')
+        if transitions is None:
+            transitions = postcommit.data['omni_log.job_states'] = {}
+            db_name, context = self.env.cr.dbname, self.env.context
+
+            @postcommit.add
+            def write_logs():
                 db_registry = registry(db_name)
                 with db_registry.cursor() as cr:
                     env = api.Environment(cr, SUPERUSER_ID, context)
-                    rec = env['queue.job'].browse(res_id)
-                    if rec.log_id and 'state' in vals:
-                        status = vals['state']
-                        try:
-                            if status in ['done', 'failed']:
-                                if status == "done":
-                                    rec.log_id.update_status(status=status, message=None)
-                                if status == "failed":
-                                    rec.log_id.update_status(status=status, message=rec.exc_info)
-                        except Exception as err:
-                            rec.log_id.update_status(status='failed', message=str(err))
-
+                    env['queue.job']._propagate_log_states(transitions)
                     cr.commit()
 
-            db_name = self.env.cr.dbname
-            context = self.env.context
-            res_id = record.id
-            self.env.cr.postcommit.add(write_log)
-        return super(QueueJob, self).write(vals)
+        transitions.update(dict.fromkeys(self.ids, state))
+
+    @api.model
+    def _propagate_log_states(self, transitions):
+        """
+        Update logs of the jobs in one batch
+        :param dict transitions: final state by job ID
+        """
+        jobs = self.browse(list(transitions)).exists().filtered('log_id')
+        statuses = {
+            job.log_id.id: (transitions[job.id], job.exc_info if transitions[job.id] == 'failed' else None)
+            for job in jobs
+        }
+        if not statuses:
+            return
+        try:
+            with self.env.cr.savepoint():
+                self.env['omni.log'].update_statuses(statuses)
+        except Exception as err:
+            _logger.warning('Cannot update logs in batch: %s', err)
+            for log_id, (status, message) in statuses.items():
+                log = self.env['omni.log'].browse(log_id)
+                try:
+                    with self.env.cr.savepoint():
+                        log.update_status(status=status, message=message)
+                except Exception as err:
+                    log.update({'status': 'failed', 'message': str(err)})
 
     @api.model
     def create(self, vals):
         if 'log_id' in self.env.context:
             vals['log_id'] = int(self.env.context['log_id'])
         return super(QueueJob, self).create(vals)
+
+    @api.model
+    def _prepare_bulk_create_values(self, vals):
+        vals = super(QueueJob, self)._prepare_bulk_create_values(vals)
+        if 'log_id' in self.env.context:
+            vals['log_id'] = int(self.env.context['log_id'])
+        return vals
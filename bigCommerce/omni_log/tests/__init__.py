@@ -0,0 +1,2 @@
+from . import test_omni_log
+from . import test_log_state
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', 'basic_test', '-at_install')
+class TestLogState(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.log_model = self.env['omni.log']
+        self.partner = self.env['res.partner'].create({'name': 'test'})
+
+    def _create_job(self, log):
+        return self.partner.with_context(log_id=log.id).with_delay().write({'name': 'test'}).db_record()
+
+    def test_one_postcommit_callback_per_transaction(self):
+        logs = self.log_model.create([{'operation_type': 'import_others'}] * 2)
+        jobs = [self._create_job(log) for log in logs]
+        postcommit = self.env.cr.postcommit
+        callbacks = len(postcommit._funcs)
+
+        jobs[0].write({'state': 'done'})
+        jobs[1].write({'state': 'failed'})
+
+        self.assertEqual(len(postcommit._funcs), callbacks + 1)
+        self.assertEqual(postcommit.data['omni_log.job_states'], {jobs[0].id: 'done', jobs[1].id: 'failed'})
+
+    def test_propagate_done_and_failed_states(self):
+        done_log, failed_log = self.log_model.create([{'operation_type': 'import_others'}] * 2)
+        done_job = self._create_job(done_log)
+        failed_job = self._create_job(failed_log)
+        failed_job.exc_info = 'Traceback: error'
+
+        self.env['queue.job']._propagate_log_states({done_job.id: 'done', failed_job.id: 'failed'})
+
+        self.assertRecordValues(done_log | failed_log, [
+            {'status': 'done', 'message': False, 'is_resolved': True},
+            {'status': 'failed', 'message': 'Traceback: error', 'is_resolved': False},
+        ])
+
+    def test_update_statuses_of_linked_logs(self):
+        vals = {
+            'operation_type': 'import_order',
+            'res_model': 'sale.order',
+            'channel_record_id': 'missing',
+        }
+        done_log, failed_log = self.log_model.create([vals, vals])
+        other_log = self.log_model.create({'operation_type': 'export_others', 'res_id': 7})
+
+        self.log_model.update_statuses({
+            done_log.id: ('done', None),
+            failed_log.id: ('failed', 'Error'),
+            other_log.id: ('done', None),
+        })
+
+        # a done log whose record cannot be found is a duplicate
+        self.assertFalse(done_log.exists())
+        self.assertRecordValues(failed_log | other_log, [
+            {'status': 'failed', 'message': 'Error', 'order_id': False, 'res_id': 0},
+            {'status': 'done', 'message': False, 'order_id': False, 'res_id': 7},
+        ])
+
+    def test_fallback_per_log_when_batch_fails(self):
+        logs = self.log_model.create([{'operation_type': 'import_others'}] * 2)
+        jobs = [self._create_job(log) for log in logs]
+        log_model_class = type(self.log_model)
+        update_statuses = log_model_class.update_statuses
+
+        def update_one_by_one(model, statuses):
+            if len(statuses) > 1:
+                raise ValueError('batch error')
+            return update_statuses(model, statuses)
+
+        with patch.object(log_model_class, 'update_statuses', autospec=True, side_effect=update_one_by_one):
+            self.env['queue.job']._propagate_log_states({job.id: 'done' for job in jobs})
+
+        self.assertEqual(logs.mapped('status'), ['done', 'done'])
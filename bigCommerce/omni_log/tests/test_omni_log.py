@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from odoo.tests import TransactionCase, tagged
+
+from ..fields import ZLIB_HEADER
+
+
+@tagged('post_install', 'basic_test', '-at_install')
+class TestOmniLog(TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.log_model = self.env['omni.log']
+
+    def _read_column(self, log):
+        self.log_model.flush(['datas'])
+        self.env.cr.execute('SELECT datas FROM omni_log WHERE id = %s', (log.id,))
+        return bytes(self.env.cr.fetchone()[0])
+
+    def test_small_datas_stored_uncompressed(self):
+        datas = {'id': 1, 'name': 'Small'}
+        log = self.log_model.create({'datas': datas})
+
+        self.assertNotEqual(self._read_column(log)[0], ZLIB_HEADER)
+        log.invalidate_cache(['datas'])
+        self.assertEqual(log.datas, datas)
+
+    def test_large_datas_stored_compressed(self):
+        datas = {'id': 1, 'description': 'Large ' * 500}
+        log = self.log_model.create({'datas': datas})
+
+        stored = self._read_column(log)
+        self.assertEqual(stored[0], ZLIB_HEADER)
+        self.assertLess(len(stored), len('Large ' * 500))
+        log.invalidate_cache(['datas'])
+        self.assertEqual(log.datas, datas)
+
+    def test_legacy_datas_read(self):
+        log = self.log_model.create({})
+        self.log_model.flush()
+        # rows written when the column was text are converted as they are
+        self.env.cr.execute(
+            "UPDATE omni_log SET datas = convert_to(%s, 'UTF8') WHERE id = %s",
+            ('{"id": 1, "name": "Legacy"}', log.id),
+        )
+        log.invalidate_cache(['datas'])
+        self.assertEqual(log.datas, {'id': 1, 'name': 'Legacy'})
+
+    def test_purge_logs_in_batches(self):
+        old_logs = self.log_model.create([{'status': 'done'} for _ in range(5)])
+        recent_log = self.log_model.create({'status': 'done'})
+        failed_log = self.log_model.create({'status': 'failed'})
+        self.log_model.flush()
+        deadline = datetime.now() - timedelta(days=30)
+        self.env.cr.execute(
+            'UPDATE omni_log SET write_date = %s WHERE id IN %s',
+            (deadline - timedelta(days=1), tuple((old_logs | failed_log).ids)),
+        )
+
+        deleted = self.log_model.purge_logs(deadline, batch_size=2, max_batches=2)
+        self.assertEqual(deleted, 4)
+        self.assertEqual(len(old_logs.exists()), 1)
+
+        deleted = self.log_model.purge_logs(deadline, batch_size=2)
+        self.assertEqual(deleted, 1)
+        self.assertFalse(old_logs.exists())
+        self.assertTrue(recent_log.exists())
+        self.assertTrue(failed_log.exists())
@@ -1,10 +1,11 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
-from operator import itemgetter
-from itertools import groupby
+import re
+import hashlib
 
 from odoo import api, fields, models, _
+from odoo.addons.queue_job.job import DelayableBatch
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -42,6 +43,67 @@ def format_phone(phone_number, country_code):
         return phone_number
 
 
+def normalize_phone(phone_number, country_code):
+    """
+    Normalize phone number to E.164, or keep its digits only if it cannot be parsed
+    """
+    if not phone_number:
+        return ''
+    if _phonenumbers_lib_imported:
+        try:
+            phone_nbr = phonenumbers.parse(phone_number, region=country_code)
+        except phonenumbers.phonenumberutil.NumberParseException:
+            phone_nbr = None
+        if phone_nbr and phonenumbers.is_valid_number(phone_nbr):
+            return phonenumbers.format_number(phone_nbr, phonenumbers.PhoneNumberFormat.E164)
+    return re.sub(r'[^0-9+]', '', phone_number)
+
+
+def normalize_text(value):
+    return ' '.join(str(value).lower().split()) if value else ''
+
+
+def make_address_fingerprint(address, country_code='US'):
+    """
+    Make a fingerprint of the normalized address, used to look up matching contacts with an indexed equality
+    :param dict address: with name, phone, email, street, street2, city, zip, country_id (int) and state_id (int)
+    :param str country_code: the region used to parse the phone number
+    :rtype: str
+    """
+    parts = (
+        normalize_text(address.get('name')),
+        normalize_phone(address.get('phone'), country_code),
+        normalize_text(address.get('email')),
+        normalize_text(address.get('street')),
+        normalize_text(address.get('street2')),
+        normalize_text(address.get('city')),
+        normalize_text(address.get('zip')).replace(' ', ''),
+        str(address.get('country_id') or ''),
+        str(address.get('state_id') or ''),
+    )
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+
+def get_record_address_fingerprint(record):
+    """
+    Fingerprint of the address of a `res.partner` or `customer.channel` record
+    """
+    return make_address_fingerprint({
+        'name': record.name,
+        'phone': record.phone,
+        'email': record.email,
+        'street': record.street,
+        'street2': record.street2,
+        'city': record.city,
+        'zip': record.zip,
+        'country_id': record.country_id.id,
+        'state_id': record.state_id.id,
+    }, record.country_id.code or 'US')
+
+
+ADDRESS_FINGERPRINT_FIELDS = ('name', 'phone', 'email', 'street', 'street2', 'city', 'zip', 'country_id', 'state_id')
+
+
 def compare_address(record, address, country_code='us'):
     """
     Compare existing address with the newly imported one
@@ -83,6 +145,7 @@ class CustomerChannel(models.Model):
                                domain="[('country_id', '=?', country_id)]")
 
     display_address = fields.Text(string='Address', compute='_get_display_address')
+    address_fingerprint = fields.Char(compute='_compute_address_fingerprint', store=True, index=True)
 
     order_count = fields.Integer(compute='_compute_order_count')
     
@@ -90,6 +153,11 @@ class CustomerChannel(models.Model):
         ('id_on_channel_uniq', 'unique(id_on_channel, channel_id)', 'ID must be unique per Channel!'),
     ]
 
+    @api.depends(*ADDRESS_FINGERPRINT_FIELDS)
+    def _compute_address_fingerprint(self):
+        for record in self:
+            record.address_fingerprint = get_record_address_fingerprint(record)
+
     def _compute_order_count(self):
         for record in self:
             order_count = self.env['sale.order'].sudo().search_count([('channel_id.id', '=', record.channel_id.id),
@@ -138,12 +206,14 @@ class CustomerChannel(models.Model):
         start = 0
         step = 10
         uuids = []
+        batch = DelayableBatch()
         while start < len(vals_list):
             end = start + step
             pattern = vals_list[start:end]
             start = end
-            uuids.append(self.with_delay()._sync_in_queue_job(pattern,
-                                                              channel_id).uuid)
+            uuids.append(self.with_delay(batch=batch)._sync_in_queue_job(pattern,
+                                                                         channel_id).uuid)
+        batch.enqueue()
         return uuids
 
     @api.model
@@ -181,33 +251,26 @@ class CustomerChannel(models.Model):
         existed_customers = self.env['customer.channel'].sudo().search(
             [('id_on_channel', 'in', ids), ('channel_id.id', '=', channel_id), ('id_on_channel', '!=', '0')])
 
-        guest_customers = list(filter(lambda c: str(c['id']) == '0', customers))
-        comparing_list = list()
-        for customer in guest_customers:
-            for f in ('email', 'name', 'phone', 'street', 'city', 'zip'):
-                # Any address must have at least one of these fields
-                # If not, it is not worth to be recorded
-                if customer.get(f):
-                    comparing_list.append((f, customer[f]))
-                    break
-        if comparing_list:
+        # Any address must have at least one of these fields
+        # If not, it is not worth to be recorded
+        guest_customers = [
+            c for c in customers
+            if str(c['id']) == '0' and any(c.get(f) for f in ('email', 'name', 'phone', 'street', 'city', 'zip'))
+        ]
+        if guest_customers:
             country_codes = self.env['res.country'].sudo().search_read(
                 [('id', 'in', [add.get('country_id') for add in customers if add])],
                 ['id', 'code']
             )
             country_codes = {cc['id']: cc['code'] for cc in country_codes}
-
-            guest_domain = [(f, 'in', tuple(map(itemgetter(1), values)))
-                            for f, values in groupby(sorted(comparing_list, key=itemgetter(0)), key=itemgetter(0))]
-            guest_domain = [('channel_id.id', '=', channel_id)] + ['|'] * (len(guest_domain) - 1) + guest_domain
-            potential_customers = self.env['customer.channel'].sudo().search(guest_domain)
-            for customer in guest_customers:
-                compared = {**customer, **{
-                    'street_1': customer.get('street') or False,
-                    'street_2': customer.get('street2') or False,
-                }}
-                existed_customers |= potential_customers.filtered(
-                    lambda c: compare_address(c, compared, country_codes.get(compared.get('country_id')) or 'US'))
+            fingerprints = [
+                make_address_fingerprint(customer, country_codes.get(customer.get('country_id')) or 'US')
+                for customer in guest_customers
+            ]
+            existed_customers |= self.env['customer.channel'].sudo().search([
+                ('channel_id', '=', channel_id),
+                ('address_fingerprint', 'in', fingerprints),
+            ])
 
         existed_ids = existed_customers.mapped('id_on_channel')
         new_customers = list(filter(lambda c: str(c['id']) not in existed_ids, customers))
@@ -256,6 +319,23 @@ class ResPartner(models.Model):
         return self.env.ref('base.us').id
 
     country_id = fields.Many2one(default=_get_default_country_id)
+    address_fingerprint = fields.Char(compute='_compute_address_fingerprint', store=True, index=True)
+
+    @api.depends(*ADDRESS_FINGERPRINT_FIELDS)
+    def _compute_address_fingerprint(self):
+        for record in self:
+            record.address_fingerprint = get_record_address_fingerprint(record)
+
+    def search_by_address(self, address, contact_type, country_code='US'):
+        """
+        Search the sub-contacts of this partner having the same normalized address
+        :param dict address: see `make_address_fingerprint`
+        """
+        return self.sudo().search([
+            ('parent_id', 'in', self.ids),
+            ('type', '=', contact_type),
+            ('address_fingerprint', '=', make_address_fingerprint(address, country_code)),
+        ])
 
     def _get_contact_name(self, partner, name):
         if not partner.sudo().parent_id.is_company and not partner.commercial_company_name:
@@ -298,16 +378,16 @@ class ResPartner(models.Model):
         :param domain:
         :return:
         """
-        shipping_addresses = self.child_ids.filtered(lambda c: c.type == 'delivery'
-                                                               and c.name == domain['name']
-                                                               and c.street == domain['street']
-                                                               and c.street2 == domain['street2']
-                                                               and c.city == domain['city']
-                                                               and c.state_id.name == domain['state']
-                                                               and c.zip == domain['zip']
-                                                               and c.country_id.code == domain['country_code']
-                                                               and c.email == domain['email']
-                                                               and c.phone == domain['phone'])
+        country = self.env['res.country'].sudo().search([('code', '=', domain['country_code'])], limit=1)
+        state = self.env['res.country.state'].sudo().search([
+            ('country_id', '=', country.id),
+            ('name', '=', domain['state']),
+        ], limit=1)
+        shipping_addresses = self.search_by_address({
+            **domain,
+            'country_id': country.id,
+            'state_id': state.id,
+        }, 'delivery', country.code or 'US')
 
         if not shipping_addresses:
             return self
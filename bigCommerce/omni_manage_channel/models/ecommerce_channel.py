@@ -343,7 +343,7 @@ class EcommerceChannel(models.Model):
                 auto_create_master=auto_create_master,
             )
             if uuids:
-                uuid = self.with_delay(priority=12, max_retries=100).done_synching(
+                uuid = self.with_delay(priority=12, max_retries=100, depends_on=uuids).done_synching(
                     uuids=uuids,
                     update_last_sync_product=update_last_sync_product
                 ).uuid
@@ -442,6 +442,17 @@ class EcommerceChannel(models.Model):
             return method()
         return True
 
+    @api.model
+    def _get_finished_jobs(self, uuids):
+        """
+        Jobs of the given UUIDs, which must all be done or failed
+        Deleted jobs are skipped, the job runner does not wait for them either
+        """
+        records = self.env['queue.job'].sudo().search([('uuid', 'in', uuids)])
+        if any(record.state not in ['done', 'failed'] for record in records):
+            raise RetryableJobError('Must be retried later')
+        return records
+
     @api.model
     def _done_synching(self, model, uuids):
         """
@@ -451,9 +462,7 @@ class EcommerceChannel(models.Model):
         :return:
         """
         ids = []
-        records = self.env['queue.job'].sudo().search([('uuid', 'in', uuids), ('state', 'in', ['done', 'failed'])])
-        if len(records) != len(uuids):
-            raise RetryableJobError('Must be retried later')
+        records = self._get_finished_jobs(uuids)
         for record in records:
             if ids:
                 ids.extend(safe_eval(record.result))
@@ -478,7 +487,7 @@ class EcommerceChannel(models.Model):
                                      all_records=True)
 
             if uuids:
-                return self.with_delay(priority=30, max_retries=15)._done_synching(model, uuids).uuid
+                return self.with_delay(priority=30, max_retries=15, depends_on=uuids)._done_synching(model, uuids).uuid
         return None
 
     def mapping_data(self, model, vals):
@@ -491,12 +500,10 @@ class EcommerceChannel(models.Model):
 
     @api.model
     def _check_dependence(self, uuids, update_last_sync_product=False):
-        records = self.env['queue.job'].sudo().search([('uuid', 'in', uuids), ('state', 'in', ['done', 'failed'])])
-        if len(records) != len(uuids):
-            raise RetryableJobError('Must be retried later')
+        self._get_finished_jobs(uuids)
         uuids = []
         uuids.append(self.get_data("sale.order"))
-        return self.with_delay(priority=50, max_retries=100)\
+        return self.with_delay(priority=50, max_retries=100, depends_on=uuids)\
             .done_synching(uuids=uuids, update_last_sync_product=update_last_sync_product).uuid
 
     def run_sync_data(self, models=None):
@@ -509,7 +516,7 @@ class EcommerceChannel(models.Model):
                 uuid = self.get_data(m)
                 if uuid is not None:
                     uuids.append(uuid)
-            uuid = self.with_delay(priority=30, max_retries=100)._check_dependence(
+            uuid = self.with_delay(priority=30, max_retries=100, depends_on=uuids)._check_dependence(
                 uuids=uuids,
                 update_last_sync_product=update_last_sync_product,
             )
@@ -518,7 +525,7 @@ class EcommerceChannel(models.Model):
                 uuid = self.get_data(m)
                 if uuid is not None:
                     uuids.append(uuid)
-            uuid = self.with_delay(priority=50, max_retries=100).done_synching(
+            uuid = self.with_delay(priority=50, max_retries=100, depends_on=uuids).done_synching(
                 uuids=uuids,
                 update_last_sync_product=update_last_sync_product,
             ).uuid
@@ -532,9 +539,7 @@ class EcommerceChannel(models.Model):
         :return:
         """
         self.ensure_one()
-        records = self.env['queue.job'].sudo().search([('uuid', 'in', uuids), ('state', 'in', ['done', 'failed'])])
-        if len(records) != len(uuids):
-            raise RetryableJobError('Retry job in done_syncing (omni_manage_channel) ')
+        records = self._get_finished_jobs(uuids)
 
         vals = {'is_in_syncing': False, 'done_job_uuid': False}
 
@@ -1,7 +1,8 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
-from odoo.addons.omni_manage_channel.models.customer_channel import compare_address, _phonenumbers_lib_imported
+from odoo.addons.omni_manage_channel.models.customer_channel import compare_address, make_address_fingerprint,\
+    _phonenumbers_lib_imported
 from .common import ListingTestCommon, tagged
 
 
@@ -106,3 +107,27 @@ class TestCustomerChannel(ListingTestCommon):
             'country_id': '',
             'state_id': '',
         }))
+
+    def test_match_guest_customer_by_address_fingerprint(self):
+        channel = self.env['ecommerce.channel'].search([], limit=1)
+        address = {
+            'name': 'Isabelle F Carr',
+            'phone': '912-314-5149',
+            'email': 'MsIsabelle@test.mail',
+            'street': '959  Adamsville Road',
+            'street2': 'Apt 242',
+            'city': 'Metter',
+            'zip': '30439',
+            'country_id': self.env.ref('base.us').id,
+            'state_id': self.env.ref('base.state_us_11').id,
+        }
+        customer = self.env['customer.channel'].create({
+            **address,
+            'email': 'msisabelle@test.mail',
+            'street': '959 Adamsville Road',
+            'channel_id': channel.id,
+        })
+        self.assertEqual(customer.address_fingerprint, make_address_fingerprint(address))
+
+        record_ids = self.env['customer.channel']._sync_in_queue_job([{**address, 'id': 0}], channel.id)
+        self.assertIn(customer.id, record_ids)
@@ -1,9 +1,12 @@
 # Copyright © 2020 Novobi, LLC
 # See LICENSE file for full copyright and licensing details.
 
+from unittest.mock import Mock, patch
+
 from odoo.tests.common import TransactionCase, tagged
 
 from .utils import get_data_path
+from ..utils.common import ImageCache, ImageUtils
 
 
 @tagged('post_install', 'basic_test', '-at_install')
@@ -18,3 +21,19 @@ class TestUtils(TransactionCase):
         self.assertTrue(res2.endswith('data/demo2.csv'))
         self.assertIn(res2_p, __file__)
         self.assertNotEqual(res2_p, __file__)
+
+    def test_get_images_with_cache(self):
+        def get(url, headers=None, timeout=None):
+            if headers:
+                return Mock(status_code=304, ok=False)
+            return Mock(status_code=200, ok=True, content=url.encode(), headers={'ETag': '"1"'})
+
+        engine = Mock(get=Mock(side_effect=get))
+        with patch.object(ImageUtils, 'engine', engine), patch.object(ImageUtils, 'cache', ImageCache()):
+            res = ImageUtils.get_safe_images_b64(['https://a', 'https://b', 'https://a', None])
+            self.assertEqual(res, {'https://a': b'aHR0cHM6Ly9h', 'https://b': b'aHR0cHM6Ly9i'})
+            self.assertEqual(engine.get.call_count, 2)
+
+            res = ImageUtils.get_safe_images_b64(['https://a'])
+            self.assertEqual(res, {'https://a': b'aHR0cHM6Ly9h'})
+            engine.get.assert_called_with('https://a', headers={'If-None-Match': '"1"'}, timeout=ImageUtils.timeout)
@@ -2,13 +2,102 @@
 # See LICENSE file for full copyright and licensing details.
 
 import base64
+import hashlib
+import threading
 import requests
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+
+IMAGE_FETCH_WORKERS = 8
+
+
+class ImageCache:
+    """
+    Keep downloaded images in the memory of the worker process, shared by all jobs.
+    Contents are stored once per digest, URLs only point to a digest with the validators of the response,
+    so fetching an unchanged image again is a conditional request without body.
+    """
+    max_size = 64 * 2**20
+
+    def __init__(self, max_size=None):
+        if max_size is not None:
+            self.max_size = max_size
+        self._lock = threading.Lock()
+        self._urls = OrderedDict()
+        self._contents = {}
+        self._references = {}
+        self._size = 0
+
+    def get_validators(self, url):
+        """
+        Headers to make a conditional request for the cached version of the URL
+        """
+        with self._lock:
+            entry = self._urls.get(url)
+        if not entry:
+            return {}
+        _digest, etag, last_modified = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def get(self, url):
+        with self._lock:
+            entry = self._urls.get(url)
+            if not entry:
+                return None
+            self._urls.move_to_end(url)
+            return self._contents.get(entry[0])
+
+    def put(self, url, content, etag=None, last_modified=None):
+        """
+        Only responses with validators are kept, the others cannot be checked for changes
+        """
+        if not (etag or last_modified) or len(content) > self.max_size:
+            return
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._discard(url)
+            self._urls[url] = (digest, etag, last_modified)
+            if digest not in self._contents:
+                self._contents[digest] = content
+                self._size += len(content)
+            self._references[digest] = self._references.get(digest, 0) + 1
+            while self._size > self.max_size:
+                self._discard(next(iter(self._urls)))
+
+    def _discard(self, url):
+        entry = self._urls.pop(url, None)
+        if not entry:
+            return
+        digest = entry[0]
+        self._references[digest] -= 1
+        if not self._references[digest]:
+            del self._references[digest]
+            self._size -= len(self._contents.pop(digest))
+
+
+def _make_image_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=IMAGE_FETCH_WORKERS, pool_maxsize=IMAGE_FETCH_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class ImageUtils:
     ERROR_MSG = 'Could not get image content'
 
-    engine = requests
+    engine = _make_image_session()
+    cache = ImageCache()
+    timeout = (10, 60)
 
     @classmethod
     def get_safe_image_b64(cls, image_url_or_image):
@@ -17,6 +106,18 @@ class ImageUtils:
         except ValueError:
             return None
 
+    @classmethod
+    def get_safe_images_b64(cls, image_urls, max_workers=IMAGE_FETCH_WORKERS):
+        """
+        Fetch images concurrently, each distinct URL is only fetched once
+        Return a mapping from URL to the image content (in b64 encoded), None if it could not be fetched
+        """
+        urls = list(dict.fromkeys(filter(None, image_urls)))
+        if len(urls) <= 1:
+            return {url: cls.get_safe_image_b64(url) for url in urls}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return dict(zip(urls, executor.map(cls.get_safe_image_b64, urls)))
+
     @classmethod
     def get_image_b64(cls, image_url_or_image):
         """
@@ -64,8 +165,15 @@ class ImageUtils:
 
     @classmethod
     def get_image_content_from_url(cls, url):
-        response = cls.engine.get(url)
+        response = cls.engine.get(url, headers=cls.cache.get_validators(url), timeout=cls.timeout)
+        if response.status_code == 304:
+            content = cls.cache.get(url)
+            if content is not None:
+                return content
+            # The cached content is evicted in the meantime
+            response = cls.engine.get(url, timeout=cls.timeout)
         if response.ok:
+            cls.cache.put(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
             return response.content
         response.raise_for_status()
 
@@ -3,7 +3,7 @@
 
 {
     "name": "Job Queue",
-    "version": "15.0.1.0.0",
+    "version": "15.0.1.1.0",
     "author": "Camptocamp,ACSONE SA/NV,Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/queue",
     "license": "LGPL-3",
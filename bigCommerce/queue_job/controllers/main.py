@@ -4,6 +4,7 @@
 
 import logging
 import traceback
+from datetime import datetime
 from io import StringIO
 
 from psycopg2 import OperationalError
@@ -13,7 +14,7 @@ from odoo import SUPERUSER_ID, _, api, http, registry, tools
 from odoo.service.model import PG_CONCURRENCY_ERRORS_TO_RETRY
 
 from ..exception import FailedJobError, NothingToDoJob, RetryableJobError
-from ..job import ENQUEUED, Job
+from ..job import DONE, ENQUEUED, PENDING, Job
 
 _logger = logging.getLogger(__name__)
 
@@ -35,6 +36,117 @@ class RunJobController(http.Controller):
         env.cr.commit()
         _logger.debug("%s done", job)
 
+    def _perform_batched_jobs(self, env, job):
+        """Run more pending jobs of the same function in this request
+
+        Only for commit-free job functions with more than 1 job per run: a
+        job committing the transaction would release the savepoints of the
+        batch. The jobs are claimed with ``SKIP LOCKED``, so concurrent
+        workers never claim the same jobs. Each job is run in its own
+        savepoint and succeeds or fails on its own, the states are stored for
+        all of them at once.
+
+        The batch is run one job after the other in the worker of the
+        requested job, so it never runs more jobs at the same time than the
+        channel capacity. The claimed jobs count as running in their channel
+        until the batch is stored.
+        """
+        config = job.job_config
+        if config.batch_size <= 1 or not config.commit_free:
+            return
+        jobs = self._claim_batched_jobs(env, job, config.batch_size - 1)
+        if not jobs:
+            return
+        for job_ in jobs:
+            job_.set_started()
+        self._store_jobs(env, jobs)
+        env.cr.commit()
+        _logger.debug("%s started in a batch after %s", jobs, job)
+
+        for job_ in jobs:
+            self._try_perform_batched_job(env, job_)
+        self._store_jobs(env, jobs)
+        env["base"].flush()
+        env.cr.commit()
+        _logger.debug("%s done in a batch after %s", jobs, job)
+
+    def _claim_batched_jobs(self, env, job, limit):
+        """Lock pending jobs of the same function which can run now"""
+        env.cr.execute(
+            "SELECT uuid FROM queue_job "
+            "WHERE state = %s AND channel_method_name = %s AND channel = %s "
+            "AND (eta IS NULL OR eta <= now() at time zone 'utc') "
+            "AND (depends_on IS NULL OR depends_on = '[]') "
+            "ORDER BY priority, date_created "
+            "LIMIT %s FOR UPDATE SKIP LOCKED",
+            (
+                PENDING,
+                env["queue.job.function"].job_function_name(
+                    job.model_name, job.method_name
+                ),
+                job.channel,
+                limit,
+            ),
+        )
+        return [Job.load(env, job_uuid) for (job_uuid,) in env.cr.fetchall()]
+
+    def _try_perform_batched_job(self, env, job):
+        try:
+            self._perform_in_savepoint(env, job)
+            job.set_done()
+        except NothingToDoJob as err:
+            job.set_done(str(err) or _("Job interrupted and set to Done: nothing to do."))
+        except RetryableJobError as err:
+            job.postpone(result=str(err), seconds=err.seconds)
+            job.set_pending(reset_retry=False)
+            _logger.debug("%s postponed", job)
+        except OperationalError as err:
+            if err.pgcode not in PG_CONCURRENCY_ERRORS_TO_RETRY:
+                self._set_batched_job_failed(job)
+            else:
+                job.postpone(
+                    result=tools.ustr(err.pgerror, errors="replace"), seconds=PG_RETRY
+                )
+                job.set_pending(reset_retry=False)
+                _logger.debug("%s OperationalError, postponed", job)
+        except (FailedJobError, Exception):
+            self._set_batched_job_failed(job)
+
+    def _perform_in_savepoint(self, env, job):
+        try:
+            with env.cr.savepoint():
+                job.perform()
+        except Exception:
+            # the cache may hold values rolled back with the savepoint
+            env.clear()
+            raise
+
+    def _set_batched_job_failed(self, job):
+        buff = StringIO()
+        traceback.print_exc(file=buff)
+        _logger.error(buff.getvalue())
+        job.set_failed(exc_info=buff.getvalue())
+
+    def _store_jobs(self, env, jobs):
+        """Store the jobs with one write for all jobs having the same values"""
+        job_model = env["queue.job"].sudo()
+        job_model = job_model.with_context(_job_edit_sentinel=job_model.EDIT_SENTINEL)
+        records = job_model.search([("uuid", "in", [job_.uuid for job_ in jobs])])
+        ids_by_uuid = {record.uuid: record.id for record in records}
+        ids_by_vals = {}
+        for job_ in jobs:
+            vals = job_._prepare_common_stored_values()
+            # datetimes are stored to the second
+            key = tuple(
+                sorted(
+                    (name, value.replace(microsecond=0) if isinstance(value, datetime) else value)
+                    for name, value in vals.items()
+                )
+            )
+            ids_by_vals.setdefault(key, []).append(ids_by_uuid[job_.uuid])
+        for key, ids in ids_by_vals.items():
+            job_model.browse(ids).write(dict(key))
+
     @http.route("/queue_job/runjob", type="http", auth="none", save_session=False)
     def runjob(self, db, job_uuid, **kw):
         http.request.session.db = db
@@ -104,6 +216,8 @@ class RunJobController(http.Controller):
                 job.store()
             raise
 
+        if job.state == DONE:
+            self._perform_batched_jobs(env, job)
         return ""
 
     @http.route("/queue_job/create_test_job", type="http", auth="user")
@@ -14,6 +14,7 @@ import odoo
 
 from .exception import FailedJobError, NoSuchJobError, RetryableJobError
 
+WAIT_DEPENDENCIES = "wait_dependencies"
 PENDING = "pending"
 ENQUEUED = "enqueued"
 DONE = "done"
@@ -21,6 +22,7 @@ STARTED = "started"
 FAILED = "failed"
 
 STATES = [
+    (WAIT_DEPENDENCIES, "Wait Dependencies"),
     (PENDING, "Pending"),
     (ENQUEUED, "Enqueued"),
     (STARTED, "Started"),
@@ -59,6 +61,9 @@ class DelayableRecordset(object):
         description=None,
         channel=None,
         identity_key=None,
+        depends_on=None,
+        batch=None,
+        coalesce=None,
     ):
         self.recordset = recordset
         self.priority = priority
@@ -67,6 +72,9 @@ class DelayableRecordset(object):
         self.description = description
         self.channel = channel
         self.identity_key = identity_key
+        self.depends_on = depends_on
+        self.batch = batch
+        self.coalesce = coalesce
 
     def __getattr__(self, name):
         if name in self.recordset:
@@ -78,8 +86,7 @@ class DelayableRecordset(object):
         recordset_method = getattr(self.recordset, name)
 
         def delay(*args, **kwargs):
-            return Job.enqueue(
-                recordset_method,
+            options = dict(
                 args=args,
                 kwargs=kwargs,
                 priority=self.priority,
@@ -88,7 +95,12 @@ class DelayableRecordset(object):
                 description=self.description,
                 channel=self.channel,
                 identity_key=self.identity_key,
+                depends_on=self.depends_on,
+                coalesce=self.coalesce,
             )
+            if self.batch is not None:
+                return self.batch.delay(recordset_method, **options)
+            return Job.enqueue(recordset_method, **options)
 
         return delay
 
@@ -100,6 +112,45 @@ class DelayableRecordset(object):
     __repr__ = __str__
 
 
+class DelayableBatch(object):
+    """Collect delayed method calls and enqueue all of them at once
+
+    Usage::
+
+        batch = DelayableBatch()
+        for record in records:
+            job_ = record.with_delay(priority=20, batch=batch).export_record()
+            # job_.uuid is already known, but the job is not stored yet
+        batch.enqueue()
+
+    The jobs are inserted with a single query, which is much faster than
+    enqueuing them one by one when there are thousands of them.
+    Jobs having the same identity key as a pending job, or as a previous
+    job of the batch, are not enqueued.
+    """
+
+    def __init__(self):
+        self.jobs = []
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def delay(self, func, **options):
+        """Add a job for the method to the batch and return it (not stored)"""
+        job_ = Job.build(func, **options)
+        self.jobs.append(job_)
+        return job_
+
+    def enqueue(self):
+        """Store the jobs of the batch
+
+        Return the jobs in the same order as they were added, a job dropped
+        because of its identity key is replaced by the existing one.
+        """
+        jobs, self.jobs = self.jobs, []
+        return Job.enqueue_many(jobs)
+
+
 def identity_exact(job_):
     """Identity function using the model, method and all arguments as key
 
@@ -145,6 +196,22 @@ def identity_exact(job_):
     return hasher.hexdigest()
 
 
+def identity_record(job_):
+    """Identity function using the model, method and records as key
+
+    Unlike :func:`identity_exact`, the arguments are not part of the key, it
+    is the default key of coalesced jobs (see the ``coalesce`` argument of
+    ``with_delay()``): a newer call on the same records replaces the
+    arguments of the pending job.
+    """
+    hasher = hashlib.sha1()
+    hasher.update(job_.model_name.encode("utf-8"))
+    hasher.update(job_.method_name.encode("utf-8"))
+    hasher.update(str(sorted(job_.recordset.ids)).encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
 class Job(object):
     """A Job is a task to execute. It is the in-memory representation of a job.
 
@@ -242,6 +309,13 @@ class Job(object):
         be added to a channel if the existing job with the same key is not yet
         started or executed.
 
+    .. attribute::coalesce
+
+        Debounce window in seconds. When set, the job replaces the arguments
+        of the pending job with the same identity key instead of being added.
+        The pending job keeps its eta, the end of the window started by the
+        first job.
+
     """
 
     @classmethod
@@ -279,6 +353,7 @@ class Job(object):
             description=stored.name,
             channel=stored.channel,
             identity_key=stored.identity_key,
+            depends_on=stored.depends_on,
         )
 
         if stored.date_created:
@@ -304,6 +379,51 @@ class Job(object):
         job_.worker_pid = stored.worker_pid
         return job_
 
+    def job_record_to_coalesce(self):
+        """Pending job with the same key which this job can replace
+
+        The job is locked, so the jobrunner cannot enqueue it before it is
+        replaced. A job locked by someone else is about to be enqueued: it is
+        not returned and a new job is added instead.
+        """
+        self.env["queue.job"].flush(["identity_key", "state"])
+        self.env.cr.execute(
+            "SELECT id FROM queue_job WHERE identity_key = %s AND state = %s "
+            "LIMIT 1 FOR UPDATE SKIP LOCKED",
+            (self.identity_key, PENDING),
+        )
+        return self.env["queue.job"].sudo().browse(
+            [row[0] for row in self.env.cr.fetchall()]
+        )
+
+    def coalesce_into(self, db_record):
+        """Give the arguments of this job to a pending job
+
+        The pending job keeps its eta, so it runs at the latest at the end of
+        the window started by the first job, however often it is replaced.
+        """
+        edit_sentinel = db_record.EDIT_SENTINEL
+        db_record.with_context(_job_edit_sentinel=edit_sentinel).write(
+            self._prepare_coalesced_values(db_record)
+        )
+
+    def _coalesce_into_job(self, job_):
+        """Give the arguments of this job to a job not stored yet"""
+        job_.args = self.args
+        job_.kwargs = self.kwargs
+        job_._description = self._description
+        job_.priority = min(self.priority, job_.priority)
+        job_.max_retries = self.max_retries
+
+    def _prepare_coalesced_values(self, db_record):
+        return {
+            "name": self.description,
+            "args": self.args,
+            "kwargs": self.kwargs,
+            "priority": min(self.priority, db_record.priority),
+            "max_retries": self.max_retries,
+        }
+
     def job_record_with_same_identity_key(self):
         """Check if a job to be executed with the same key exists."""
         existing = (
@@ -331,6 +451,8 @@ class Job(object):
         description=None,
         channel=None,
         identity_key=None,
+        depends_on=None,
+        coalesce=None,
     ):
         """Create a Job and enqueue it in the queue. Return the job uuid.
 
@@ -338,7 +460,8 @@ class Job(object):
         from the ones to pass to the job function.
 
         If the identity key is the same than the one in a pending job,
-        no job is created and the existing job is returned
+        no job is created and the existing job is returned. When the job is
+        coalesced, the existing job gets the arguments of the new one.
 
         """
         new_job = cls(
@@ -351,8 +474,18 @@ class Job(object):
             description=description,
             channel=channel,
             identity_key=identity_key,
+            depends_on=depends_on,
+            coalesce=coalesce,
         )
-        if new_job.identity_key:
+        if new_job.coalesce:
+            existing = new_job.job_record_to_coalesce()
+            if existing:
+                new_job.coalesce_into(existing)
+                _logger.debug(
+                    "a job has been coalesced into job %s", existing.uuid
+                )
+                return Job._load_from_db_record(existing)
+        elif new_job.identity_key:
             existing = new_job.job_record_with_same_identity_key()
             if existing:
                 _logger.debug(
@@ -373,6 +506,100 @@ class Job(object):
         )
         return new_job
 
+    @classmethod
+    def build(cls, func, **options):
+        """Create a Job without storing it, see :meth:`enqueue_many`"""
+        return cls(func=func, **options)
+
+    @classmethod
+    def enqueue_many(cls, jobs):
+        """Store many jobs created with :meth:`build` at once
+
+        Jobs with the same identity key as a pending job, or as a job before
+        them in the list, are not stored. The existing jobs are returned in
+        their place. Coalesced jobs give their arguments to the pending job,
+        or to the job before them in the list, as :meth:`enqueue` does.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        existing_by_key = cls._existing_jobs_by_identity_key(
+            [job_ for job_ in jobs if not job_.coalesce]
+        )
+        coalesce_targets = {}
+        result = []
+        new_jobs = []
+        for job_ in jobs:
+            key = job_.identity_key
+            if job_.coalesce:
+                target = coalesce_targets.get(key)
+                if target is None:
+                    existing = job_.job_record_to_coalesce()
+                    if existing:
+                        target = cls._load_from_db_record(existing)
+                if target is None:
+                    coalesce_targets[key] = job_
+                    new_jobs.append(job_)
+                    result.append(job_)
+                    continue
+                if target in new_jobs:
+                    job_._coalesce_into_job(target)
+                else:
+                    job_.coalesce_into(target.db_record())
+                    coalesce_targets[key] = target
+                _logger.debug("a job has been coalesced into job %s", target.uuid)
+                result.append(target)
+                continue
+            if key and key in existing_by_key:
+                _logger.debug(
+                    "a job has not been enqueued due to having "
+                    "the same identity key (%s) than job %s",
+                    key,
+                    existing_by_key[key].uuid,
+                )
+                result.append(existing_by_key[key])
+                continue
+            if key:
+                existing_by_key[key] = job_
+            new_jobs.append(job_)
+            result.append(job_)
+        if new_jobs:
+            vals_list = [
+                job_.env["queue.job"]._prepare_bulk_create_values(
+                    job_._prepare_create_stored_values()
+                )
+                for job_ in new_jobs
+            ]
+            job_model = new_jobs[0].env["queue.job"]
+            edit_sentinel = job_model.EDIT_SENTINEL
+            job_model.with_context(_job_edit_sentinel=edit_sentinel).sudo()._bulk_create(
+                vals_list
+            )
+            _logger.debug("enqueued %d jobs in a batch", len(new_jobs))
+        return result
+
+    @classmethod
+    def _existing_jobs_by_identity_key(cls, jobs):
+        keys = {job_.identity_key for job_ in jobs if job_.identity_key}
+        if not keys:
+            return {}
+        existing = (
+            jobs[0]
+            .env["queue.job"]
+            .sudo()
+            .search(
+                [
+                    ("identity_key", "in", list(keys)),
+                    ("state", "in", [PENDING, ENQUEUED]),
+                ]
+            )
+        )
+        result = {}
+        for record in existing:
+            if record.identity_key not in result:
+                result[record.identity_key] = cls._load_from_db_record(record)
+        return result
+
     @staticmethod
     def db_record_from_uuid(env, job_uuid):
         model = env["queue.job"].sudo()
@@ -391,6 +618,8 @@ class Job(object):
         description=None,
         channel=None,
         identity_key=None,
+        depends_on=None,
+        coalesce=None,
     ):
         """Create a Job
 
@@ -415,6 +644,14 @@ class Job(object):
         :param identity_key: A hash to uniquely identify a job, or a function
                              that returns this hash (the function takes the job
                              as argument)
+        :param depends_on: UUIDs of the jobs which must be done or failed
+                           before this job can run. The job runner holds the
+                           job until then.
+        :param coalesce: debounce window in seconds, the job replaces the
+                         arguments of the pending job with the same identity
+                         key (by default :func:`identity_record`). The job
+                         runs at the end of the window started by the first
+                         pending job.
         :param env: Odoo Environment
         :type env: :class:`odoo.api.Environment`
         """
@@ -450,7 +687,8 @@ class Job(object):
             )
         )
 
-        self.state = PENDING
+        self.depends_on = [dep for dep in (depends_on or []) if dep]
+        self.state = WAIT_DEPENDENCIES if self.depends_on else PENDING
 
         self.retry = 0
         if max_retries is None:
@@ -491,6 +729,12 @@ class Job(object):
         else:
             company_id = env.company.id
         self.company_id = company_id
+        self.coalesce = coalesce
+        if coalesce:
+            if identity_key is None:
+                self.identity_key = identity_record
+            if not eta:
+                eta = coalesce
         self._eta = None
         self.eta = eta
         self.channel = channel
@@ -524,6 +768,20 @@ class Job(object):
 
     def store(self):
         """Store the Job"""
+        job_model = self.env["queue.job"]
+        # The sentinel is used to prevent edition sensitive fields (such as
+        # method_name) from RPC methods.
+        edit_sentinel = job_model.EDIT_SENTINEL
+
+        db_record = self.db_record()
+        if db_record:
+            vals = self._prepare_common_stored_values()
+            db_record.with_context(_job_edit_sentinel=edit_sentinel).write(vals)
+        else:
+            vals = self._prepare_create_stored_values()
+            job_model.with_context(_job_edit_sentinel=edit_sentinel).sudo().create(vals)
+
+    def _prepare_common_stored_values(self):
         vals = {
             "state": self.state,
             "priority": self.priority,
@@ -550,36 +808,29 @@ class Job(object):
             vals["eta"] = self.eta
         if self.identity_key:
             vals["identity_key"] = self.identity_key
-
-        job_model = self.env["queue.job"]
-        # The sentinel is used to prevent edition sensitive fields (such as
-        # method_name) from RPC methods.
-        edit_sentinel = job_model.EDIT_SENTINEL
-
-        db_record = self.db_record()
-        if db_record:
-            db_record.with_context(_job_edit_sentinel=edit_sentinel).write(vals)
-        else:
-            date_created = self.date_created
-            # The following values must never be modified after the
-            # creation of the job
-            vals.update(
-                {
-                    "uuid": self.uuid,
-                    "name": self.description,
-                    "date_created": date_created,
-                    "method_name": self.method_name,
-                    "records": self.recordset,
-                    "args": self.args,
-                    "kwargs": self.kwargs,
-                }
-            )
-            # it the channel is not specified, lets the job_model compute
-            # the right one to use
-            if self.channel:
-                vals.update({"channel": self.channel})
-
-            job_model.with_context(_job_edit_sentinel=edit_sentinel).sudo().create(vals)
+        return vals
+
+    def _prepare_create_stored_values(self):
+        vals = self._prepare_common_stored_values()
+        # The following values must never be modified after the
+        # creation of the job
+        vals.update(
+            {
+                "uuid": self.uuid,
+                "name": self.description,
+                "date_created": self.date_created,
+                "method_name": self.method_name,
+                "records": self.recordset,
+                "args": self.args,
+                "kwargs": self.kwargs,
+                "depends_on": self.depends_on,
+            }
+        )
+        # it the channel is not specified, lets the job_model compute
+        # the right one to use
+        if self.channel:
+            vals.update({"channel": self.channel})
+        return vals
 
     def db_record(self):
         return self.db_record_from_uuid(self.env, self.uuid)
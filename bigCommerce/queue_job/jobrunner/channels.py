@@ -7,9 +7,9 @@ from heapq import heappop, heappush
 from weakref import WeakValueDictionary
 
 from ..exception import ChannelNotFound
-from ..job import DONE, ENQUEUED, FAILED, PENDING, STARTED
+from ..job import DONE, ENQUEUED, FAILED, PENDING, STARTED, WAIT_DEPENDENCIES
 
-NOT_DONE = (PENDING, ENQUEUED, STARTED, FAILED)
+NOT_DONE = (WAIT_DEPENDENCIES, PENDING, ENQUEUED, STARTED, FAILED)
 
 _logger = logging.getLogger(__name__)
 
@@ -490,6 +490,15 @@ class Channel(object):
                 self.parent.remove(job)
             _logger.debug("job %s marked pending in channel %s", job.uuid, self)
 
+    def set_waiting(self, job):
+        """Mark a job as waiting for its dependencies.
+
+        This removes it from the channel queue until the channel manager
+        puts it back as pending.
+        """
+        self.remove(job)
+        _logger.debug("job %s waiting for dependencies in channel %s", job.uuid, self)
+
     def set_running(self, job):
         """Mark a job as running.
 
@@ -796,10 +805,42 @@ class ChannelManager(object):
     >>> cm.notify(db, 'S', 'S3', 3, 0, 10, None, 'done')
     >>> pp(list(cm.get_jobs_to_run(now=105)))
     []
+
+    A job waiting for dependencies is given the uuids of its dependencies
+    which are not done yet. It is held aside until they are done or failed,
+    without being retried.
+
+    >>> cm = ChannelManager()
+    >>> cm.simple_configure('root:4')
+    >>> cm.notify(db, 'root', 'D1', 1, 0, 10, None, 'started')
+    >>> cm.notify(db, 'root', 'D2', 2, 0, 10, None, 'started')
+    >>> cm.notify(db, 'root', 'W', 3, 0, 10, None, 'wait_dependencies',
+    ...           ['D1', 'D2'])
+    >>> pp(list(cm.get_jobs_to_run(now=100)))
+    []
+    >>> cm.notify(db, 'root', 'D1', 1, 0, 10, None, 'done')
+    >>> pp(list(cm.get_jobs_to_run(now=100)))
+    []
+    >>> cm.notify(db, 'root', 'D2', 2, 0, 10, None, 'failed')
+    >>> pp(list(cm.get_jobs_to_run(now=100)))
+    [<ChannelJob W>]
+
+    A dependency which is removed from the database does not block anymore.
+
+    >>> cm.notify(db, 'root', 'W2', 4, 0, 10, None, 'wait_dependencies',
+    ...           ['D3'])
+    >>> pp(list(cm.get_jobs_to_run(now=100)))
+    []
+    >>> cm.remove_job('D3')
+    >>> pp(list(cm.get_jobs_to_run(now=100)))
+    [<ChannelJob W2>]
     """
 
     def __init__(self):
         self._jobs_by_uuid = WeakValueDictionary()
+        # jobs waiting for dependencies are in no channel, keep them here
+        self._waiting_jobs = {}
+        self._dependents = {}
         self._root_channel = Channel(name="root", parent=None, capacity=1)
         self._channels_by_name = WeakValueDictionary(root=self._root_channel)
 
@@ -999,7 +1040,16 @@ class ChannelManager(object):
         return parent
 
     def notify(
-        self, db_name, channel_name, uuid, seq, date_created, priority, eta, state
+        self,
+        db_name,
+        channel_name,
+        uuid,
+        seq,
+        date_created,
+        priority,
+        eta,
+        state,
+        depends_on=None,
     ):
         try:
             channel = self.get_channel_by_name(channel_name)
@@ -1024,14 +1074,18 @@ class ChannelManager(object):
                 or channel != job.channel
             ):
                 _logger.debug("job %s properties changed, rescheduling it", uuid)
-                self.remove_job(uuid)
+                self._remove_job(uuid)
                 job = None
         if not job:
             job = ChannelJob(db_name, channel, uuid, seq, date_created, priority, eta)
             self._jobs_by_uuid[uuid] = job
+        if state != WAIT_DEPENDENCIES:
+            self._stop_waiting(uuid)
         # state transitions
         if not state or state == DONE:
             job.channel.set_done(job)
+        elif state == WAIT_DEPENDENCIES:
+            self._wait_for_dependencies(job, depends_on)
         elif state == PENDING:
             job.channel.set_pending(job)
         elif state in (ENQUEUED, STARTED):
@@ -1040,14 +1094,56 @@ class ChannelManager(object):
             job.channel.set_failed(job)
         else:
             _logger.error("unexpected state %s for job %s", state, job)
+        if not state or state in (DONE, FAILED):
+            self._release_dependents(uuid)
+
+    def _wait_for_dependencies(self, job, depends_on):
+        """Hold the job aside until all the given jobs are done or failed"""
+        job.channel.set_waiting(job)
+        remaining = set(depends_on or ())
+        if not remaining:
+            job.channel.set_pending(job)
+            return
+        self._waiting_jobs[job.uuid] = (job, remaining)
+        for dependency in remaining:
+            self._dependents.setdefault(dependency, set()).add(job.uuid)
+
+    def _stop_waiting(self, uuid):
+        job, remaining = self._waiting_jobs.pop(uuid, (None, ()))
+        for dependency in remaining:
+            dependents = self._dependents.get(dependency)
+            if dependents:
+                dependents.discard(uuid)
+                if not dependents:
+                    del self._dependents[dependency]
+
+    def _release_dependents(self, uuid):
+        """The job is finished, make runnable the jobs that were only waiting
+        for it"""
+        for dependent_uuid in self._dependents.pop(uuid, ()):
+            job, remaining = self._waiting_jobs[dependent_uuid]
+            remaining.discard(uuid)
+            if not remaining:
+                del self._waiting_jobs[dependent_uuid]
+                _logger.debug("job %s dependencies are finished", dependent_uuid)
+                job.channel.set_pending(job)
 
     def remove_job(self, uuid):
+        self._remove_job(uuid)
+        # a job removed from the database does not block its dependents
+        self._release_dependents(uuid)
+
+    def _remove_job(self, uuid):
+        self._stop_waiting(uuid)
         job = self._jobs_by_uuid.get(uuid)
         if job:
             job.channel.remove(job)
             del self._jobs_by_uuid[job.uuid]
 
     def remove_db(self, db_name):
+        for uuid, (job, _remaining) in list(self._waiting_jobs.items()):
+            if job.db_name == db_name:
+                self._stop_waiting(uuid)
         for job in list(self._jobs_by_uuid.values()):
             if job.db_name == db_name:
                 job.channel.remove(job)
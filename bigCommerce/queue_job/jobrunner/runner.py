@@ -31,6 +31,9 @@ How to use it?
   - ``ODOO_QUEUE_JOB_PORT=443``, default ``http_port`` or 8069 if unset.
   - ``ODOO_QUEUE_JOB_HTTP_AUTH_USER=jobrunner``, default empty.
   - ``ODOO_QUEUE_JOB_HTTP_AUTH_PASSWORD=s3cr3t``, default empty.
+  - ``ODOO_QUEUE_JOB_DISPATCH_WORKERS=8``, number of threads asking Odoo
+    to run jobs, default 8. The pool has at least as many threads as the
+    capacity of the root channel.
   - ``ODOO_QUEUE_JOB_JOBRUNNER_DB_HOST=master-db``, default ``db_host``
     or ``False`` if unset.
   - ``ODOO_QUEUE_JOB_JOBRUNNER_DB_PORT=5432``, default ``db_port``
@@ -48,6 +51,7 @@ How to use it?
   port = 443
   http_auth_user = jobrunner
   http_auth_password = s3cr3t
+  dispatch_workers = 8
   jobrunner_db_host = master-db
   jobrunner_db_port = 5432
 
@@ -139,6 +143,7 @@ import os
 import select
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing, contextmanager
 
 import psycopg2
@@ -149,10 +154,22 @@ import odoo
 from odoo.tools import config
 
 from . import queue_job_config
-from .channels import ENQUEUED, NOT_DONE, PENDING, ChannelManager
+from .channels import (
+    DONE,
+    ENQUEUED,
+    FAILED,
+    NOT_DONE,
+    PENDING,
+    WAIT_DEPENDENCIES,
+    ChannelManager,
+)
 
 SELECT_TIMEOUT = 60
 ERROR_RECOVERY_DELAY = 5
+DISPATCH_WORKERS = 8
+DISPATCH_STATS_INTERVAL = 60
+# the jobs released from their dependencies are still waiting in the database
+RUNNABLE_STATES = (PENDING, WAIT_DEPENDENCIES)
 
 _logger = logging.getLogger(__name__)
 
@@ -173,6 +190,22 @@ def _channels():
     )
 
 
+def _dispatch_workers(capacity=None):
+    """Number of dispatch threads, at least the given channel capacity
+
+    >>> _dispatch_workers(64)
+    64
+    """
+    workers = int(
+        os.environ.get("ODOO_QUEUE_JOB_DISPATCH_WORKERS")
+        or queue_job_config.get("dispatch_workers")
+        or DISPATCH_WORKERS
+    )
+    # a request holds its thread while the job runs (up to the timeout), one
+    # thread per running job keeps the dispatch from waiting for a thread
+    return max(workers, capacity or 0)
+
+
 def _datetime_to_epoch(dt):
     # important: this must return the same as postgresql
     # EXTRACT(EPOCH FROM TIMESTAMP dt)
@@ -198,57 +231,188 @@ def _connection_info_for(db_name):
     return connection_info
 
 
-def _async_http_get(scheme, host, port, user, password, db_name, job_uuid):
-    # Method to set failed job (due to timeout, etc) as pending,
-    # to avoid keeping it as enqueued.
-    def set_job_pending():
-        connection_info = _connection_info_for(db_name)
-        conn = psycopg2.connect(**connection_info)
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        with closing(conn.cursor()) as cr:
-            cr.execute(
-                "UPDATE queue_job SET state=%s, "
-                "date_enqueued=NULL, date_started=NULL "
-                "WHERE uuid=%s and state=%s "
-                "RETURNING uuid",
-                (PENDING, job_uuid, ENQUEUED),
-            )
-            if cr.fetchone():
-                _logger.warning(
-                    "state of job %s was reset from %s to %s",
-                    job_uuid,
-                    ENQUEUED,
-                    PENDING,
-                )
+class JobDispatcher(object):
+    """Ask Odoo to run jobs through ``/queue_job/runjob``
+
+    Requests are sent from a bounded pool of threads, each one keeping its
+    own HTTP session so connections to the Odoo workers are kept alive.
+    Jobs which could not be dispatched are reset to pending on one
+    database connection per database, shared by the threads.
+    """
 
-    # TODO: better way to HTTP GET asynchronously (grequest, ...)?
-    #       if this was python3 I would be doing this with
-    #       asyncio, aiohttp and aiopg
-    def urlopen():
+    def __init__(self, scheme, host, port, user=None, password=None, max_workers=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_workers = max_workers or _dispatch_workers()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="queue_job_dispatch"
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._db_conns = {}
+        self._db_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
+
+    def dispatch(self, db_name, job_uuid):
+        """Queue the HTTP request running the job, return immediately"""
+        with self._stats_lock:
+            self._stats["pending"] += 1
+        self._executor.submit(self._run, db_name, job_uuid, time.monotonic())
+
+    def _run(self, db_name, job_uuid, queued_at):
+        started_at = time.monotonic()
         url = "{}://{}:{}/queue_job/runjob?db={}&job_uuid={}".format(
-            scheme, host, port, db_name, job_uuid
+            self.scheme, self.host, self.port, db_name, job_uuid
         )
+        outcome = "dispatched"
         try:
-            auth = None
-            if user:
-                auth = (user, password)
             # we are not interested in the result, so we set a short timeout
             # but not too short so we trap and log hard configuration errors
-            response = requests.get(url, timeout=1, auth=auth)
+            response = self._get_session().get(url, timeout=1)
 
             # raise_for_status will result in either nothing, a Client Error
             # for HTTP Response codes between 400 and 500 or a Server Error
             # for codes between 500 and 600
             response.raise_for_status()
         except requests.Timeout:
-            set_job_pending()
+            outcome = "timeouts"
         except Exception:
+            outcome = "errors"
             _logger.exception("exception in GET %s", url)
-            set_job_pending()
+        http_time = time.monotonic() - started_at
+        try:
+            if outcome != "dispatched":
+                self.set_job_pending(db_name, job_uuid)
+        except Exception:
+            # nobody waits on the future, an error would not show up otherwise
+            _logger.exception("could not reset job %s to pending", job_uuid)
+        finally:
+            self._record(outcome, started_at - queued_at, http_time)
+
+    def _get_session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            if self.user:
+                session.auth = (self.user, self.password)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def set_job_pending(self, db_name, job_uuid):
+        """Set a job which failed to be dispatched (timeout, etc) as pending,
+        to avoid keeping it as enqueued."""
+        with self._db_lock:
+            try:
+                reset = self._set_job_pending(self._get_db_conn(db_name), job_uuid)
+            except psycopg2.Error:
+                # the connection may have been closed, retry once on a new one
+                self._close_db_conn(db_name)
+                reset = self._set_job_pending(self._get_db_conn(db_name), job_uuid)
+        if reset:
+            with self._stats_lock:
+                self._stats["resets"] += 1
+            _logger.warning(
+                "state of job %s was reset from %s to %s", job_uuid, ENQUEUED, PENDING
+            )
 
-    thread = threading.Thread(target=urlopen)
-    thread.daemon = True
-    thread.start()
+    @staticmethod
+    def _set_job_pending(conn, job_uuid):
+        with closing(conn.cursor()) as cr:
+            cr.execute(
+                "UPDATE queue_job SET state=%s, "
+                "date_enqueued=NULL, date_started=NULL "
+                "WHERE uuid=%s and state=%s "
+                "RETURNING uuid",
+                (PENDING, job_uuid, ENQUEUED),
+            )
+            return bool(cr.fetchone())
+
+    def _get_db_conn(self, db_name):
+        conn = self._db_conns.get(db_name)
+        if conn is None or conn.closed:
+            conn = psycopg2.connect(**_connection_info_for(db_name))
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            self._db_conns[db_name] = conn
+        return conn
+
+    def _close_db_conn(self, db_name):
+        conn = self._db_conns.pop(db_name, None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                _logger.debug("error closing dispatcher connection to %s", db_name)
+
+    def _reset_stats(self):
+        self._stats = {
+            "pending": 0,
+            "dispatched": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "resets": 0,
+            "queue_time_total": 0.0,
+            "queue_time_max": 0.0,
+            "http_time_total": 0.0,
+            "http_time_max": 0.0,
+        }
+
+    def _record(self, outcome, queue_time, http_time):
+        with self._stats_lock:
+            stats = self._stats
+            stats["pending"] -= 1
+            stats[outcome] += 1
+            stats["queue_time_total"] += queue_time
+            stats["queue_time_max"] = max(stats["queue_time_max"], queue_time)
+            stats["http_time_total"] += http_time
+            stats["http_time_max"] = max(stats["http_time_max"], http_time)
+
+    def get_stats(self, reset=False):
+        """Dispatch metrics since the last reset
+
+        ``queue_time`` is the time a job waited for a free dispatch thread,
+        ``http_time`` the time spent on the HTTP request (in seconds).
+
+        >>> dispatcher = JobDispatcher("http", "localhost", 8069, max_workers=1)
+        >>> dispatcher._record("dispatched", 0.5, 0.25)
+        >>> dispatcher._record("timeouts", 0.1, 1.0)
+        >>> stats = dispatcher.get_stats(reset=True)
+        >>> stats["count"], stats["timeouts"], stats["queue_time_avg"]
+        (2, 1, 0.3)
+        >>> stats["http_time_max"]
+        1.0
+        >>> dispatcher.get_stats()["count"]
+        0
+        >>> dispatcher.close()
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+            if reset:
+                pending = stats["pending"]
+                self._reset_stats()
+                self._stats["pending"] = pending
+        count = stats["dispatched"] + stats["timeouts"] + stats["errors"]
+        for key in ("queue_time", "http_time"):
+            total = stats.pop(key + "_total")
+            stats[key + "_avg"] = total / count if count else 0.0
+        stats["count"] = count
+        return stats
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+        with self._db_lock:
+            for db_name in list(self._db_conns):
+                self._close_db_conn(db_name)
 
 
 class Database(object):
@@ -311,11 +475,20 @@ class Database(object):
         # the checker thinks we are injecting values but we are not, we are
         # adding the where conditions, values are added later properly with
         # parameters
+        # for jobs waiting for dependencies, also select the dependencies
+        # which are not finished yet
         query = (
             "SELECT channel, uuid, id as seq, date_created, "
-            "priority, EXTRACT(EPOCH FROM eta), state "
+            "priority, EXTRACT(EPOCH FROM eta), state, "
+            "CASE WHEN state = %%s THEN ARRAY("
+            "    SELECT dependency.uuid FROM queue_job dependency"
+            "    WHERE dependency.uuid IN ("
+            "        SELECT jsonb_array_elements_text(queue_job.depends_on::jsonb)"
+            "    ) AND dependency.state NOT IN %%s"
+            ") END "
             "FROM queue_job WHERE %s" % (where,)
         )
+        args = (WAIT_DEPENDENCIES, (DONE, FAILED)) + tuple(args)
         with closing(self.conn.cursor("select_jobs", withhold=True)) as cr:
             cr.execute(query, args)
             yield cr
@@ -331,8 +504,18 @@ class Database(object):
                 "UPDATE queue_job SET state=%s, "
                 "date_enqueued=date_trunc('seconds', "
                 "                         now() at time zone 'utc') "
-                "WHERE uuid=%s",
-                (ENQUEUED, uuid),
+                "WHERE uuid=%s AND state IN %s",
+                (ENQUEUED, uuid, RUNNABLE_STATES),
+            )
+
+    def set_jobs_enqueued(self, uuids):
+        with closing(self.conn.cursor()) as cr:
+            cr.execute(
+                "UPDATE queue_job SET state=%s, "
+                "date_enqueued=date_trunc('seconds', "
+                "                         now() at time zone 'utc') "
+                "WHERE uuid = ANY(%s) AND state IN %s",
+                (ENQUEUED, list(uuids), RUNNABLE_STATES),
             )
 
 
@@ -356,6 +539,17 @@ class QueueJobRunner(object):
             channel_config_string = _channels()
         self.channel_manager.simple_configure(channel_config_string)
         self.db_by_name = {}
+        self.dispatcher = JobDispatcher(
+            scheme,
+            host,
+            port,
+            user,
+            password,
+            max_workers=_dispatch_workers(
+                self.channel_manager.get_channel_by_name("root").capacity
+            ),
+        )
+        self._stats_logged_at = time.monotonic()
         self._stop = False
         self._stop_pipe = os.pipe()
 
@@ -418,19 +612,31 @@ class QueueJobRunner(object):
 
     def run_jobs(self):
         now = _odoo_now()
+        jobs_by_db = {}
         for job in self.channel_manager.get_jobs_to_run(now):
             if self._stop:
                 break
-            _logger.info("asking Odoo to run job %s on db %s", job.uuid, job.db_name)
-            self.db_by_name[job.db_name].set_job_enqueued(job.uuid)
-            _async_http_get(
-                self.scheme,
-                self.host,
-                self.port,
-                self.user,
-                self.password,
-                job.db_name,
-                job.uuid,
+            jobs_by_db.setdefault(job.db_name, []).append(job)
+        for db_name, jobs in jobs_by_db.items():
+            self.db_by_name[db_name].set_jobs_enqueued(job.uuid for job in jobs)
+            for job in jobs:
+                _logger.info("asking Odoo to run job %s on db %s", job.uuid, db_name)
+                self.dispatcher.dispatch(db_name, job.uuid)
+        self.log_dispatch_stats()
+
+    def log_dispatch_stats(self):
+        if time.monotonic() - self._stats_logged_at < DISPATCH_STATS_INTERVAL:
+            return
+        self._stats_logged_at = time.monotonic()
+        stats = self.dispatcher.get_stats(reset=True)
+        if stats["count"] or stats["pending"]:
+            _logger.info(
+                "dispatched %(count)d jobs (%(timeouts)d timeouts, "
+                "%(errors)d errors, %(resets)d reset to pending, "
+                "%(pending)d waiting), queue time avg %(queue_time_avg).3fs "
+                "max %(queue_time_max).3fs, http time avg %(http_time_avg).3fs "
+                "max %(http_time_max).3fs",
+                stats,
             )
 
     def process_notifications(self):
@@ -441,17 +647,21 @@ class QueueJobRunner(object):
                 # causing some intermediaries (such as haproxy) to close the
                 # connection, making the jobrunner to restart on a socket error
                 db.keep_alive()
+            if self._stop:
+                break
+            # drain all pending notifications and load the jobs in one query
+            uuids = set()
             while db.conn.notifies:
-                if self._stop:
-                    break
-                notification = db.conn.notifies.pop()
-                uuid = notification.payload
-                with db.select_jobs("uuid = %s", (uuid,)) as cr:
-                    job_datas = cr.fetchone()
-                    if job_datas:
-                        self.channel_manager.notify(db.db_name, *job_datas)
-                    else:
-                        self.channel_manager.remove_job(uuid)
+                uuids.add(db.conn.notifies.pop().payload)
+            if not uuids:
+                continue
+            with db.select_jobs("uuid = ANY(%s)", (list(uuids),)) as cr:
+                for job_datas in cr:
+                    # the uuid is the second column
+                    uuids.discard(job_datas[1])
+                    self.channel_manager.notify(db.db_name, *job_datas)
+            for uuid in uuids:
+                self.channel_manager.remove_job(uuid)
 
     def wait_notification(self):
         for db in self.db_by_name.values():
@@ -517,4 +727,5 @@ class QueueJobRunner(object):
                 self.close_databases()
                 time.sleep(ERROR_RECOVERY_DELAY)
         self.close_databases(remove_jobs=False)
+        self.dispatcher.close()
         _logger.info("stopped")
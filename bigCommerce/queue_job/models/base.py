@@ -29,6 +29,9 @@ class Base(models.AbstractModel):
         description=None,
         channel=None,
         identity_key=None,
+        depends_on=None,
+        batch=None,
+        coalesce=None,
     ):
         """Return a ``DelayableRecordset``
 
@@ -66,6 +69,18 @@ class Base(models.AbstractModel):
                              the new job will not be added. It is either a
                              string, either a function that takes the job as
                              argument (see :py:func:`..job.identity_exact`).
+        :param depends_on: list of job UUIDs, the job will only be run once
+                           all of them are done or failed.
+        :param batch: a :class:`odoo.addons.queue_job.job.DelayableBatch`,
+                      the job is added to it and only stored when the batch
+                      is enqueued.
+        :param coalesce: debounce window in seconds. The job replaces the
+                         arguments of the pending job on the same records and
+                         method (or with the same ``identity_key``) instead of
+                         being added. The pending job runs at the end of the
+                         window started by the first call, however often it
+                         is replaced. Useful for exports, so the channel only
+                         gets the latest state.
         :return: instance of a DelayableRecordset
         :rtype: :class:`odoo.addons.queue_job.job.DelayableRecordset`
 
@@ -97,6 +112,9 @@ class Base(models.AbstractModel):
             description=description,
             channel=channel,
             identity_key=identity_key,
+            depends_on=depends_on,
+            batch=batch,
+            coalesce=coalesce,
         )
 
     def _patch_job_auto_delay(self, method_name, context_key=None):
@@ -40,6 +40,7 @@ class QueueJob(models.Model):
         "records",
         "args",
         "kwargs",
+        "depends_on",
     )
 
     uuid = fields.Char(string="UUID", readonly=True, index=True, required=True)
@@ -69,6 +70,11 @@ class QueueJob(models.Model):
     )
     args = JobSerialized(readonly=True, base_type=tuple)
     kwargs = JobSerialized(readonly=True, base_type=dict)
+    depends_on = JobSerialized(
+        readonly=True,
+        base_type=list,
+        help="UUIDs of the jobs which must be done or failed before this job runs",
+    )
     func_string = fields.Char(
         string="Task", compute="_compute_func_string", readonly=True, store=True
     )
@@ -168,11 +174,9 @@ class QueueJob(models.Model):
     @api.depends("model_name", "method_name", "records", "args", "kwargs")
     def _compute_func_string(self):
         for record in self:
-            model = repr(record.records)
-            args = [repr(arg) for arg in record.args]
-            kwargs = ["{}={!r}".format(key, val) for key, val in record.kwargs.items()]
-            all_args = ", ".join(args + kwargs)
-            record.func_string = "{}.{}({})".format(model, record.method_name, all_args)
+            record.func_string = self._format_func_string(
+                record.records, record.method_name, record.args, record.kwargs
+            )
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -184,6 +188,100 @@ class QueueJob(models.Model):
             )
         return super().create(vals_list)
 
+    @api.model
+    def _prepare_bulk_create_values(self, vals):
+        """Complete the values of a job enqueued in a batch
+
+        Called with the environment of the job, before ``_bulk_create``.
+        Extensions which complete the values in ``create`` should do the same
+        here.
+        """
+        return vals
+
+    @api.model
+    def _bulk_create(self, vals_list):
+        """Insert many jobs with a single query
+
+        Only meant to be used by ``Job.enqueue_many``. The stored computed
+        fields are resolved once per job function instead of once per job,
+        and no creation message is logged on the jobs.
+        """
+        if self.env.context.get("_job_edit_sentinel") is not self.EDIT_SENTINEL:
+            raise exceptions.AccessError(
+                _("Queue jobs must created by calling 'with_delay()'.")
+            )
+        if not vals_list:
+            return self.browse()
+        functions = self._get_bulk_job_functions(vals_list)
+        rows = []
+        for vals in vals_list:
+            vals = dict(vals)
+            records = vals["records"]
+            channel_method_name = self.env["queue.job.function"].job_function_name(
+                records._name, vals["method_name"]
+            )
+            function = functions[channel_method_name]
+            override_channel = vals.pop("channel", False)
+            vals.update(
+                {
+                    "user_id": records.env.uid,
+                    "model_name": records._name,
+                    "func_string": self._format_func_string(
+                        records, vals["method_name"], vals["args"], vals["kwargs"]
+                    ),
+                    "channel_method_name": channel_method_name,
+                    "job_function_id": function.id,
+                    "override_channel": override_channel,
+                    "channel": override_channel or function.channel or "root",
+                }
+            )
+            rows.append(
+                {
+                    name: self._fields[name].convert_to_column(value, self, vals)
+                    for name, value in vals.items()
+                }
+            )
+        columns = sorted(set().union(*rows))
+        # set the log access columns as ``create`` does
+        placeholder = "(%s)" % ", ".join(
+            ["%s"] * len(columns)
+            + ["%s", "(now() at time zone 'UTC')", "%s", "(now() at time zone 'UTC')"]
+        )
+        columns += ["create_uid", "create_date", "write_uid", "write_date"]
+        values = ", ".join(
+            self.env.cr.mogrify(
+                placeholder,
+                [row.get(column) for column in columns[:-4]]
+                + [self.env.uid, self.env.uid],
+            ).decode()
+            for row in rows
+        )
+        # pylint: disable=sql-injection
+        self.env.cr.execute(
+            'INSERT INTO queue_job (%s) VALUES %s RETURNING id'
+            % (", ".join('"%s"' % column for column in columns), values)
+        )
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _get_bulk_job_functions(self, vals_list):
+        func_model = self.env["queue.job.function"].sudo()
+        names = {
+            func_model.job_function_name(vals["records"]._name, vals["method_name"])
+            for vals in vals_list
+        }
+        functions = dict.fromkeys(names, func_model.browse())
+        for function in func_model.search([("name", "in", list(names))]):
+            if not functions[function.name]:
+                functions[function.name] = function
+        return functions
+
+    @staticmethod
+    def _format_func_string(records, method_name, args, kwargs):
+        args = [repr(arg) for arg in args]
+        kwargs = ["{}={!r}".format(key, val) for key, val in kwargs.items()]
+        all_args = ", ".join(args + kwargs)
+        return "{}.{}({})".format(repr(records), method_name, all_args)
+
     def write(self, vals):
         if self.env.context.get("_job_edit_sentinel") is not self.EDIT_SENTINEL:
             write_on_protected_fields = [
@@ -27,7 +27,10 @@ class QueueJobFunction(models.Model):
         "retry_pattern "
         "related_action_enable "
         "related_action_func_name "
-        "related_action_kwargs ",
+        "related_action_kwargs "
+        "batch_size "
+        "commit_free ",
+        defaults=(1, False),
     )
 
     def _default_channel(self):
@@ -68,6 +71,19 @@ class QueueJobFunction(models.Model):
         "See the module description for details.",
     )
     related_action = JobSerialized(string="Related Action (serialized)", base_type=dict)
+    batch_size = fields.Integer(
+        string="Jobs per Run",
+        default=1,
+        help="Maximum number of pending jobs of this function run one after "
+        "the other by a worker in a single request, each in its own "
+        "savepoint. Useful for many small jobs. 1 runs one job per request. "
+        "Only used for commit-free job functions.",
+    )
+    commit_free = fields.Boolean(
+        string="Commit-Free",
+        help="The jobs of this function never commit the transaction, so "
+        "several of them can be run in one request.",
+    )
     edit_related_action = fields.Text(
         string="Related Action",
         compute="_compute_edit_related_action",
@@ -179,6 +195,8 @@ class QueueJobFunction(models.Model):
             related_action_enable=config.related_action.get("enable", True),
             related_action_func_name=config.related_action.get("func_name"),
             related_action_kwargs=config.related_action.get("kwargs", {}),
+            batch_size=max(config.batch_size, 1),
+            commit_free=config.commit_free,
         )
 
     def _retry_pattern_format_error_message(self):
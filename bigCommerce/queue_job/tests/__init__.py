@@ -4,3 +4,8 @@ from . import test_json_field
 from . import test_model_job_channel
 from . import test_model_job_function
 from . import test_queue_job_protected_write
+from . import test_job_dependencies
+from . import test_delayable_batch
+from . import test_run_batched_jobs
+from . import test_job_coalesce
+from . import test_runner_dependencies
@@ -0,0 +1,81 @@
+# copyright 2020 Camptocamp
+# license lgpl-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from odoo import exceptions
+from odoo.tests import common
+
+from odoo.addons.queue_job.job import DelayableBatch
+
+
+class TestDelayableBatch(common.TransactionCase):
+    def test_batch_stored_like_single_jobs(self):
+        partner = self.env["res.partner"].create({"name": "test"})
+        single = partner.with_delay(priority=15).write({"name": "single"}).db_record()
+
+        batch = DelayableBatch()
+        jobs = [
+            partner.with_delay(priority=15, batch=batch).write({"name": str(i)})
+            for i in range(3)
+        ]
+        self.assertFalse(jobs[0].db_record())
+        self.assertEqual(batch.enqueue(), jobs)
+        self.assertFalse(len(batch))
+
+        for job_ in jobs:
+            db_job = job_.db_record()
+            self.assertEqual(db_job.state, "pending")
+            self.assertEqual(db_job.records, partner)
+            self.assertEqual(db_job.kwargs, {})
+            for field in (
+                "priority",
+                "user_id",
+                "model_name",
+                "channel_method_name",
+                "job_function_id",
+                "channel",
+                "create_uid",
+                "create_date",
+                "write_uid",
+                "write_date",
+            ):
+                self.assertEqual(db_job[field], single[field], field)
+        self.assertEqual(
+            jobs[1].db_record().func_string,
+            "res.partner(%s,).write({'name': '1'})" % partner.id,
+        )
+
+    def test_batch_channel_override(self):
+        channel = self.env["queue.job.channel"].create(
+            {"name": "foo", "parent_id": self.env.ref("queue_job.channel_root").id}
+        )
+        batch = DelayableBatch()
+        job_ = self.env["res.partner"].with_delay(
+            channel=channel.complete_name, batch=batch
+        ).create({"name": "test"})
+        batch.enqueue()
+        self.assertEqual(job_.db_record().channel, "root.foo")
+        self.assertEqual(job_.db_record().override_channel, "root.foo")
+
+    def test_batch_identity_key(self):
+        partner = self.env["res.partner"].create({"name": "test"})
+        existing = partner.with_delay(identity_key="a").write({"name": "a"})
+
+        batch = DelayableBatch()
+        partner.with_delay(identity_key="a", batch=batch).write({"name": "a"})
+        second = partner.with_delay(identity_key="b", batch=batch).write({"name": "b"})
+        partner.with_delay(identity_key="b", batch=batch).write({"name": "b"})
+        jobs = batch.enqueue()
+
+        self.assertEqual(
+            [job_.uuid for job_ in jobs], [existing.uuid, second.uuid, second.uuid]
+        )
+        self.assertEqual(
+            self.env["queue.job"].search_count([("identity_key", "in", ["a", "b"])]),
+            2,
+        )
+
+    def test_bulk_create_protected(self):
+        with self.assertRaises(exceptions.AccessError):
+            self.env["queue.job"]._bulk_create(
+                [{"uuid": "test", "method_name": "write"}]
+            )
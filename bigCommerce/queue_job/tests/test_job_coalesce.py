@@ -0,0 +1,78 @@
+# copyright 2020 Camptocamp
+# license lgpl-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from datetime import datetime, timedelta
+
+from odoo.tests import common
+
+from odoo.addons.queue_job.job import DelayableBatch
+
+
+class TestJobCoalesce(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = self.env["res.partner"].create({"name": "test"})
+
+    def test_newer_job_replaces_pending_job(self):
+        first = self.partner.with_delay(coalesce=60).write({"name": "first"})
+        second = self.partner.with_delay(coalesce=60).write({"name": "second"})
+
+        self.assertEqual(first.uuid, second.uuid)
+        db_job = second.db_record()
+        self.assertEqual(db_job.args, [{"name": "second"}])
+        self.assertGreater(db_job.eta, datetime.now() + timedelta(seconds=30))
+        self.assertEqual(
+            self.env["queue.job"].search_count(
+                [("identity_key", "=", db_job.identity_key)]
+            ),
+            1,
+        )
+
+    def test_coalesce_per_record_and_method(self):
+        other = self.env["res.partner"].create({"name": "other"})
+        first = self.partner.with_delay(coalesce=60).write({"name": "first"})
+        on_other = other.with_delay(coalesce=60).write({"name": "first"})
+        other_method = self.partner.with_delay(coalesce=60).copy()
+
+        self.assertEqual(len({first.uuid, on_other.uuid, other_method.uuid}), 3)
+
+    def test_started_job_not_replaced(self):
+        first = self.partner.with_delay(coalesce=60).write({"name": "first"})
+        first.db_record().state = "started"
+        second = self.partner.with_delay(coalesce=60).write({"name": "second"})
+
+        self.assertNotEqual(first.uuid, second.uuid)
+        self.assertEqual(first.db_record().args, [{"name": "first"}])
+
+    def test_coalesce_keeps_eta(self):
+        first = self.partner.with_delay(coalesce=60).write({"name": "first"})
+        eta = datetime.now() + timedelta(seconds=10)
+        first.db_record().eta = eta
+        second = self.partner.with_delay(coalesce=60).write({"name": "second"})
+
+        self.assertEqual(first.uuid, second.uuid)
+        db_job = second.db_record()
+        self.assertEqual(db_job.args, [{"name": "second"}])
+        self.assertEqual(db_job.eta, eta.replace(microsecond=0))
+
+    def test_coalesce_in_batch(self):
+        pending = self.partner.with_delay(coalesce=60).write({"name": "first"})
+        other = self.env["res.partner"].create({"name": "other"})
+        batch = DelayableBatch()
+        self.partner.with_delay(coalesce=60, batch=batch).write({"name": "second"})
+        other.with_delay(coalesce=60, batch=batch).write({"name": "first"})
+        other.with_delay(coalesce=60, priority=5, batch=batch).write({"name": "second"})
+        jobs = batch.enqueue()
+
+        self.assertEqual(jobs[0].uuid, pending.uuid)
+        self.assertEqual(pending.db_record().args, [{"name": "second"}])
+        self.assertIs(jobs[1], jobs[2])
+        db_job = jobs[1].db_record()
+        self.assertEqual(db_job.args, [{"name": "second"}])
+        self.assertEqual(db_job.priority, 5)
+        self.assertEqual(
+            self.env["queue.job"].search_count(
+                [("identity_key", "=", db_job.identity_key)]
+            ),
+            1,
+        )
@@ -0,0 +1,94 @@
+# copyright 2020 Camptocamp
+# license lgpl-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from datetime import datetime
+
+from odoo.tests import common
+
+# pylint: disable=odoo-addons-relative-import
+# we are testing, we want to test as we were an external consumer of the API
+from odoo.addons.queue_job.job import WAIT_DEPENDENCIES
+from odoo.addons.queue_job.jobrunner.channels import ChannelManager
+from odoo.addons.queue_job.jobrunner.runner import Database
+
+
+class TestJobDependencies(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = self.env["res.partner"].create({"name": "test"})
+        self.channel_manager = ChannelManager()
+        self.channel_manager.simple_configure("root:4")
+        # use the connection of the test transaction instead of a new one
+        self.db = Database.__new__(Database)
+        self.db.db_name = self.env.cr.dbname
+        self.db.conn = self.env.cr._cnx
+        self.dependency = self.partner.with_delay().write({"name": "first"})
+        self.dependent = self.partner.with_delay(
+            depends_on=[self.dependency.uuid]
+        ).write({"name": "second"})
+
+    def _select_jobs(self, *jobs):
+        self.env["base"].flush()
+        with self.db.select_jobs(
+            "uuid = ANY(%s)", ([job_.uuid for job_ in jobs],)
+        ) as cr:
+            return {job_data[1]: job_data for job_data in cr}
+
+    def _notify(self, *jobs):
+        for job_data in self._select_jobs(*jobs).values():
+            self.channel_manager.notify(self.db.db_name, *job_data)
+
+    def _jobs_to_run(self):
+        return {
+            job_.uuid for job_ in self.channel_manager.get_jobs_to_run(datetime.now())
+        }
+
+    def test_select_unfinished_dependencies(self):
+        self.assertEqual(self.dependent.db_record().state, WAIT_DEPENDENCIES)
+        rows = self._select_jobs(self.dependency, self.dependent)
+        self.assertEqual(rows[self.dependent.uuid][-1], [self.dependency.uuid])
+        # only the jobs waiting for dependencies select them
+        self.assertIsNone(rows[self.dependency.uuid][-1])
+
+        self.dependency.db_record().state = "done"
+        rows = self._select_jobs(self.dependent)
+        self.assertEqual(rows[self.dependent.uuid][-1], [])
+
+    def test_release_after_dependency_done(self):
+        self._notify(self.dependency, self.dependent)
+        self.assertEqual(self._jobs_to_run(), {self.dependency.uuid})
+
+        self.dependency.db_record().state = "done"
+        self._notify(self.dependency)
+        self.assertEqual(self._jobs_to_run(), {self.dependent.uuid})
+
+    def test_release_after_dependency_failed(self):
+        self._notify(self.dependency, self.dependent)
+        self.assertEqual(self._jobs_to_run(), {self.dependency.uuid})
+
+        self.dependency.db_record().state = "failed"
+        self._notify(self.dependency)
+        self.assertEqual(self._jobs_to_run(), {self.dependent.uuid})
+
+    def test_release_after_dependency_deleted(self):
+        self._notify(self.dependency, self.dependent)
+        self.assertEqual(self._jobs_to_run(), {self.dependency.uuid})
+
+        # the runner removes the jobs it is notified of but cannot select
+        self.channel_manager.remove_job(self.dependency.uuid)
+        self.assertEqual(self._jobs_to_run(), {self.dependent.uuid})
+
+    def test_wait_for_all_dependencies(self):
+        other = self.partner.with_delay().write({"name": "other"})
+        dependent = self.partner.with_delay(
+            depends_on=[self.dependency.uuid, other.uuid]
+        ).write({"name": "last"})
+        self._notify(self.dependency, other, dependent)
+
+        self.dependency.db_record().state = "done"
+        self._notify(self.dependency)
+        self.assertNotIn(dependent.uuid, self._jobs_to_run())
+
+        other.db_record().state = "done"
+        self._notify(other)
+        self.assertIn(dependent.uuid, self._jobs_to_run())
@@ -0,0 +1,66 @@
+# copyright 2020 Camptocamp
+# license lgpl-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from unittest.mock import patch
+
+from odoo.tests import common
+
+from odoo.addons.queue_job.controllers.main import RunJobController
+from odoo.addons.queue_job.job import Job
+
+
+class TestRunBatchedJobs(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.env["queue.job.function"].create(
+            {
+                "model_id": self.env.ref("base.model_res_partner").id,
+                "method": "write",
+                "batch_size": 3,
+                "commit_free": True,
+            }
+        )
+        self.partner = self.env["res.partner"].create({"name": "test"})
+
+    def _run_batch(self, job_):
+        # the requested job is run first by the worker
+        job_.db_record().state = "started"
+        job_ = Job.load(self.env, job_.uuid)
+        with patch("odoo.sql_db.Cursor.commit", autospec=True):
+            RunJobController()._perform_batched_jobs(self.env, job_)
+
+    def test_batch_jobs_succeed_or_fail_on_their_own(self):
+        first = self.partner.with_delay(priority=1).write({"name": "first"})
+        failing = self.partner.with_delay(priority=2).write({"no_such_field": 1})
+        second = self.partner.with_delay(priority=3).write({"name": "second"})
+        left = self.partner.with_delay(priority=4).write({"name": "left"})
+
+        self._run_batch(first)
+
+        self.assertEqual(failing.db_record().state, "failed")
+        self.assertTrue(failing.db_record().exc_info)
+        self.assertEqual(second.db_record().state, "done")
+        self.assertEqual(left.db_record().state, "pending")
+        self.assertEqual(self.partner.name, "second")
+
+    def test_no_batch_without_configuration(self):
+        self.env["queue.job.function"].search(
+            [("name", "=", "<res.partner>.write")]
+        ).batch_size = 1
+        first = self.partner.with_delay().write({"name": "first"})
+        second = self.partner.with_delay().write({"name": "second"})
+
+        self._run_batch(first)
+
+        self.assertEqual(second.db_record().state, "pending")
+
+    def test_no_batch_for_committing_functions(self):
+        self.env["queue.job.function"].search(
+            [("name", "=", "<res.partner>.write")]
+        ).commit_free = False
+        first = self.partner.with_delay().write({"name": "first"})
+        second = self.partner.with_delay().write({"name": "second"})
+
+        self._run_batch(first)
+
+        self.assertEqual(second.db_record().state, "pending")
@@ -0,0 +1,62 @@
+# copyright 2020 Camptocamp
+# license lgpl-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
+
+from datetime import datetime
+from unittest.mock import patch
+
+from odoo.tests import common
+
+# pylint: disable=odoo-addons-relative-import
+# we are testing, we want to test as we were an external consumer of the API
+from odoo.addons.queue_job.controllers.main import RunJobController
+from odoo.addons.queue_job.job import Job
+from odoo.addons.queue_job.jobrunner.channels import ChannelManager
+from odoo.addons.queue_job.jobrunner.runner import Database
+
+
+class TestRunnerDependencies(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.partner = self.env["res.partner"].create({"name": "test"})
+        self.channel_manager = ChannelManager()
+        self.channel_manager.simple_configure("root:4")
+        # use the connection of the test transaction instead of a new one
+        self.db = Database.__new__(Database)
+        self.db.db_name = self.env.cr.dbname
+        self.db.conn = self.env.cr._cnx
+
+    def _notify(self, *jobs):
+        self.env["base"].flush()
+        with self.db.select_jobs(
+            "uuid = ANY(%s)", ([job_.uuid for job_ in jobs],)
+        ) as cr:
+            for job_data in cr:
+                self.channel_manager.notify(self.db.db_name, *job_data)
+
+    def _jobs_to_run(self):
+        return {
+            job_.uuid for job_ in self.channel_manager.get_jobs_to_run(datetime.now())
+        }
+
+    def test_dependent_job_run_after_dependency(self):
+        dependency = self.partner.with_delay().write({"name": "first"})
+        dependent = self.partner.with_delay(depends_on=[dependency.uuid]).write(
+            {"name": "second"}
+        )
+        self._notify(dependency, dependent)
+        self.assertEqual(self._jobs_to_run(), {dependency.uuid})
+
+        dependency.db_record().state = "done"
+        self._notify(dependency)
+        self.assertEqual(self._jobs_to_run(), {dependent.uuid})
+
+        # the runner enqueues the job although it is still waiting in the database
+        self.db.set_jobs_enqueued([dependent.uuid])
+        self.env["queue.job"].invalidate_cache()
+        self.assertEqual(dependent.db_record().state, "enqueued")
+
+        job_ = Job.load(self.env, dependent.uuid)
+        with patch("odoo.sql_db.Cursor.commit", autospec=True):
+            RunJobController()._try_perform_job(self.env, job_)
+        self.assertEqual(dependent.db_record().state, "done")
+        self.assertEqual(self.partner.name, "second")
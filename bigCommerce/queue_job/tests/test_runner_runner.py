@@ -1,6 +1,17 @@
 # Copyright 2015-2016 Camptocamp SA
 # License LGPL-3.0 or later (http://www.gnu.org/licenses/lgpl.html)
 
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import requests
+from psycopg2.extensions import Notify
+
+from odoo.tests import common
+
 # pylint: disable=odoo-addons-relative-import
 # we are testing, we want to test as we were an external consumer of the API
 from odoo.addons.queue_job.jobrunner import runner
@@ -8,3 +19,176 @@ from odoo.addons.queue_job.jobrunner import runner
 from .common import load_doctests
 
 load_tests = load_doctests(runner)
+
+
+class TestJobDispatcher(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.dispatcher = runner.JobDispatcher("http", "localhost", 8069, max_workers=2)
+        self.addCleanup(self.dispatcher.close)
+        patcher = patch.object(runner.requests, "Session", side_effect=MagicMock)
+        self.session_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wait(self):
+        self.dispatcher._executor.shutdown(wait=True)
+
+    def test_bounded_pool(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def get(url, timeout):
+            with lock:
+                running.append(url)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(url)
+            return MagicMock()
+
+        with patch.object(self.dispatcher, "_get_session") as get_session:
+            get_session.return_value.get.side_effect = get
+            for idx in range(6):
+                self.dispatcher.dispatch("db", "uuid-%s" % idx)
+            self._wait()
+        self.assertEqual(len(max_running), 6)
+        self.assertLessEqual(max(max_running), 2)
+
+    def test_thread_local_sessions(self):
+        session = self.dispatcher._get_session()
+        self.assertIs(self.dispatcher._get_session(), session)
+        other_sessions = []
+        thread = threading.Thread(
+            target=lambda: other_sessions.append(self.dispatcher._get_session())
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(other_sessions[0], session)
+        self.assertEqual(self.dispatcher._sessions, [session, other_sessions[0]])
+
+        # the dispatch threads keep their session from one request to another
+        for idx in range(6):
+            self.dispatcher.dispatch("db", "uuid-%s" % idx)
+        self._wait()
+        sessions = list(self.dispatcher._sessions)
+        self.assertLessEqual(len(sessions), 2 + 2)
+        self.assertEqual(self.session_class.call_count, len(sessions))
+
+        self.dispatcher.close()
+        self.assertEqual(self.dispatcher._sessions, [])
+        for session in sessions:
+            session.close.assert_called_once_with()
+
+    def test_stats(self):
+        responses = [
+            MagicMock(),
+            requests.Timeout(),
+            requests.HTTPError(),
+        ]
+        with patch.object(self.dispatcher, "_get_session") as get_session, patch.object(
+            self.dispatcher, "set_job_pending"
+        ) as set_job_pending:
+            get_session.return_value.get.side_effect = responses
+            for idx in range(3):
+                self.dispatcher.dispatch("db", "uuid-%s" % idx)
+            self._wait()
+        self.assertEqual(set_job_pending.call_count, 2)
+        stats = self.dispatcher.get_stats(reset=True)
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["pending"], 0)
+        self.assertEqual(
+            (stats["dispatched"], stats["timeouts"], stats["errors"]), (1, 1, 1)
+        )
+        self.assertEqual(self.dispatcher.get_stats()["count"], 0)
+
+    def test_reset_to_pending(self):
+        partner = self.env["res.partner"].create({"name": "test"})
+        job_ = partner.with_delay().write({"name": "new"})
+        job_.db_record().state = "enqueued"
+        self.env["base"].flush()
+        with patch.object(
+            self.dispatcher, "_get_db_conn", return_value=self.env.cr._cnx
+        ), patch.object(self.dispatcher, "_get_session") as get_session:
+            get_session.return_value.get.side_effect = requests.Timeout()
+            self.dispatcher.dispatch(self.env.cr.dbname, job_.uuid)
+            self._wait()
+        self.env["queue.job"].invalidate_cache()
+        self.assertEqual(job_.db_record().state, "pending")
+        stats = self.dispatcher.get_stats()
+        self.assertEqual((stats["timeouts"], stats["resets"]), (1, 1))
+
+    def test_reset_to_pending_failure_logged(self):
+        with patch.object(self.dispatcher, "_get_db_conn"), patch.object(
+            self.dispatcher, "_close_db_conn"
+        ), patch.object(
+            self.dispatcher,
+            "_set_job_pending",
+            side_effect=psycopg2.OperationalError("connection lost"),
+        ), patch.object(
+            self.dispatcher, "_get_session"
+        ) as get_session:
+            get_session.return_value.get.side_effect = requests.Timeout()
+            with self.assertLogs(runner._logger, "ERROR") as logs:
+                self.dispatcher.dispatch("db", "uuid")
+                self._wait()
+        self.assertIn("could not reset job uuid to pending", logs.output[0])
+        stats = self.dispatcher.get_stats()
+        self.assertEqual((stats["pending"], stats["timeouts"]), (0, 1))
+
+
+class TestProcessNotifications(common.TransactionCase):
+    def setUp(self):
+        super().setUp()
+        self.runner = runner.QueueJobRunner(channel_config_string="root:4")
+        self.addCleanup(self._close_runner)
+        # use the connection of the test transaction instead of a new one
+        self.db = runner.Database.__new__(runner.Database)
+        self.db.db_name = self.env.cr.dbname
+        self.db.conn = self.env.cr._cnx
+        self.runner.db_by_name[self.db.db_name] = self.db
+        self.partner = self.env["res.partner"].create({"name": "test"})
+
+    def _close_runner(self):
+        self.runner.dispatcher.close()
+        for fd in self.runner._stop_pipe:
+            os.close(fd)
+        del self.db.conn.notifies[:]
+
+    def _notify(self, *uuids):
+        self.env["base"].flush()
+        for uuid in uuids:
+            self.db.conn.notifies.append(Notify(0, "queue_job", uuid))
+
+    def test_duplicate_notifications(self):
+        job1 = self.partner.with_delay().write({"name": "first"})
+        job2 = self.partner.with_delay().write({"name": "second"})
+        self._notify(job1.uuid, job2.uuid, job1.uuid, job1.uuid)
+        channel_manager = self.runner.channel_manager
+        with patch.object(
+            self.db, "select_jobs", wraps=self.db.select_jobs
+        ) as select_jobs, patch.object(
+            channel_manager, "notify", wraps=channel_manager.notify
+        ) as notify:
+            self.runner.process_notifications()
+        self.assertFalse(self.db.conn.notifies)
+        select_jobs.assert_called_once()
+        self.assertEqual(notify.call_count, 2)
+        self.assertEqual(set(channel_manager._jobs_by_uuid), {job1.uuid, job2.uuid})
+
+    def test_deleted_job(self):
+        job1 = self.partner.with_delay().write({"name": "first"})
+        job2 = self.partner.with_delay().write({"name": "second"})
+        self._notify(job1.uuid, job2.uuid)
+        self.runner.process_notifications()
+        channel_manager = self.runner.channel_manager
+        self.assertEqual(set(channel_manager._jobs_by_uuid), {job1.uuid, job2.uuid})
+
+        job2.db_record().unlink()
+        self._notify(job1.uuid, job2.uuid)
+        with patch.object(
+            channel_manager, "remove_job", wraps=channel_manager.remove_job
+        ) as remove_job:
+            self.runner.process_notifications()
+        remove_job.assert_called_once_with(job2.uuid)
+        self.assertEqual(set(channel_manager._jobs_by_uuid), {job1.uuid})
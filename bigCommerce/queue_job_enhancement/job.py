@@ -53,6 +53,8 @@ class Job(JobBase):
             description=None,
             channel=None,
             identity_key=None,
+            depends_on=None,
+            coalesce=None,
     ):
         exe_cls = Job if cls == JobBase else cls
         new_job = exe_cls(
@@ -65,8 +67,18 @@ class Job(JobBase):
             description=description,
             channel=channel,
             identity_key=identity_key,
+            depends_on=depends_on,
+            coalesce=coalesce,
         )
-        if new_job.identity_key:
+        if new_job.coalesce:
+            existing = new_job.job_record_to_coalesce()
+            if existing:
+                new_job.coalesce_into(existing)
+                _logger.debug(
+                    "a job has been coalesced into job %s", existing.uuid
+                )
+                return exe_cls._load_from_db_record(existing)
+        elif new_job.identity_key:
             existing = new_job.job_record_with_same_identity_key()
             if existing:
                 _logger.debug(
@@ -90,6 +102,15 @@ class Job(JobBase):
     _original_enqueue = JobBase.enqueue
     JobBase.enqueue = enqueue
 
+    @classmethod
+    @functools.wraps(JobBase.build)
+    def build(cls, func, **options):
+        exe_cls = Job if cls == JobBase else cls
+        return exe_cls(func=func, **options)
+
+    _original_build = JobBase.build
+    JobBase.build = build
+
     def store(self):
         job_model = self.env['queue.job']
         edit_sentinel = job_model.EDIT_SENTINEL
@@ -112,11 +133,17 @@ class Job(JobBase):
             'records': self.recordset,
             'args': self.args,
             'kwargs': self.kwargs,
+            'depends_on': self.depends_on,
             'channel': self.channel or UNSET,
             'context': self.context,
         })
         return trim_unset_from_dict(vals)
 
+    def _prepare_coalesced_values(self, db_record):
+        vals = super()._prepare_coalesced_values(db_record)
+        vals['context'] = self.context
+        return vals
+
     def _prepare_common_stored_values(self):
         vals = {
             'state': self.state,